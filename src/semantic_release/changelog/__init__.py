@@ -2,6 +2,7 @@ from semantic_release.changelog.context import (
     ChangelogContext,
     make_changelog_context,
 )
+from semantic_release.changelog.exclusion import CommitExclusionMatcher
 from semantic_release.changelog.release_history import ReleaseHistory
 from semantic_release.changelog.template import (
     environment,
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import warnings
+from re import VERBOSE, compile as regexp, error as RegexError  # noqa: N812
+from typing import TYPE_CHECKING
+
+from semantic_release.commit_parser.util import limit_message_body
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from re import Pattern
+    from typing import Iterable, Iterator
+
+
+# Numbered group references (ie. \1 or (?(1)...)) would refer to the groups of the
+# other patterns once the patterns are combined
+_numbered_group_reference = regexp(r"\\[1-9]|\(\?\(\d")
+
+_GROUP_PREFIX = "_psr_exclude_"
+
+
+class CommitExclusionMatcher:
+    """
+    Match commit messages against the changelog exclusion patterns (the
+    ``changelog.exclude_commit_patterns`` & PSR's own release commit pattern).
+
+    The patterns are combined into a single compiled alternation (one named group per
+    pattern) so that each message is matched once, with the same result as trying each
+    pattern in order with ``pattern.match()``. Patterns which can not be combined (ie.
+    with different flags, verbose patterns or patterns with numbered group references)
+    are matched one by one.
+
+    The body of each message is limited to ``max_body_size`` characters (as by the
+    commit parsers) before it is matched. The match of each commit message is cached
+    per commit sha & piece of a squashed commit, and the number of commits that each
+    pattern excluded is counted so that patterns which never exclude a commit can be
+    found (see :meth:`exclusion_counts`).
+    """
+
+    def __init__(
+        self, patterns: Iterable[Pattern[str]] = (), max_body_size: int = 0
+    ) -> None:
+        self.patterns = tuple(patterns)
+        self.max_body_size = max_body_size
+        self._matcher = self._combine_patterns(self.patterns)
+        # (sha, piece) to the index of the first matching pattern (or None), the
+        # pieces of a squashed commit share the sha of the commit
+        self._matches: dict[tuple[str, int], int | None] = {}
+        self._excluded_commits: list[set[tuple[str, int]]] = [
+            set() for _ in self.patterns
+        ]
+
+    def __iter__(self) -> Iterator[Pattern[str]]:
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    @staticmethod
+    def _combine_patterns(patterns: tuple[Pattern[str], ...]) -> Pattern[str] | None:
+        if len(patterns) < 2 or len(flags := {p.flags for p in patterns}) != 1:
+            return None
+
+        # A comment of a verbose pattern would comment out the patterns after it
+        if flags.pop() & VERBOSE:
+            return None
+
+        if any(_numbered_group_reference.search(p.pattern) for p in patterns):
+            return None
+
+        try:
+            # Inline global flags in the middle of the combined pattern are deprecated
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                return regexp(
+                    str.join(
+                        "|",
+                        (
+                            f"(?P<{_GROUP_PREFIX}{index}>{pattern.pattern})"
+                            for index, pattern in enumerate(patterns)
+                        ),
+                    ),
+                    flags=patterns[0].flags,
+                )
+        except (RegexError, DeprecationWarning, FutureWarning) as err:
+            logger.debug("unable to combine the commit exclusion patterns: %s", err)
+            return None
+
+    def _match_index(self, commit_message: str) -> int | None:
+        if self._matcher is not None:
+            if not (match := self._matcher.match(commit_message)):
+                return None
+            # The group of the matching pattern is the outermost group, closed last
+            return int(str(match.lastgroup)[len(_GROUP_PREFIX) :])
+
+        return next(
+            (
+                index
+                for index, pattern in enumerate(self.patterns)
+                if pattern.match(commit_message)
+            ),
+            None,
+        )
+
+    def _cached_match_index(
+        self, sha: str, commit_message: str, piece: int
+    ) -> int | None:
+        key = (sha, piece)
+        try:
+            return self._matches[key]
+        except KeyError:
+            index = self._matches[key] = self._match_index(
+                limit_message_body(commit_message, self.max_body_size)
+            )
+            return index
+
+    def match(
+        self, sha: str, commit_message: str, piece: int = 0
+    ) -> Pattern[str] | None:
+        """
+        Return the first of the patterns which matches the message of the commit with
+        the given sha (or None). The ``piece`` is the index of the message within a
+        squashed commit.
+        """
+        index = self._cached_match_index(sha, commit_message, piece)
+        return self.patterns[index] if index is not None else None
+
+    def record_exclusion(self, sha: str, commit_message: str, piece: int = 0) -> None:
+        """Count the commit as excluded by the first pattern which matches its message."""
+        if (index := self._cached_match_index(sha, commit_message, piece)) is not None:
+            self._excluded_commits[index].add((sha, piece))
+
+    def exclusion_counts(self) -> list[tuple[Pattern[str], int]]:
+        """Return the number of commits that each pattern excluded, in order."""
+        return [
+            (pattern, len(excluded_commits))
+            for pattern, excluded_commits in zip(self.patterns, self._excluded_commits)
+        ]
@@ -4,22 +4,21 @@ from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, TypedDict
 
-from git.objects.tag import TagObject
+from git.util import Actor
 
+from semantic_release.changelog.exclusion import CommitExclusionMatcher
 from semantic_release.commit_parser import ParseError
 from semantic_release.commit_parser.token import ParsedCommit
 from semantic_release.commit_parser.util import force_str
 from semantic_release.enums import LevelBump
 from semantic_release.globals import logger
-from semantic_release.helpers import validate_types_in_sequence
-from semantic_release.version.algorithm import tags_and_versions
+from semantic_release.history import CommitHistory
 
 if TYPE_CHECKING:  # pragma: no cover
     from re import Pattern
     from typing import Iterable, Iterator
 
     from git.repo.base import Repo
-    from git.util import Actor
 
     from semantic_release.commit_parser import (
         CommitParser,
@@ -38,16 +37,49 @@ class ReleaseHistory:
         translator: VersionTranslator,
         commit_parser: CommitParser[ParseResult, ParserOptions],
         exclude_commit_patterns: Iterable[Pattern[str]] = (),
+        commit_history: CommitHistory | None = None,
+        latest_releases: int | None = None,
     ) -> ReleaseHistory:
-        all_git_tags_and_versions = tags_and_versions(repo.tags, translator)
+        """
+        Build the release history from the commits reachable from the head of the
+        commit history.
+
+        When ``latest_releases`` is given, the history is bounded to the unreleased
+        commits & the given number of latest releases: the walk stops at the commits of
+        the older release tags. Only the nearest of these older releases is kept, and it
+        only holds the changes of its tagged commit, so that the previous version (and
+        its compare link) remains known. All earlier releases are left out.
+
+        The ``exclude_commit_patterns`` may be given as a shared
+        :py:class:`CommitExclusionMatcher` to keep its cached matches & exclusion
+        counts across several release histories (ie. of the packages of a monorepo).
+        """
+        commit_history = commit_history or CommitHistory(
+            repo=repo, commit_parser=commit_parser
+        )
+        # A matcher can be shared to match each commit message only once
+        exclusion_matcher = (
+            exclude_commit_patterns
+            if isinstance(exclude_commit_patterns, CommitExclusionMatcher)
+            else CommitExclusionMatcher(
+                exclude_commit_patterns,
+                max_body_size=getattr(
+                    getattr(commit_parser, "options", None), "max_body_size", 0
+                ),
+            )
+        )
+        tag_index = commit_history.tag_index
+        all_git_tags_and_versions = tag_index.versions(translator)
         unreleased: dict[str, list[ParseResult]] = defaultdict(list)
         released: dict[Version, Release] = {}
 
         # Performance optimization: create a mapping of tag sha to version
         # so we can quickly look up the version for a given commit based on sha
         tag_sha_2_version_lookup = {
-            tag.commit.hexsha: (tag, version)
+            tag_info.commit_sha: (tag_info, version)
             for tag, version in all_git_tags_and_versions
+            if (tag_info := tag_index.get(tag.name)) is not None
+            and tag_info.commit_sha is not None
         }
 
         ignore_merge_commits = bool(
@@ -68,7 +100,31 @@ class ReleaseHistory:
 
         the_version: Version | None = None
 
-        for commit in repo.iter_commits("HEAD", topo_order=True):
+        if latest_releases is None:
+            all_commits = commit_history.topo_ordered_commits()
+        else:
+            merged_tag_names = commit_history.merged_tag_names()
+            # Versions are sorted from the latest to the oldest release
+            released_shas = [
+                tag_info.commit_sha
+                for tag, _ in all_git_tags_and_versions
+                if tag.name in merged_tag_names
+                and (tag_info := tag_index.get(tag.name)) is not None
+                and tag_info.commit_sha is not None
+            ]
+            boundaries = set(released_shas[latest_releases:]).difference(
+                released_shas[:latest_releases]
+            )
+            logger.debug(
+                "bounding the release history to the latest %s releases",
+                latest_releases,
+            )
+            all_commits = commit_history.topo_ordered_commits_until(boundaries)
+
+        # Parse all commits upfront (in parallel when enabled), results are memoized
+        commit_history.parse_all(all_commits)
+
+        for commit in all_commits:
             # Determine if we have found another release
             logger.debug("checking if commit %s matches any tags", commit.hexsha[:7])
             t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
@@ -77,26 +133,19 @@ class ReleaseHistory:
                 logger.debug("no tags correspond to commit %s", commit.hexsha)
             else:
                 # Unpack the tuple (overriding the current version)
-                tag, the_version = t_v
+                tag_info, the_version = t_v
                 # we have found the latest commit introduced by this tag
                 # so we create a new Release entry
-                logger.debug("found commit %s for tag %s", commit.hexsha, tag.name)
-
-                # tag.object is a Commit if the tag is lightweight, otherwise
-                # it is a TagObject with additional metadata about the tag
-                if isinstance(tag.object, TagObject):
-                    tagger = tag.object.tagger
-                    committer = tag.object.tagger.committer()
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
-                    tagged_date = datetime.fromtimestamp(tag.object.tagged_date, tz=_tz)
-                else:
-                    # For some reason, sometimes tag.object is a Commit
-                    tagger = tag.object.author
-                    committer = tag.object.author
-                    _tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
-                    tagged_date = datetime.fromtimestamp(
-                        tag.object.committed_date, tz=_tz
-                    )
+                logger.debug("found commit %s for tag %s", commit.hexsha, tag_info.name)
+
+                # Annotated tags carry additional metadata about the tag, otherwise
+                # the tagger & date are the author & commit date of the tagged commit
+                tagger = tag_info.tagger or commit.author
+                committer = Actor.committer() if tag_info.annotated else tagger
+                tagged_date = tag_info.tagged_date or datetime.fromtimestamp(
+                    commit.committed_date,
+                    tz=timezone(timedelta(seconds=-1 * commit.author_tz_offset)),
+                )
 
                 release = Release(
                     tagger=tagger,
@@ -113,38 +162,14 @@ class ReleaseHistory:
                 commit.hexsha[:8],
                 str(commit.message).replace("\n", " ")[:54],
             )
-            # returns a ParseResult or list of ParseResult objects,
-            # it is usually one, but we split a commit if a squashed merge is detected
-            parse_results = commit_parser.parse(commit)
-
-            if not any(
-                (
-                    isinstance(parse_results, (ParseError, ParsedCommit)),
-                    (
-                        (
-                            isinstance(parse_results, list)
-                            or type(parse_results) == tuple
-                        )
-                        and validate_types_in_sequence(
-                            parse_results, (ParseError, ParsedCommit)
-                        )
-                    ),
-                )
-            ):
-                raise TypeError("Unexpected type returned from commit_parser.parse")
-
-            results: list[ParseResult] = [
-                *(
-                    [parse_results]
-                    if isinstance(parse_results, (ParseError, ParsedCommit))
-                    else parse_results
-                ),
-            ]
+            # returns a list of ParseResult objects, it is usually one,
+            # but we split a commit if a squashed merge is detected
+            results = commit_history.parse(commit)
 
             is_squash_commit = bool(len(results) > 1)
 
             # iterate through parsed commits to add to changelog definition
-            for parsed_result in results:
+            for piece, parsed_result in enumerate(results):
                 commit_message = force_str(parsed_result.commit.message)
                 commit_type = (
                     "unknown"
@@ -153,8 +178,11 @@ class ReleaseHistory:
                 )
                 logger.debug("commit has type '%s'", commit_type)
 
-                has_exclusion_match = any(
-                    pattern.match(commit_message) for pattern in exclude_commit_patterns
+                has_exclusion_match = (
+                    exclusion_matcher.match(
+                        parsed_result.commit.hexsha, commit_message, piece
+                    )
+                    is not None
                 )
 
                 commit_level_bump = (
@@ -172,6 +200,9 @@ class ReleaseHistory:
                 # are included, then the changelog will be empty. Even if ther was other
                 # commits included, the true reason for a version bump would be missing.
                 if has_exclusion_match and commit_level_bump == LevelBump.NO_RELEASE:
+                    exclusion_matcher.record_exclusion(
+                        parsed_result.commit.hexsha, commit_message, piece
+                    )
                     logger.info(
                         "Excluding %s commit[%s] %s",
                         "piece of squashed" if is_squash_commit else "",
@@ -214,6 +245,13 @@ class ReleaseHistory:
 
                 released[the_version]["elements"][commit_type].append(parsed_result)
 
+        for pattern, num_excluded in exclusion_matcher.exclusion_counts():
+            logger.info(
+                "exclude commit pattern %r excluded %s commits",
+                pattern.pattern,
+                num_excluded,
+            )
+
         return cls(unreleased=unreleased, released=released)
 
     def __init__(
@@ -10,6 +10,7 @@ from importlib_resources import files
 
 import semantic_release
 from semantic_release.changelog.context import (
+    ChangelogMode,
     ReleaseNotesContext,
     autofit_text_width,
     create_pypi_url,
@@ -162,6 +163,39 @@ def write_default_changelog(
     return str(changelog_file)
 
 
+def get_release_history_limit(
+    runtime_ctx: RuntimeContext, latest_releases: int
+) -> int | None:
+    """
+    Return the number of latest releases (``latest_releases``) the release history
+    needs to hold when only the latest release is rendered, or ``None`` when the whole
+    release history is required.
+
+    This is only the case when an existing changelog is updated (in place of the
+    insertion flag) by the default templates, as user templates (including a release
+    notes template) may render any release of the history.
+    """
+    if runtime_ctx.changelog_mode != ChangelogMode.UPDATE:
+        return None
+
+    template_dir = runtime_ctx.template_dir
+    if template_dir.is_dir() and any(
+        f.is_file() and f.suffix == JINJA2_EXTENSION for f in template_dir.rglob("*")
+    ):
+        return None
+
+    # Without an insertion flag, the default template initializes the whole changelog
+    try:
+        prev_changelog = runtime_ctx.changelog_file.read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+    if runtime_ctx.changelog_insertion_flag not in prev_changelog:
+        return None
+
+    return latest_releases
+
+
 def write_changelog_files(
     runtime_ctx: RuntimeContext,
     release_history: ReleaseHistory,
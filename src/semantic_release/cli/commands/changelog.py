@@ -11,10 +11,12 @@ from git import GitCommandError, Repo
 from semantic_release.changelog.release_history import ReleaseHistory
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
+    get_release_history_limit,
     write_changelog_files,
 )
 from semantic_release.cli.util import noop_report
 from semantic_release.globals import logger
+from semantic_release.history import CommitHistory
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -107,11 +109,35 @@ def changelog(cli_ctx: CliContextObj, release_tag: str | None) -> None:
     hvcs_client = runtime.hvcs_client
 
     with Repo(str(runtime.repo_dir)) as git_repo:
+        commit_history = CommitHistory(
+            repo=git_repo,
+            commit_parser=runtime.commit_parser,
+            parse_cache=(
+                ctx.with_resource(runtime.commit_parse_cache)
+                if runtime.commit_parse_cache
+                else None
+            ),
+            parse_jobs=runtime.commit_parser_jobs,
+        )
+
+        if runtime.commit_parser_instrumentation:
+            # The parser statistics are reported when the command exits
+            ctx.with_resource(runtime.commit_parser_instrumentation).instrument(
+                commit_history
+            )
+
         release_history = ReleaseHistory.from_git_history(
             repo=git_repo,
             translator=translator,
             commit_parser=runtime.commit_parser,
             exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+            commit_history=commit_history,
+            # Release notes may be posted for any release of the history
+            latest_releases=(
+                get_release_history_limit(runtime, latest_releases=1)
+                if not release_tag
+                else None
+            ),
         )
 
     write_changelog_files(
@@ -7,8 +7,8 @@ from git import Repo
 
 from semantic_release.cli.util import noop_report
 from semantic_release.globals import logger
+from semantic_release.history import TagIndex
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.version.algorithm import tags_and_versions
 
 if TYPE_CHECKING:  # pragma: no cover
     from semantic_release.cli.cli_context import CliContextObj
@@ -60,11 +60,12 @@ def publish(cli_ctx: CliContextObj, tag: str) -> None:
     dist_glob_patterns = runtime.dist_glob_patterns
 
     with Repo(str(runtime.repo_dir)) as git_repo:
-        repo_tags = git_repo.tags
+        tag_index = TagIndex(git_repo)
+        ts_and_vs = tag_index.versions(translator)
 
     if tag == "latest":
         try:
-            tag = str(tags_and_versions(repo_tags, translator)[0][0])
+            tag = str(ts_and_vs[0][0])
         except IndexError:
             click.echo(
                 str.join(
@@ -79,7 +80,7 @@ def publish(cli_ctx: CliContextObj, tag: str) -> None:
             )
             ctx.exit(1)
 
-    if tag not in {tag.name for tag in repo_tags}:
+    if tag not in tag_index:
         click.echo(f"Tag '{tag}' not found in local repository!", err=True)
         ctx.exit(1)
 
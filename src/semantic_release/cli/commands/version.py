@@ -16,6 +16,7 @@ from requests import HTTPError
 from semantic_release.changelog.release_history import ReleaseHistory
 from semantic_release.cli.changelog_writer import (
     generate_release_notes,
+    get_release_history_limit,
     write_changelog_files,
 )
 from semantic_release.cli.github_actions_output import (
@@ -33,12 +34,11 @@ from semantic_release.errors import (
 )
 from semantic_release.gitproject import GitProject
 from semantic_release.globals import logger
+from semantic_release.history import CommitHistory, TagIndex
 from semantic_release.hvcs.github import Github
 from semantic_release.hvcs.remote_hvcs_base import RemoteHvcsBase
-from semantic_release.version.algorithm import (
-    next_version,
-    tags_and_versions,
-)
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.declarations.stamp import stamp_version_in_files
 from semantic_release.version.translator import VersionTranslator
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -75,20 +75,30 @@ def is_forced_prerelease(
     )
 
 
-def last_released(repo_dir: Path, tag_format: str) -> tuple[Tag, Version] | None:
-    with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(
-            git_repo.tags, VersionTranslator(tag_format=tag_format)
-        )
+def last_released(
+    repo_dir: Path, tag_format: str, tag_index: TagIndex | None = None
+) -> tuple[Tag, Version] | None:
+    translator = VersionTranslator(tag_format=tag_format)
+    if tag_index is not None:
+        ts_and_vs = tag_index.versions(translator)
+    else:
+        with Repo(str(repo_dir)) as git_repo:
+            ts_and_vs = TagIndex(git_repo).versions(translator)
 
     return ts_and_vs[0] if ts_and_vs else None
 
 
 def version_from_forced_level(
-    repo_dir: Path, forced_level_bump: LevelBump, translator: VersionTranslator
+    repo_dir: Path,
+    forced_level_bump: LevelBump,
+    translator: VersionTranslator,
+    tag_index: TagIndex | None = None,
 ) -> Version:
-    with Repo(str(repo_dir)) as git_repo:
-        ts_and_vs = tags_and_versions(git_repo.tags, translator)
+    if tag_index is not None:
+        ts_and_vs = tag_index.versions(translator)
+    else:
+        with Repo(str(repo_dir)) as git_repo:
+            ts_and_vs = TagIndex(git_repo).versions(translator)
 
     # If we have no tags, return the default version
     if not ts_and_vs:
@@ -139,6 +149,7 @@ def apply_version_to_source_files(
     version_declarations: Sequence[IVersionReplacer],
     version: Version,
     noop: bool = False,
+    jobs: int = 1,
 ) -> list[str]:
     if len(version_declarations) < 1:
         return []
@@ -146,10 +157,14 @@ def apply_version_to_source_files(
     if not noop:
         logger.debug("Updating version %s in repository files...", version)
 
-    paths = [
-        decl.update_file_w_version(new_version=version, noop=noop)
-        for decl in version_declarations
-    ]
+    paths = (
+        [
+            decl.update_file_w_version(new_version=version, noop=noop)
+            for decl in version_declarations
+        ]
+        if noop
+        else stamp_version_in_files(version_declarations, version, jobs=jobs)
+    )
 
     repo_filepaths = [
         str(updated_file.relative_to(repo_dir))
@@ -508,16 +523,35 @@ def version(  # noqa: C901
         )
         make_vcs_release &= push_changes
 
+    # The commit history is loaded & parsed once and then shared between the
+    # version calculation and the changelog generation
+    commit_history = CommitHistory(
+        repo=ctx.with_resource(Repo(str(runtime.repo_dir))),
+        commit_parser=parser,
+        parse_cache=(
+            ctx.with_resource(runtime.commit_parse_cache)
+            if runtime.commit_parse_cache
+            else None
+        ),
+        parse_jobs=runtime.commit_parser_jobs,
+    )
+
+    if runtime.commit_parser_instrumentation:
+        # The parser statistics are reported when the command exits
+        ctx.with_resource(runtime.commit_parser_instrumentation).instrument(
+            commit_history
+        )
+
     if not forced_level_bump:
-        with Repo(str(runtime.repo_dir)) as git_repo:
-            new_version = next_version(
-                repo=git_repo,
-                translator=translator,
-                commit_parser=parser,
-                prerelease=prerelease,
-                major_on_zero=major_on_zero,
-                allow_zero_version=runtime.allow_zero_version,
-            )
+        new_version = next_version(
+            repo=commit_history.repo,
+            translator=translator,
+            commit_parser=parser,
+            prerelease=prerelease,
+            major_on_zero=major_on_zero,
+            allow_zero_version=runtime.allow_zero_version,
+            commit_history=commit_history,
+        )
     else:
         logger.warning(
             "Forcing a '%s' release due to '--%s' command-line flag",
@@ -533,6 +567,7 @@ def version(  # noqa: C901
             repo_dir=runtime.repo_dir,
             forced_level_bump=forced_level_bump,
             translator=translator,
+            tag_index=commit_history.tag_index,
         )
 
         # We only turn the forced version into a prerelease if the user has specified
@@ -558,11 +593,10 @@ def version(  # noqa: C901
     # Print the new version so that command-line output capture will work
     click.echo(version_to_print)
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        # TODO: performance improvement - cache the result of tags_and_versions (previously done in next_version())
-        previously_released_versions = {
-            v for _, v in tags_and_versions(git_repo.tags, translator)
-        }
+    # The tag index is shared with the version calculation, the tags are only read once
+    previously_released_versions = {
+        v for _, v in commit_history.tag_index.versions(translator)
+    }
 
     # If the new version has already been released, we fail and abort if strict;
     # otherwise we exit with 0.
@@ -586,18 +620,24 @@ def version(  # noqa: C901
         return
 
     # TODO: need a better way as this is inconsistent if releasing older version patches
-    if last_release := last_released(config.repo_dir, tag_format=config.tag_format):
+    if last_release := last_released(
+        config.repo_dir,
+        tag_format=config.tag_format,
+        tag_index=commit_history.tag_index,
+    ):
         # If we have a last release, we can set the previous version for the
         # GitHub Actions output
         gha_output.prev_version = last_release[1]
 
-    with Repo(str(runtime.repo_dir)) as git_repo:
-        release_history = ReleaseHistory.from_git_history(
-            repo=git_repo,
-            translator=translator,
-            commit_parser=parser,
-            exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
-        )
+    release_history = ReleaseHistory.from_git_history(
+        repo=commit_history.repo,
+        translator=translator,
+        commit_parser=parser,
+        exclude_commit_patterns=runtime.changelog_excluded_commit_patterns,
+        commit_history=commit_history,
+        # Only the changes since the last release make up the new release
+        latest_releases=get_release_history_limit(runtime, latest_releases=0),
+    )
 
     rprint(f"[bold green]The next version is: [white]{new_version!s}[/white]! :rocket:")
 
@@ -634,6 +674,7 @@ def version(  # noqa: C901
         version_declarations=runtime.version_declarations,
         version=new_version,
         noop=opts.noop,
+        jobs=runtime.version_stamp_jobs,
     )
     all_paths_to_add.extend(files_with_new_version_written)
     all_paths_to_add.extend(assets or [])
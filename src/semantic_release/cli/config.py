@@ -57,6 +57,15 @@ from semantic_release.errors import (
 )
 from semantic_release.globals import logger
 from semantic_release.helpers import dynamic_import
+from semantic_release.history.instrumentation import (
+    DEFAULT_SLOWEST_COMMITS,
+    ParserInstrumentation,
+)
+from semantic_release.history.parse_cache import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    ParseResultCache,
+)
 from semantic_release.version.declarations.i_version_replacer import IVersionReplacer
 from semantic_release.version.declarations.pattern import PatternVersionDeclaration
 from semantic_release.version.declarations.toml import TomlVersionDeclaration
@@ -346,6 +355,19 @@ class PublishConfig(BaseModel):
     upload_to_vcs_release: bool = True
 
 
+class CommitParserCacheConfig(BaseModel):
+    enabled: bool = False
+    directory: str = DEFAULT_CACHE_DIR
+    max_entries: Annotated[int, Field(gt=0)] = DEFAULT_CACHE_MAX_ENTRIES
+
+
+class CommitParserStatsConfig(BaseModel):
+    enabled: bool = False
+    # Empty writes the statistics to stderr
+    output: str = ""
+    slowest_commits: Annotated[int, Field(ge=0)] = DEFAULT_SLOWEST_COMMITS
+
+
 class RawConfig(BaseModel):
     assets: List[str] = []
     branches: Dict[str, BranchConfig] = {"main": BranchConfig()}
@@ -359,6 +381,10 @@ class RawConfig(BaseModel):
     commit_parser: NonEmptyString = "conventional"
     # It's up to the parser_options() method to validate these
     commit_parser_options: Dict[str, Any] = {}
+    commit_parser_cache: CommitParserCacheConfig = CommitParserCacheConfig()
+    # Number of worker processes to parse commits with, 0 uses all available CPUs
+    commit_parser_jobs: Annotated[int, Field(ge=0)] = 1
+    commit_parser_stats: CommitParserStatsConfig = CommitParserStatsConfig()
     logging_use_named_masks: bool = False
     major_on_zero: bool = True
     allow_zero_version: bool = False
@@ -369,6 +395,8 @@ class RawConfig(BaseModel):
     publish: PublishConfig = PublishConfig()
     version_toml: Optional[Tuple[str, ...]] = None
     version_variables: Optional[Tuple[str, ...]] = None
+    # Number of threads to stamp the version into files with, 0 uses all available CPUs
+    version_stamp_jobs: Annotated[int, Field(ge=0)] = 1
 
     @field_validator("repo_dir", mode="before")
     @classmethod
@@ -545,6 +573,9 @@ class RuntimeContext:
     project_metadata: dict[str, Any]
     repo_dir: Path
     commit_parser: CommitParser[ParseResult, ParserOptions]
+    commit_parse_cache: Optional[ParseResultCache]
+    commit_parser_jobs: int
+    commit_parser_instrumentation: Optional[ParserInstrumentation]
     version_translator: VersionTranslator
     major_on_zero: bool
     allow_zero_version: bool
@@ -555,6 +586,7 @@ class RuntimeContext:
     commit_message: str
     changelog_excluded_commit_patterns: Tuple[Pattern[str], ...]
     version_declarations: Tuple[IVersionReplacer, ...]
+    version_stamp_jobs: int
     hvcs_client: hvcs.HvcsBase
     changelog_insertion_flag: str
     changelog_mask_initial_release: bool
@@ -708,6 +740,36 @@ class RuntimeContext:
                 str.join("\n", [str(err), f"Failed to initialize {raw.commit_parser}"])
             ) from err
 
+        # Persistent parse result cache (opt-in)
+        commit_parse_cache = (
+            ParseResultCache(
+                # Must use absolute after resolve because windows does not resolve if the path does not exist
+                directory=Path(raw.commit_parser_cache.directory)
+                .expanduser()
+                .resolve()
+                .absolute(),
+                commit_parser=commit_parser,
+                repo_dir=raw.repo_dir,
+                max_entries=raw.commit_parser_cache.max_entries,
+            )
+            if raw.commit_parser_cache.enabled
+            else None
+        )
+
+        # Parser hot-path instrumentation (opt-in)
+        commit_parser_instrumentation = (
+            ParserInstrumentation(
+                slowest_commits=raw.commit_parser_stats.slowest_commits,
+                output=(
+                    Path(raw.commit_parser_stats.output).expanduser().absolute()
+                    if raw.commit_parser_stats.output
+                    else None
+                ),
+            )
+            if raw.commit_parser_stats.enabled
+            else None
+        )
+
         # We always exclude PSR's own release commits from the Changelog
         # when parsing commits
         psr_release_commit_regex = regexp(
@@ -871,12 +933,16 @@ class RuntimeContext:
             project_metadata=project_metadata,
             repo_dir=raw.repo_dir,
             commit_parser=commit_parser,
+            commit_parse_cache=commit_parse_cache,
+            commit_parser_jobs=raw.commit_parser_jobs or os.cpu_count() or 1,
+            commit_parser_instrumentation=commit_parser_instrumentation,
             version_translator=version_translator,
             major_on_zero=raw.major_on_zero,
             allow_zero_version=raw.allow_zero_version,
             build_command=raw.build_command,
             build_command_env=build_cmd_env,
             version_declarations=tuple(version_declarations),
+            version_stamp_jobs=raw.version_stamp_jobs or os.cpu_count() or 1,
             hvcs_client=hvcs_client,
             changelog_file=changelog_file,
             changelog_mode=raw.changelog.mode,
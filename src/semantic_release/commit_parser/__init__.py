@@ -16,6 +16,7 @@ from semantic_release.commit_parser.emoji import (
     EmojiCommitParser,
     EmojiParserOptions,
 )
+from semantic_release.commit_parser.record import CommitRecord
 from semantic_release.commit_parser.scipy import (
     ScipyCommitParser,
     ScipyParserOptions,
@@ -33,6 +34,7 @@ from semantic_release.commit_parser.token import (
 
 __all__ = [
     "CommitParser",
+    "CommitRecord",
     "ParserOptions",
     "AngularCommitParser",
     "AngularParserOptions",
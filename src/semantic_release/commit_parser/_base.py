@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
 
-from semantic_release.commit_parser.token import ParseResultType
+from semantic_release.commit_parser.token import (
+    ParsedCommit,
+    ParseError,
+    ParseResultType,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable, Iterator
+
     from git.objects.commit import Commit
 
+    from semantic_release.history.changed_files import ChangedFilesIndex
+
 
 class ParserOptions(dict):
     """
@@ -69,6 +77,21 @@ class CommitParser(ABC, Generic[_TT, _OPTS]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options: type[ParserOptions] = ParserOptions
 
+    # Opt-in flag for the persistent parse result cache. Only set this to True if the
+    # results of ``parse()`` solely depend on the commit (which is immutable per sha)
+    # and the parser options. Results which are not exact ``ParsedCommit`` or
+    # ``ParseError`` instances are never cached.
+    supports_result_cache: ClassVar[bool] = False
+
+    # Set this to True if ``parse()`` looks up the changed files of the commits through
+    # ``get_changed_files()``. The changed files are then indexed once by the parent
+    # process and sent along with the commits to the parallel parsing worker processes.
+    uses_changed_files: ClassVar[bool] = False
+
+    # Provides the changed files of the commits in the history being parsed. It is
+    # assigned by the commit history before parsing, see ``get_changed_files()``.
+    changed_files_provider: ChangedFilesIndex | None = None
+
     def __init__(self, options: _OPTS | None = None) -> None:
         self.options: _OPTS = (
             options if options is not None else self.get_default_options()
@@ -80,5 +103,39 @@ class CommitParser(ABC, Generic[_TT, _OPTS]):
     def get_default_options(self) -> _OPTS:
         return self.parser_options()  # type: ignore[return-value]
 
+    def get_changed_files(self, commit: Commit) -> Iterable[str]:
+        """
+        Return the paths (relative to the repository root) of the files changed by the
+        given commit compared to its first parent.
+
+        The paths are looked up in the ``changed_files_provider`` when available, which
+        indexes the whole history in a single pass, otherwise the commit stats are read
+        from git for the single commit.
+        """
+        if self.changed_files_provider is not None:
+            return self.changed_files_provider.get_changed_files(commit)
+
+        return [str(path) for path in commit.stats.files]
+
     @abstractmethod
     def parse(self, commit: Commit) -> _TT | list[_TT]: ...
+
+    def parse_many(self, commits: Iterable[Commit]) -> Iterator[_TT]:
+        """
+        Parse a batch of commits and yield a flat stream of the results in the same
+        order as the commits (the results of a commit which is split into multiple
+        results, ie. a squashed commit, are yielded in order).
+
+        This implementation calls ``parse()`` for each commit, none of the built-in
+        parsers override it. Custom parsers can override this method to share setup,
+        caches & regular expression work across the commits of the batch.
+        """
+        for commit in commits:
+            results = self.parse(commit)
+            # NOTE: the results themselves are (named) tuples
+            if isinstance(results, (ParseError, ParsedCommit)) or not isinstance(
+                results, (list, tuple)
+            ):
+                yield results  # type: ignore[misc]
+            else:
+                yield from results
@@ -51,6 +51,13 @@ class ConventionalCommitParserOptions(ParserOptions):
     ignore_merge_commits: bool = True
     """Toggle flag for whether or not to ignore merge commits"""
 
+    max_body_size: int = 0
+    """
+    The maximum number of characters of a commit message body to analyze. Longer bodies
+    (ie. lockfile diffs pasted into bot commits) are truncated before they are parsed,
+    which bounds the time to parse each commit. A value of 0 disables the limit.
+    """
+
     @property
     def tag_to_level(self) -> dict[str, LevelBump]:
         """A mapping of commit tags to the level bump they should result in."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from functools import reduce
+from itertools import chain
 from logging import getLogger
 from re import (
     DOTALL,
@@ -14,8 +15,6 @@ from re import (
 from textwrap import dedent
 from typing import TYPE_CHECKING, ClassVar
 
-from git.objects.commit import Commit
-
 from semantic_release.commit_parser._base import CommitParser
 from semantic_release.commit_parser.conventional.options import (
     ConventionalCommitParserOptions,
@@ -27,17 +26,20 @@ from semantic_release.commit_parser.token import (
     ParseResult,
 )
 from semantic_release.commit_parser.util import (
-    breaking_re,
-    deep_copy_commit,
+    CommitBodyTokenizer,
+    combine_text_filters,
+    commit_message_view,
     force_str,
-    parse_paragraphs,
+    limit_message_body,
+    match_commit_header,
+    split_commit_message,
 )
 from semantic_release.enums import LevelBump
 from semantic_release.errors import InvalidParserOptions
-from semantic_release.helpers import sort_numerically, text_reducer
+from semantic_release.helpers import text_reducer
 
-if TYPE_CHECKING:
-    pass
+if TYPE_CHECKING:  # pragma: no cover
+    from git.objects.commit import Commit
 
 
 # TODO: Remove from here, allow for user customization instead via options
@@ -68,6 +70,9 @@ class ConventionalCommitParser(
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = ConventionalCommitParserOptions
 
+    # Results only depend on the commit & the parser options
+    supports_result_cache = True
+
     # GitHub & Gitea use (#123), GitLab uses (!123), and BitBucket uses (pull request #123)
     mr_selector = regexp(r"[\t ]+\((?:pull request )?(?P<mr_number>[#!]\d+)\)[\t ]*$")
 
@@ -171,6 +176,11 @@ class ConventionalCommitParser(
             ),
         }
 
+        self.body_tokenizer = CommitBodyTokenizer(
+            notice_selector=self.notice_selector,
+            issue_selector=self.issue_selector,
+        )
+
     def get_default_options(self) -> ConventionalCommitParserOptions:
         return ConventionalCommitParserOptions()
 
@@ -181,57 +191,27 @@ class ConventionalCommitParser(
     def commit_body_components_separator(
         self, accumulator: dict[str, list[str]], text: str
     ) -> dict[str, list[str]]:
-        if (match := breaking_re.match(text)) and (brk_desc := match.group(1)):
-            accumulator["breaking_descriptions"].append(brk_desc)
-            return accumulator
-
-        if (match := self.notice_selector.match(text)) and (
-            notice := match.group("notice")
-        ):
-            accumulator["notices"].append(notice)
-            return accumulator
-
-        if match := self.issue_selector.search(text):
-            # if match := self.issue_selector.search(text):
-            predicate = regexp(r",? and | *[,;/& ] *").sub(
-                ",", match.group("issue_predicate") or ""
-            )
-            # Almost all issue trackers use a number to reference an issue so
-            # we use a simple regexp to validate the existence of a number which helps filter out
-            # any non-issue references that don't fit our expected format
-            has_number = regexp(r"\d+")
-            new_issue_refs: set[str] = set(
-                filter(
-                    lambda issue_str, validator=has_number: validator.search(issue_str),  # type: ignore[arg-type]
-                    predicate.split(","),
-                )
-            )
-            if new_issue_refs:
-                accumulator["linked_issues"] = sort_numerically(
-                    set(accumulator["linked_issues"]).union(new_issue_refs)
-                )
-                return accumulator
-
-        # Prevent appending duplicate descriptions
-        if text not in accumulator["descriptions"]:
-            accumulator["descriptions"].append(text)
-
-        return accumulator
+        # TODO: remove in v11, maintained for compatibility (see body_tokenizer)
+        return self.body_tokenizer.add_paragraph(accumulator, text)
 
     def parse_message(self, message: str) -> ParsedMessageResult | None:
+        subject, body = split_commit_message(message, self.options.max_body_size)
         return (
-            self.create_parsed_message_result(match)
-            if (match := self.commit_msg_pattern.match(message))
+            self.create_parsed_message_result(*header)
+            if (header := match_commit_header(self.commit_msg_pattern, subject, body))
             else None
         )
 
     def create_parsed_message_result(
-        self, match: RegexMatch[str]
+        self, match: RegexMatch[str], text: str
     ) -> ParsedMessageResult:
+        """
+        Create the result of a commit message from the match of its header & the text
+        of its body, see :func:`match_commit_header`.
+        """
         parsed_break = match.group("break")
         parsed_scope = match.group("scope") or ""
         parsed_subject = match.group("subject")
-        parsed_text = match.group("text")
         parsed_type = match.group("type")
 
         linked_merge_request = ""
@@ -239,20 +219,7 @@ class ConventionalCommitParser(
             linked_merge_request = mr_match.group("mr_number")
             parsed_subject = self.mr_selector.sub("", parsed_subject).strip()
 
-        body_components: dict[str, list[str]] = reduce(
-            self.commit_body_components_separator,
-            [
-                # Insert the subject before the other paragraphs
-                parsed_subject,
-                *parse_paragraphs(parsed_text or ""),
-            ],
-            {
-                "breaking_descriptions": [],
-                "descriptions": [],
-                "notices": [],
-                "linked_issues": [],
-            },
-        )
+        body_components = self.body_tokenizer.tokenize(parsed_subject, text)
 
         level_bump = (
             LevelBump.MAJOR
@@ -287,10 +254,8 @@ class ConventionalCommitParser(
 
         return ParsedCommit.from_parsed_message_result(commit, parsed_msg_result)
 
-    # Maybe this can be cached as an optimization, similar to how
-    # mypy/pytest use their own caching directories, for very large commit
-    # histories?
-    # The problem is the cache likely won't be present in CI environments
+    # NOTE: results are persisted between runs by the opt-in parse result cache
+    # (see semantic_release.history.parse_cache) for very large commit histories
     def parse(self, commit: Commit) -> ParseResult | list[ParseResult]:
         """
         Parse a commit message
@@ -386,17 +351,13 @@ class ConventionalCommitParser(
 
         # Return a list of artificial commits (each with a single commit message)
         return [
-            # create a artificial commit object (copy of original but with modified message)
-            Commit(
-                **{
-                    **deep_copy_commit(commit),
-                    "message": commit_msg,
-                }
-            )
+            # create a artificial commit object (a view of the original with another message)
+            commit_message_view(commit, commit_msg)
             for commit_msg in self.unsquash_commit_message(force_str(commit.message))
         ] or [commit]
 
     def unsquash_commit_message(self, message: str) -> list[str]:
+        message = limit_message_body(message, self.options.max_body_size)
         normalized_message = message.replace("\r", "").strip()
 
         # split by obvious separate commits (applies to manual git squash merges)
@@ -404,10 +365,10 @@ class ConventionalCommitParser(
             normalized_message
         )
 
-        separate_commit_msgs: list[str] = reduce(
-            lambda all_msgs, msgs: all_msgs + msgs,
-            map(self._find_squashed_commits_in_str, obvious_squashed_commits),
-            [],
+        separate_commit_msgs: list[str] = list(
+            chain.from_iterable(
+                map(self._find_squashed_commits_in_str, obvious_squashed_commits)
+            )
         )
 
         return list(filter(None, separate_commit_msgs))
@@ -416,9 +377,12 @@ class ConventionalCommitParser(
         separate_commit_msgs: list[str] = []
         current_msg = ""
 
+        # The git header filters are combined to normalize each paragraph in one scan
+        filters = combine_text_filters(tuple(self.filters.values()))
+
         for paragraph in filter(None, message.strip().split("\n\n")):
             # Apply filters to normalize the paragraph
-            clean_paragraph = reduce(text_reducer, self.filters.values(), paragraph)
+            clean_paragraph = reduce(text_reducer, filters, paragraph)
 
             # remove any filtered (and now empty) paragraphs (ie. the git headers)
             if not clean_paragraph.strip():
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import fnmatch
 import os
-from fnmatch import fnmatch
 from logging import getLogger
 from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
 from re import DOTALL, compile as regexp, error as RegexError  # noqa: N812
@@ -21,11 +21,18 @@ from semantic_release.commit_parser.token import (
     ParseError,
     ParseResult,
 )
-from semantic_release.commit_parser.util import force_str
+from semantic_release.commit_parser.util import (
+    force_str,
+    match_commit_header,
+    split_commit_message,
+)
 from semantic_release.errors import InvalidParserOptions
 
 if TYPE_CHECKING:  # pragma: no cover
+    from re import Pattern
+
     from git.objects.commit import Commit
+    from git.repo.base import Repo
 
 
 class ConventionalCommitMonorepoParser(
@@ -34,8 +41,16 @@ class ConventionalCommitMonorepoParser(
     # TODO: Remove for v11 compatibility, get_default_options() will be called instead
     parser_options = ConventionalCommitMonorepoParserOptions
 
+    # Results only depend on the commit & the parser options
+    supports_result_cache = True
+
+    # Commits are routed to the package by their changed files
+    uses_changed_files = True
+
     def __init__(
-        self, options: ConventionalCommitMonorepoParserOptions | None = None
+        self,
+        options: ConventionalCommitMonorepoParserOptions | None = None,
+        base_parser: ConventionalCommitParser | None = None,
     ) -> None:
         super().__init__(options)
 
@@ -107,12 +122,17 @@ class ConventionalCommitMonorepoParser(
         )
         self._file_selection_filters: list[str] = file_select_filters
         self._file_ignore_filters: list[str] = file_ignore_filters
+        self._path_filter_matchers: dict[
+            tuple[str, str], tuple[str, Pattern[str] | None, Pattern[str] | None]
+        ] = {}
 
         self._logger = getLogger(
             str.join(".", [self.__module__, self.__class__.__name__])
         )
 
-        self._base_parser = ConventionalCommitParser(
+        # A base parser (with the same conventional commit options) can be shared to
+        # parse the commit messages once for multiple packages (see version.monorepo)
+        self._base_parser = base_parser or ConventionalCommitParser(
             options=ConventionalCommitParserOptions(
                 **{
                     k: getattr(self.options, k)
@@ -253,7 +273,7 @@ class ConventionalCommitMonorepoParser(
             )
 
         separate_commits: list[Commit] = (
-            self._base_parser.unsquash_commit(commit)
+            self.unsquash_commit(commit)
             if self.options.parse_squash_commits
             else [commit]
         )
@@ -316,18 +336,21 @@ class ConventionalCommitMonorepoParser(
     def parse_message(
         self, message: str, strict_scope: bool = False
     ) -> ParsedMessageResult | None:
+        subject, body = split_commit_message(message, self.options.max_body_size)
         if (
-            not (parsed_match := self._strict_scope_pattern.match(message))
+            not (
+                header := match_commit_header(self._strict_scope_pattern, subject, body)
+            )
             and strict_scope
         ):
             return None
 
-        if not parsed_match and not (
-            parsed_match := self._optional_scope_pattern.match(message)
+        if not header and not (
+            header := match_commit_header(self._optional_scope_pattern, subject, body)
         ):
             return None
 
-        return self._base_parser.create_parsed_message_result(parsed_match)
+        return self._base_parser.create_parsed_message_result(*header)
 
     def parse_commit(self, commit: Commit) -> ParseResult:
         """Attempt to parse the commit message with a regular expression into a ParseResult."""
@@ -404,16 +427,52 @@ class ConventionalCommitMonorepoParser(
             f"Format Mismatch! Unable to parse commit message: {commit.message!r}",
         )
 
+    def unsquash_commit(self, commit: Commit) -> list[Commit]:
+        return self._base_parser.unsquash_commit(commit)
+
     def unsquash_commit_message(self, message: str) -> list[str]:
         return self._base_parser.unsquash_commit_message(message)
 
     def _has_relevant_changed_files(self, commit: Commit) -> bool:
-        # Extract git root from commit
-        git_root = (
-            Path(commit.repo.working_tree_dir or commit.repo.working_dir)
-            .absolute()
-            .resolve()
+        files_root, selection_matcher, ignore_matcher = self._get_path_filter_matchers(
+            commit.repo
         )
+        if selection_matcher is None:
+            return False
+
+        # Check if the changed files of the commit that match the path filters
+        for rel_git_path in self.get_changed_files(commit):
+            full_path = os.path.normcase(files_root + rel_git_path)
+
+            # Check if the filepath matches any of the file selection filters
+            if not selection_matcher.match(full_path):
+                continue
+
+            # Pass filter matches, so now evaluate if it is supposed to be ignored
+            if ignore_matcher is None or not ignore_matcher.match(full_path):
+                # No ignore filter matched, so it must be a relevant file
+                return True
+
+        return False
+
+    def _get_path_filter_matchers(
+        self, repo: Repo
+    ) -> tuple[str, Pattern[str] | None, Pattern[str] | None]:
+        """
+        Return the root (with a trailing separator) of the changed file paths and the
+        matchers of the sandboxed file selection & ignore filters (``None`` when there
+        are no filters).
+
+        The roots are only resolved (and the filters compiled) once per repository &
+        working directory for the lifetime of the parser.
+        """
+        repo_dir = str(repo.working_tree_dir or repo.working_dir)
+        cache_key = (repo_dir, os.getcwd())
+        if (matchers := self._path_filter_matchers.get(cache_key)) is not None:
+            return matchers
+
+        # Extract git root from the repository of the commit
+        git_root = Path(repo_dir).absolute().resolve()
 
         cwd = Path.cwd().absolute().resolve()
 
@@ -445,23 +504,27 @@ class ConventionalCommitMonorepoParser(
             if git_root in file_filter.parents
         ]
 
-        # Check if the changed files of the commit that match the path filters
-        for full_path in iter(
-            str(git_root / rel_git_path) for rel_git_path in commit.stats.files
-        ):
-            # Check if the filepath matches any of the file selection filters
-            if not any(
-                fnmatch(full_path, select_filter)
-                for select_filter in sandboxed_selection_filters
-            ):
-                continue
+        matchers = (
+            os.path.join(str(git_root), ""),
+            self._compile_path_filters(sandboxed_selection_filters),
+            self._compile_path_filters(sandboxed_ignore_filters),
+        )
+        self._path_filter_matchers[cache_key] = matchers
+        return matchers
 
-            # Pass filter matches, so now evaluate if it is supposed to be ignored
-            if not any(
-                fnmatch(full_path, ignore_filter)
-                for ignore_filter in sandboxed_ignore_filters
-            ):
-                # No ignore filter matched, so it must be a relevant file
-                return True
+    @staticmethod
+    def _compile_path_filters(path_filters: list[str]) -> Pattern[str] | None:
+        # A single regular expression which matches a (normalized) path if any of the
+        # path filters matches it, see fnmatch.fnmatch()
+        if not path_filters:
+            return None
 
-        return False
+        return regexp(
+            str.join(
+                "|",
+                (
+                    fnmatch.translate(os.path.normcase(path_filter))
+                    for path_filter in path_filters
+                ),
+            )
+        )
@@ -4,12 +4,11 @@ from __future__ import annotations
 
 import re
 from functools import reduce
-from itertools import zip_longest
+from itertools import chain, zip_longest
 from re import compile as regexp
 from textwrap import dedent
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
-from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
 
 from semantic_release.commit_parser._base import CommitParser, ParserOptions
@@ -20,14 +19,21 @@ from semantic_release.commit_parser.token import (
     ParseResult,
 )
 from semantic_release.commit_parser.util import (
-    deep_copy_commit,
+    CommitBodyTokenizer,
+    combine_text_filters,
+    commit_message_view,
     force_str,
-    parse_paragraphs,
+    limit_message_body,
+    literal_alternation,
+    split_commit_message,
 )
 from semantic_release.enums import LevelBump
 from semantic_release.errors import InvalidParserOptions
 from semantic_release.globals import logger
-from semantic_release.helpers import sort_numerically, text_reducer
+from semantic_release.helpers import text_reducer
+
+if TYPE_CHECKING:  # pragma: no cover
+    from git.objects.commit import Commit
 
 
 @dataclass
@@ -98,6 +104,13 @@ class EmojiParserOptions(ParserOptions):
     ignore_merge_commits: bool = True
     """Toggle flag for whether or not to ignore merge commits"""
 
+    max_body_size: int = 0
+    """
+    The maximum number of characters of a commit message body to analyze. Longer bodies
+    (ie. lockfile diffs pasted into bot commits) are truncated before they are parsed,
+    which bounds the time to parse each commit. A value of 0 disables the limit.
+    """
+
     @property
     def tag_to_level(self) -> dict[str, LevelBump]:
         """A mapping of commit tags to the level bump they should result in."""
@@ -136,6 +149,9 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = EmojiParserOptions
 
+    # Results only depend on the commit & the parser options
+    supports_result_cache = True
+
     def __init__(self, options: EmojiParserOptions | None = None) -> None:
         super().__init__(options)
 
@@ -143,8 +159,10 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         emojis_in_precedence_order = list(self.options.tag_to_level.keys())[::-1]
 
         try:
+            # The emojis are factored into a trie so that matching does not slow down
+            # with the number of configured emojis
             highest_emoji_pattern = regexp(
-                r"(?P<type>%s)" % str.join("|", emojis_in_precedence_order)
+                r"(?P<type>%s)" % literal_alternation(emojis_in_precedence_order)
             )
         except re.error as err:
             raise InvalidParserOptions(
@@ -213,17 +231,25 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
                         "",
                         [
                             r"^(?:[\t ]*[*-][\t ]+|[\t ]+)?",  # bullet points or indentation
-                            highest_emoji_pattern.pattern
-                            + r"(\W)",  # prior to commit type
+                            f"(?={highest_emoji_pattern.pattern}\\W)",  # prior to commit type
                         ],
                     ),
                     flags=re.MULTILINE,
                 ),
-                # move commit type to the start of the line
-                r"\1\2",
+                # move commit type to the start of the line (a replacement without
+                # group references avoids re-hashing the large pattern on each use)
+                "",
             ),
         }
 
+        self.body_tokenizer = CommitBodyTokenizer(
+            notice_selector=self.notice_selector,
+            issue_selector=(
+                self.issue_selector if self.options.parse_linked_issues else None
+            ),
+            breaking_selector=None,
+        )
+
     @staticmethod
     def get_default_options() -> EmojiParserOptions:
         return EmojiParserOptions()
@@ -231,44 +257,11 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
     def commit_body_components_separator(
         self, accumulator: dict[str, list[str]], text: str
     ) -> dict[str, list[str]]:
-        if (match := self.notice_selector.match(text)) and (
-            notice := match.group("notice")
-        ):
-            accumulator["notices"].append(notice)
-            return accumulator
-
-        if self.options.parse_linked_issues and (
-            match := self.issue_selector.search(text)
-        ):
-            predicate = regexp(r",? and | *[,;/& ] *").sub(
-                ",", match.group("issue_predicate") or ""
-            )
-            # Almost all issue trackers use a number to reference an issue so
-            # we use a simple regexp to validate the existence of a number which helps filter out
-            # any non-issue references that don't fit our expected format
-            has_number = regexp(r"\d+")
-            new_issue_refs: set[str] = set(
-                filter(
-                    lambda issue_str, validator=has_number: validator.search(issue_str),  # type: ignore[arg-type]
-                    predicate.split(","),
-                )
-            )
-            if new_issue_refs:
-                accumulator["linked_issues"] = sort_numerically(
-                    set(accumulator["linked_issues"]).union(new_issue_refs)
-                )
-                return accumulator
-
-        # Prevent appending duplicate descriptions
-        if text not in accumulator["descriptions"]:
-            accumulator["descriptions"].append(text)
-
-        return accumulator
+        # TODO: remove in v11, maintained for compatibility (see body_tokenizer)
+        return self.body_tokenizer.add_paragraph(accumulator, text)
 
     def parse_message(self, message: str) -> ParsedMessageResult:
-        msg_parts = message.split("\n", maxsplit=1)
-        subject = msg_parts[0]
-        msg_body = msg_parts[1] if len(msg_parts) > 1 else ""
+        subject, msg_body = split_commit_message(message, self.options.max_body_size)
 
         linked_merge_request = ""
         if mr_match := self.mr_selector.search(subject):
@@ -285,18 +278,7 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         )
 
         # All emojis will remain part of the returned description
-        body_components: dict[str, list[str]] = reduce(
-            self.commit_body_components_separator,
-            [
-                subject,
-                *parse_paragraphs(msg_body),
-            ],
-            {
-                "descriptions": [],
-                "notices": [],
-                "linked_issues": [],
-            },
-        )
+        body_components = self.body_tokenizer.tokenize(subject, msg_body)
 
         descriptions = tuple(body_components["descriptions"])
 
@@ -407,17 +389,13 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         #
         # Return a list of artificial commits (each with a single commit message)
         return [
-            # create a artificial commit object (copy of original but with modified message)
-            Commit(
-                **{
-                    **deep_copy_commit(commit),
-                    "message": commit_msg,
-                }
-            )
+            # create a artificial commit object (a view of the original with another message)
+            commit_message_view(commit, commit_msg)
             for commit_msg in self.unsquash_commit_message(force_str(commit.message))
         ] or [commit]
 
     def unsquash_commit_message(self, message: str) -> list[str]:
+        message = limit_message_body(message, self.options.max_body_size)
         normalized_message = message.replace("\r", "").strip()
 
         # split by obvious separate commits (applies to manual git squash merges)
@@ -425,10 +403,10 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
             normalized_message
         )
 
-        separate_commit_msgs: list[str] = reduce(
-            lambda all_msgs, msgs: all_msgs + msgs,
-            map(self._find_squashed_commits_in_str, obvious_squashed_commits),
-            [],
+        separate_commit_msgs: list[str] = list(
+            chain.from_iterable(
+                map(self._find_squashed_commits_in_str, obvious_squashed_commits)
+            )
         )
 
         return list(filter(None, separate_commit_msgs))
@@ -437,9 +415,12 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
         separate_commit_msgs: list[str] = []
         current_msg = ""
 
+        # The git header filters are combined to normalize each paragraph in one scan
+        filters = combine_text_filters(tuple(self.filters.values()))
+
         for paragraph in filter(None, message.strip().split("\n\n")):
             # Apply filters to normalize the paragraph
-            clean_paragraph = reduce(text_reducer, self.filters.values(), paragraph)
+            clean_paragraph = reduce(text_reducer, filters, paragraph)
 
             # remove any filtered (and now empty) paragraphs (ie. the git headers)
             if not clean_paragraph.strip():
@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from git.objects.commit import Commit
+from git.objects.tree import Tree
+from git.objects.util import from_timestamp
+from git.util import Actor, hex_to_bin
+
+from semantic_release.commit_parser.util import force_str
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datetime import datetime
+    from typing import Any
+
+    from git.repo.base import Repo
+
+
+def _populated_attr(commit: Commit, name: str) -> Any:
+    # Read a commit attribute without letting GitPython read the object from the
+    # repository when the attribute is not populated yet (raises AttributeError)
+    return object.__getattribute__(commit, name)
+
+
+class CommitRecord:
+    """
+    A compact, read-only record of a git commit.
+
+    A :py:class:`git.objects.commit.Commit` references its repository, tree & parent
+    commit objects which keeps a large graph of objects alive for as long as the
+    commit is referenced. The record only holds the plain fields of the commit that
+    are used by the commit parsers & the changelog templates (shas, message, author,
+    committer & dates).
+
+    Any other attribute of the commit (ie. ``tree`` or ``stats``) is provided by the
+    full commit object, which is rehydrated lazily on first access (see :attr:`commit`).
+    """
+
+    __slots__ = (
+        "repo",
+        "hexsha",
+        "parent_shas",
+        "tree_sha",
+        "author_name",
+        "author_email",
+        "authored_date",
+        "author_tz_offset",
+        "committer_name",
+        "committer_email",
+        "committed_date",
+        "committer_tz_offset",
+        "message",
+        "_commit",
+    )
+
+    def __init__(
+        self,
+        repo: Repo,
+        hexsha: str,
+        parent_shas: tuple[str, ...],
+        tree_sha: str,
+        author_name: str,
+        author_email: str,
+        authored_date: int,
+        author_tz_offset: int,
+        committer_name: str,
+        committer_email: str,
+        committed_date: int,
+        committer_tz_offset: int,
+        message: str,
+    ) -> None:
+        self.repo = repo
+        self.hexsha = hexsha
+        self.parent_shas = parent_shas
+        self.tree_sha = tree_sha
+        self.author_name = author_name
+        self.author_email = author_email
+        self.authored_date = authored_date
+        self.author_tz_offset = author_tz_offset
+        self.committer_name = committer_name
+        self.committer_email = committer_email
+        self.committed_date = committed_date
+        self.committer_tz_offset = committer_tz_offset
+        self.message = message
+        self._commit: Commit | None = None
+
+    @classmethod
+    def from_commit(cls, commit: Commit | CommitRecord) -> CommitRecord:
+        """Create a record from the fields of the given commit."""
+        if isinstance(commit, CommitRecord):
+            return commit
+
+        try:
+            tree_sha = _populated_attr(commit, "tree").hexsha
+        except AttributeError:
+            # Unknown until the commit is rehydrated, avoid reading the commit object
+            tree_sha = ""
+
+        return cls(
+            repo=commit.repo,
+            hexsha=commit.hexsha,
+            parent_shas=tuple(parent.hexsha for parent in commit.parents),
+            tree_sha=tree_sha,
+            author_name=commit.author.name or "",
+            author_email=commit.author.email or "",
+            authored_date=commit.authored_date,
+            author_tz_offset=int(commit.author_tz_offset),
+            committer_name=commit.committer.name or "",
+            committer_email=commit.committer.email or "",
+            committed_date=commit.committed_date,
+            committer_tz_offset=int(commit.committer_tz_offset),
+            message=force_str(commit.message),
+        )
+
+    def with_message(self, message: str) -> CommitRecord:
+        """Return a copy of the record with another message (ie. a squashed commit)."""
+        return type(self)(
+            repo=self.repo,
+            hexsha=self.hexsha,
+            parent_shas=self.parent_shas,
+            tree_sha=self.tree_sha,
+            author_name=self.author_name,
+            author_email=self.author_email,
+            authored_date=self.authored_date,
+            author_tz_offset=self.author_tz_offset,
+            committer_name=self.committer_name,
+            committer_email=self.committer_email,
+            committed_date=self.committed_date,
+            committer_tz_offset=self.committer_tz_offset,
+            message=message,
+        )
+
+    @property
+    def short_hash(self) -> str:
+        """A short representation of the hash value (in hex) of the commit."""
+        return self.hexsha[:7]
+
+    @property
+    def binsha(self) -> bytes:
+        return hex_to_bin(self.hexsha)
+
+    @property
+    def author(self) -> Actor:
+        return Actor(self.author_name, self.author_email)
+
+    @property
+    def committer(self) -> Actor:
+        return Actor(self.committer_name, self.committer_email)
+
+    @property
+    def authored_datetime(self) -> datetime:
+        return from_timestamp(self.authored_date, self.author_tz_offset)
+
+    @property
+    def committed_datetime(self) -> datetime:
+        return from_timestamp(self.committed_date, self.committer_tz_offset)
+
+    @property
+    def summary(self) -> str:
+        """The first line of the commit message."""
+        return self.message.split("\n", 1)[0]
+
+    @property
+    def parents(self) -> tuple[Commit, ...]:
+        """The parent commits, which are only read from the repository when used."""
+        return tuple(Commit(self.repo, hex_to_bin(sha)) for sha in self.parent_shas)
+
+    @property
+    def commit(self) -> Commit:
+        """
+        The full commit object, rehydrated from the record on first access.
+
+        The commit object is populated with the fields of the record (including the
+        message, which differs from the message in the repository for the pieces of a
+        squashed commit) so no repository read is required unless an attribute which
+        is not part of the record is used.
+        """
+        if self._commit is None:
+            self._commit = self.to_commit()
+        return self._commit
+
+    def to_commit(self) -> Commit:
+        """Create a new, fully populated commit object from the record."""
+        commit = Commit(
+            self.repo,
+            self.binsha,
+            tree=Tree(self.repo, hex_to_bin(self.tree_sha)) if self.tree_sha else None,
+            author=self.author,
+            authored_date=self.authored_date,
+            author_tz_offset=self.author_tz_offset,
+            committer=self.committer,
+            committed_date=self.committed_date,
+            committer_tz_offset=self.committer_tz_offset,
+            message=self.message,
+            parents=list(self.parents),
+            encoding=Commit.default_encoding,
+        )
+        # Set explicitly as GitPython ignores None & would read the object to find it
+        # (the optional signature is annotated as a str by GitPython)
+        commit.gpgsig = None  # type: ignore[assignment]
+        return commit
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes which are not part of the record
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.commit, name)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CommitRecord):
+            return self.hexsha == other.hexsha and self.message == other.message
+        if isinstance(other, Commit):
+            return self.hexsha == other.hexsha
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.hexsha)
+
+    def __str__(self) -> str:
+        return self.hexsha
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} {self.hexsha}>"
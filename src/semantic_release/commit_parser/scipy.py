@@ -48,12 +48,11 @@ from __future__ import annotations
 
 import re
 from functools import reduce
-from itertools import zip_longest
+from itertools import chain, zip_longest
 from re import compile as regexp
 from textwrap import dedent
 from typing import TYPE_CHECKING, Tuple
 
-from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
 
 from semantic_release.commit_parser._base import CommitParser, ParserOptions
@@ -64,14 +63,18 @@ from semantic_release.commit_parser.token import (
     ParseResult,
 )
 from semantic_release.commit_parser.util import (
-    deep_copy_commit,
+    CommitBodyTokenizer,
+    combine_text_filters,
+    commit_message_view,
     force_str,
-    parse_paragraphs,
+    limit_message_body,
+    match_commit_header,
+    split_commit_message,
 )
 from semantic_release.enums import LevelBump
 from semantic_release.errors import InvalidParserOptions
 from semantic_release.globals import logger
-from semantic_release.helpers import sort_numerically, text_reducer
+from semantic_release.helpers import text_reducer
 
 if TYPE_CHECKING:  # pragma: no cover
     from git.objects.commit import Commit
@@ -155,6 +158,13 @@ class ScipyParserOptions(ParserOptions):
     ignore_merge_commits: bool = True
     """Toggle flag for whether or not to ignore merge commits"""
 
+    max_body_size: int = 0
+    """
+    The maximum number of characters of a commit message body to analyze. Longer bodies
+    (ie. lockfile diffs pasted into bot commits) are truncated before they are parsed,
+    which bounds the time to parse each commit. A value of 0 disables the limit.
+    """
+
     @property
     def tag_to_level(self) -> dict[str, LevelBump]:
         """A mapping of commit tags to the level bump they should result in."""
@@ -185,6 +195,9 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = ScipyParserOptions
 
+    # Results only depend on the commit & the parser options
+    supports_result_cache = True
+
     def __init__(self, options: ScipyParserOptions | None = None) -> None:
         super().__init__(options)
 
@@ -279,6 +292,13 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
             ),
         }
 
+        self.body_tokenizer = CommitBodyTokenizer(
+            notice_selector=self.notice_selector,
+            issue_selector=self.issue_selector,
+            # Breaking changes are identified by the commit type
+            breaking_selector=None,
+        )
+
     @staticmethod
     def get_default_options() -> ScipyParserOptions:
         return ScipyParserOptions()
@@ -286,46 +306,17 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
     def commit_body_components_separator(
         self, accumulator: dict[str, list[str]], text: str
     ) -> dict[str, list[str]]:
-        if (match := self.notice_selector.match(text)) and (
-            notice := match.group("notice")
-        ):
-            accumulator["notices"].append(notice)
-            return accumulator
-
-        if match := self.issue_selector.search(text):
-            # if match := self.issue_selector.search(text):
-            predicate = regexp(r",? and | *[,;/& ] *").sub(
-                ",", match.group("issue_predicate") or ""
-            )
-            # Almost all issue trackers use a number to reference an issue so
-            # we use a simple regexp to validate the existence of a number which helps filter out
-            # any non-issue references that don't fit our expected format
-            has_number = regexp(r"\d+")
-            new_issue_refs: set[str] = set(
-                filter(
-                    lambda issue_str, validator=has_number: validator.search(issue_str),  # type: ignore[arg-type]
-                    predicate.split(","),
-                )
-            )
-            if new_issue_refs:
-                accumulator["linked_issues"] = sort_numerically(
-                    set(accumulator["linked_issues"]).union(new_issue_refs)
-                )
-                return accumulator
-
-        # Prevent appending duplicate descriptions
-        if text not in accumulator["descriptions"]:
-            accumulator["descriptions"].append(text)
-
-        return accumulator
+        # TODO: remove in v11, maintained for compatibility (see body_tokenizer)
+        return self.body_tokenizer.add_paragraph(accumulator, text)
 
     def parse_message(self, message: str) -> ParsedMessageResult | None:
-        if not (parsed := self.commit_msg_pattern.match(message)):
+        subject, body = split_commit_message(message, self.options.max_body_size)
+        if not (header := match_commit_header(self.commit_msg_pattern, subject, body)):
             return None
 
+        parsed, parsed_text = header
         parsed_scope = parsed.group("scope") or ""
         parsed_subject = parsed.group("subject")
-        parsed_text = parsed.group("text")
         parsed_type = parsed.group("type")
 
         linked_merge_request = ""
@@ -333,18 +324,8 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
             linked_merge_request = mr_match.group("mr_number")
             parsed_subject = self.mr_selector.sub("", parsed_subject).strip()
 
-        body_components: dict[str, list[str]] = reduce(
-            self.commit_body_components_separator,
-            [
-                # Insert the subject before the other paragraphs
-                parsed_subject,
-                *parse_paragraphs(parsed_text or ""),
-            ],
-            {
-                "descriptions": [],
-                "notices": [],
-                "linked_issues": [],
-            },
+        body_components = self.body_tokenizer.tokenize(
+            parsed_subject, parsed_text or ""
         )
 
         level_bump = self.options.tag_to_level.get(
@@ -479,17 +460,13 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
 
         # Return a list of artificial commits (each with a single commit message)
         return [
-            # create a artificial commit object (copy of original but with modified message)
-            Commit(
-                **{
-                    **deep_copy_commit(commit),
-                    "message": commit_msg,
-                }
-            )
+            # create a artificial commit object (a view of the original with another message)
+            commit_message_view(commit, commit_msg)
             for commit_msg in self.unsquash_commit_message(force_str(commit.message))
         ] or [commit]
 
     def unsquash_commit_message(self, message: str) -> list[str]:
+        message = limit_message_body(message, self.options.max_body_size)
         normalized_message = message.replace("\r", "").strip()
 
         # split by obvious separate commits (applies to manual git squash merges)
@@ -497,10 +474,10 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
             normalized_message
         )
 
-        separate_commit_msgs: list[str] = reduce(
-            lambda all_msgs, msgs: all_msgs + msgs,
-            map(self._find_squashed_commits_in_str, obvious_squashed_commits),
-            [],
+        separate_commit_msgs: list[str] = list(
+            chain.from_iterable(
+                map(self._find_squashed_commits_in_str, obvious_squashed_commits)
+            )
         )
 
         return list(filter(None, separate_commit_msgs))
@@ -509,9 +486,12 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
         separate_commit_msgs: list[str] = []
         current_msg = ""
 
+        # The git header filters are combined to normalize each paragraph in one scan
+        filters = combine_text_filters(tuple(self.filters.values()))
+
         for paragraph in filter(None, message.strip().split("\n\n")):
             # Apply filters to normalize the paragraph
-            clean_paragraph = reduce(text_reducer, self.filters.values(), paragraph)
+            clean_paragraph = reduce(text_reducer, filters, paragraph)
 
             # remove any filtered (and now empty) paragraphs (ie. the git headers)
             if not clean_paragraph.strip():
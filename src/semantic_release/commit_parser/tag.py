@@ -37,6 +37,9 @@ class TagCommitParser(CommitParser[ParseResult, TagParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = TagParserOptions
 
+    # Results only depend on the commit & the parser options
+    supports_result_cache = True
+
     @staticmethod
     def get_default_options() -> TagParserOptions:
         return TagParserOptions()
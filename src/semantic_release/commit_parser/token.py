@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, NamedTuple, NoReturn, TypeVar, Union
 
+from semantic_release.commit_parser.record import CommitRecord
 from semantic_release.commit_parser.util import force_str
 from semantic_release.errors import CommitParseError
 
@@ -73,8 +74,14 @@ class ParsedCommit(NamedTuple):
     the parser gennerally strips the prefix and includes the rest of the paragraph in this list.
     """
 
-    commit: Commit
-    """The original commit object (a class defined by GitPython) that was parsed"""
+    commit: Union[Commit, CommitRecord]
+    """
+    The original commit object (a class defined by GitPython) that was parsed.
+
+    Once the commit history is parsed, this is replaced by a compact
+    :py:class:`CommitRecord <semantic_release.commit_parser.record.CommitRecord>`
+    which provides the same attributes & rehydrates the full commit object on demand.
+    """
 
     release_notices: tuple[str, ...] = ()
     """
@@ -143,6 +150,10 @@ class ParsedCommit(NamedTuple):
     def is_merge_commit(self) -> bool:
         return bool(len(self.commit.parents) > 1)
 
+    def compact(self) -> ParsedCommit:
+        """Return a copy of the result which references a compact record of the commit."""
+        return self._replace(commit=CommitRecord.from_commit(self.commit))
+
     @staticmethod
     def from_parsed_message_result(
         commit: Commit, parsed_message_result: ParsedMessageResult
@@ -166,8 +177,14 @@ class ParsedCommit(NamedTuple):
 class ParseError(NamedTuple):
     """A read-only named tuple object representing an error that occurred while parsing a commit message."""
 
-    commit: Commit
-    """The original commit object (a class defined by GitPython) that was parsed"""
+    commit: Union[Commit, CommitRecord]
+    """
+    The original commit object (a class defined by GitPython) that was parsed.
+
+    Once the commit history is parsed, this is replaced by a compact
+    :py:class:`CommitRecord <semantic_release.commit_parser.record.CommitRecord>`
+    which provides the same attributes & rehydrates the full commit object on demand.
+    """
 
     error: str
     """A string with a description for why the commit parsing failed."""
@@ -201,6 +218,10 @@ class ParseError(NamedTuple):
     def is_merge_commit(self) -> bool:
         return bool(len(self.commit.parents) > 1)
 
+    def compact(self) -> ParseError:
+        """Return a copy of the error which references a compact record of the commit."""
+        return self._replace(commit=CommitRecord.from_commit(self.commit))
+
     def raise_error(self) -> NoReturn:
         """A convience method to raise a CommitParseError with the error message."""
         raise CommitParseError(self.error)
@@ -2,20 +2,18 @@ from __future__ import annotations
 
 from contextlib import suppress
 from copy import deepcopy
-from functools import reduce
-from re import MULTILINE, compile as regexp
+from functools import lru_cache, reduce
+from re import DOTALL, MULTILINE, compile as regexp, escape
 from typing import TYPE_CHECKING
 
-# TODO: remove in v11
-from semantic_release.helpers import (
-    sort_numerically,  # noqa: F401 # TODO: maintained for compatibility
-)
+from git.objects.commit import Commit
 
-if TYPE_CHECKING:  # pragma: no cover
-    from re import Pattern
-    from typing import Any, TypedDict
+from semantic_release.globals import logger
+from semantic_release.helpers import sort_numerically
 
-    from git import Commit
+if TYPE_CHECKING:  # pragma: no cover
+    from re import Match, Pattern
+    from typing import Any, Sequence, TypedDict
 
     class RegexReplaceDef(TypedDict):
         pattern: Pattern
@@ -41,6 +39,7 @@ trim_line_endings: RegexReplaceDef = {
     "repl": "\n",  # remove the optional whitespace & remove windows newlines
 }
 
+# TODO: remove in v11, git footers are spread out in a single scan (see parse_paragraphs)
 spread_out_git_footers: RegexReplaceDef = {
     # Match a git footer line, and add an extra newline after it
     # only be flexible enough for a double space indent (otherwise its probably on purpose)
@@ -49,6 +48,132 @@ spread_out_git_footers: RegexReplaceDef = {
     "repl": r"\1\n\n\2",
 }
 
+# A git footer line, only flexible enough for a double space indent
+git_footer_line = regexp(r" {0,2}[\w-]*: .+")
+
+# Separators between the issue references of an issue footer (ie. "#1, #2 and #3")
+issue_predicate_separator = regexp(r",? and | *[,;/& ] *")
+
+# Almost all issue trackers use a number to reference an issue
+issue_number = regexp(r"\d+")
+
+# Characters which have a special meaning in a regular expression
+regex_chars = frozenset("\\.^$*+?{}[]|()")
+
+
+@lru_cache(maxsize=32)
+def combine_text_filters(
+    filters: tuple[tuple[Pattern[str], str], ...],
+) -> tuple[tuple[Pattern[str], str], ...]:
+    r"""
+    Combine consecutive filters which remove whole lines (ie. the git headers of a
+    squashed commit) into a single filter so they are applied in one scan of the text.
+
+    A filter removes whole lines when its replacement is empty and its pattern is a
+    multiline ``^...$\n?`` pattern. Applying the combined filters (in order, see
+    :func:`semantic_release.helpers.text_reducer`) gives the same result as applying
+    the given filters.
+    """
+    combined: list[tuple[Pattern[str], str]] = []
+    line_patterns: list[Pattern[str]] = []
+
+    def add_line_patterns() -> None:
+        if len(line_patterns) == 1:
+            combined.append((line_patterns[0], ""))
+        elif line_patterns:
+            combined.append(
+                (
+                    regexp(
+                        str.join("|", (f"(?:{p.pattern})" for p in line_patterns)),
+                        flags=line_patterns[0].flags,
+                    ),
+                    "",
+                )
+            )
+        line_patterns.clear()
+
+    for pattern, replacement in filters:
+        removes_lines = bool(
+            not replacement
+            and pattern.flags & MULTILINE
+            and not pattern.flags & DOTALL
+            and pattern.pattern.startswith("^")
+            and pattern.pattern.endswith(r"$\n?")
+        )
+        if line_patterns and (
+            not removes_lines or pattern.flags != line_patterns[0].flags
+        ):
+            add_line_patterns()
+
+        if removes_lines:
+            line_patterns.append(pattern)
+            continue
+
+        combined.append((pattern, replacement))
+
+    add_line_patterns()
+    return tuple(combined)
+
+
+def literal_alternation(literals: Sequence[str]) -> str:
+    """
+    Create a regular expression which matches the same as the alternation of the
+    given literals (``"|".join(literals)``), where the literals listed first take
+    precedence, but with the common prefixes of the literals factored into a trie.
+
+    The regular expression engine then only compares each character of the matched
+    text against the distinct next characters of the literals instead of trying every
+    literal in turn, so matching scales with the length of the literals rather than
+    with the number of literals.
+
+    Literals which contain regular expression characters are joined as given.
+    """
+    unique_literals = dict.fromkeys(literals)
+
+    if not unique_literals or any(
+        regex_chars.intersection(literal) for literal in unique_literals
+    ):
+        return str.join("|", unique_literals)
+
+    return _literal_trie(list(unique_literals), 0)
+
+
+def _literal_trie(literals: list[str], depth: int) -> str:
+    # All the literals (in precedence order) share the same prefix of the given depth
+    terminal = next(
+        (index for index, literal in enumerate(literals) if len(literal) == depth),
+        None,
+    )
+    if terminal is None:
+        return _literal_trie_branches(literals, depth)
+
+    if len(literals) == 1:
+        return ""
+
+    # The literal which ends here is a prefix of all of the other literals, these
+    # are only tried before it if they take precedence over it
+    alternatives = [""]
+    if terminal > 0:
+        alternatives.insert(0, _literal_trie_branches(literals[:terminal], depth))
+    if terminal + 1 < len(literals):
+        alternatives.append(_literal_trie_branches(literals[terminal + 1 :], depth))
+
+    return "(?:%s)" % str.join("|", alternatives)
+
+
+def _literal_trie_branches(literals: list[str], depth: int) -> str:
+    # Literals with different next characters can't match the same text, so their
+    # order only matters within each branch
+    branches: dict[str, list[str]] = {}
+    for literal in literals:
+        branches.setdefault(literal[depth], []).append(literal)
+
+    patterns = [
+        escape(char) + _literal_trie(branch, depth + 1)
+        for char, branch in branches.items()
+    ]
+    return patterns[0] if len(patterns) == 1 else "(?:%s)" % str.join("|", patterns)
+
 
 def parse_paragraphs(text: str) -> list[str]:
     r"""
@@ -69,25 +194,158 @@ def parse_paragraphs(text: str) -> list[str]:
         text,
     )
 
-    # Repeat replacements until no more changes are made
-    prev_iteration = ""
-    while prev_iteration != adjusted_text:
-        prev_iteration = adjusted_text
-        adjusted_text = spread_out_git_footers["pattern"].sub(
-            spread_out_git_footers["repl"], adjusted_text
-        )
-
     return list(
         filter(
             None,
             [
                 un_word_wrap["pattern"].sub(un_word_wrap["repl"], paragraph).strip()
-                for paragraph in adjusted_text.strip().split("\n\n")
+                for paragraph in _spread_out_git_footers(adjusted_text)
+                .strip()
+                .split("\n\n")
             ],
         )
     )
 
 
+def _spread_out_git_footers(text: str) -> str:
+    # Separate each git footer line from a following line that looks like another
+    # footer (ie. "Closes: #123" followed by "Signed-off-by: ...") with an empty line.
+    # This is equivalent to repeating the substitution of `spread_out_git_footers`
+    # until nothing changes, where a footer directly following a spread footer is only
+    # considered on the next substitution (after the footer following it was spread)
+    lines = text.split("\n")
+    is_footer = [
+        ": " in line and bool(git_footer_line.fullmatch(line)) for line in lines
+    ]
+
+    first_spread = [False] * len(lines)
+    for i, next_line in enumerate(lines[1:]):
+        first_spread[i] = (
+            is_footer[i] and not first_spread[i - 1] and next_line.find(":") > 0
+        )
+
+    spread_lines: list[str] = []
+    for i, next_line in enumerate(lines[1:]):
+        if not (spread := first_spread[i]) and is_footer[i] and first_spread[i - 1]:
+            # The (up to double space) indent of a spread footer is removed
+            footer_line = next_line.lstrip(" ") if first_spread[i + 1] else next_line
+            spread = footer_line.find(":") > 0
+
+        spread_lines.extend([lines[i].lstrip(" "), ""] if spread else [lines[i]])
+
+    spread_lines.append(lines[-1])
+    return str.join("\n", spread_lines)
+
+
+def parse_issue_references(issue_predicate: str) -> set[str]:
+    """
+    Split the predicate of an issue footer (ie. "#1, #2 and #3") into the individual
+    issue references. References without a number are ignored as they are most
+    likely not an issue reference.
+    """
+    return {
+        issue_ref
+        for issue_ref in issue_predicate_separator.sub(",", issue_predicate).split(",")
+        if issue_number.search(issue_ref)
+    }
+
+
+class CommitBodyTokenizer:
+    """
+    Splits the body of a commit message into paragraphs (see :func:`parse_paragraphs`)
+    and classifies each paragraph in a single scan as either a breaking change
+    description, a release notice, a linked issue footer or a description.
+
+    The selectors are compiled once by the commit parser. Every footer has the form
+    ``<token>: <value>`` so the selectors are only evaluated for paragraphs containing
+    a colon. A selector of ``None`` disables the classification of that footer.
+
+    :param notice_selector: Matches a release notice, with a ``notice`` group
+    :param issue_selector: Searches an issue footer, with an ``issue_predicate`` group
+    :param breaking_selector: Matches a breaking change description (first group)
+    :param keep_footers_as_descriptions: Also add every classified footer to the
+        descriptions
+    """
+
+    def __init__(
+        self,
+        notice_selector: Pattern[str] | None,
+        issue_selector: Pattern[str] | None,
+        breaking_selector: Pattern[str] | None = breaking_re,
+        keep_footers_as_descriptions: bool = False,
+    ) -> None:
+        self.notice_selector = notice_selector
+        self.issue_selector = issue_selector
+        self.breaking_selector = breaking_selector
+        self.keep_footers_as_descriptions = keep_footers_as_descriptions
+
+    def tokenize(self, subject: str, body: str) -> dict[str, list[str]]:
+        """
+        Classify the subject & each paragraph of the body of a commit message and
+        return the components of the message (breaking descriptions, descriptions,
+        notices & linked issues).
+        """
+        components: dict[str, list[str]] = {
+            "breaking_descriptions": [],
+            "descriptions": [],
+            "notices": [],
+            "linked_issues": [],
+        }
+        for paragraph in [subject, *parse_paragraphs(body)]:
+            self.add_paragraph(components, paragraph)
+
+        return components
+
+    def add_paragraph(
+        self, components: dict[str, list[str]], paragraph: str
+    ) -> dict[str, list[str]]:
+        """Classify a single paragraph & add it to the given message components."""
+        if (
+            ":" in paragraph
+            and self._add_footer(components, paragraph)
+            and not self.keep_footers_as_descriptions
+        ):
+            return components
+
+        # Prevent appending duplicate descriptions
+        if paragraph not in components["descriptions"]:
+            components["descriptions"].append(paragraph)
+
+        return components
+
+    def _add_footer(self, components: dict[str, list[str]], paragraph: str) -> bool:
+        if (
+            self.breaking_selector is not None
+            and (match := self.breaking_selector.match(paragraph))
+            and (brk_desc := match.group(1))
+        ):
+            components["breaking_descriptions"].append(brk_desc)
+            return True
+
+        if (
+            self.notice_selector is not None
+            and (match := self.notice_selector.match(paragraph))
+            and (notice := match.group("notice"))
+        ):
+            components["notices"].append(notice)
+            return True
+
+        if self.issue_selector is None or not (
+            match := self.issue_selector.search(paragraph)
+        ):
+            return False
+
+        if new_issue_refs := parse_issue_references(
+            match.group("issue_predicate") or ""
+        ):
+            components["linked_issues"] = sort_numerically(
+                set(components["linked_issues"]).union(new_issue_refs)
+            )
+            return True
+
+        return False
+
+
 def force_str(msg: str | bytes | bytearray | memoryview) -> str:
     # This shouldn't be a thing but typing is being weird around what
     # git.commit.message returns and the memoryview type won't go away
@@ -99,6 +357,94 @@ def force_str(msg: str | bytes | bytearray | memoryview) -> str:
     )
 
 
+def split_commit_message(message: str, max_body_size: int = 0) -> tuple[str, str]:
+    """
+    Split a commit message into its subject line and its body (everything after the
+    line break which ends the subject line) with plain string operations, so that the
+    regular expressions of a parser are only applied to the part of the message they
+    need (see :func:`match_commit_header`).
+
+    The body is limited to ``max_body_size`` characters so that the time to parse a
+    message is bounded: it is truncated at the last line break within the limit (if
+    any) and the truncation is logged. A ``max_body_size`` of 0 disables the limit.
+    """
+    subject, _, body = message.partition("\n")
+    if max_body_size < 1 or len(body) <= max_body_size:
+        return subject, body
+
+    truncated_body = body[:max_body_size]
+    truncated_body = truncated_body.rpartition("\n")[0] or truncated_body
+    logger.info(
+        "Truncated the body of the commit message %r from %s to %s characters",
+        subject[:72],
+        len(body),
+        len(truncated_body),
+    )
+    return subject, truncated_body
+
+
+def limit_message_body(message: str, max_body_size: int) -> str:
+    """
+    Limit the body of a commit message (everything after the subject line) to
+    ``max_body_size`` characters, see :func:`split_commit_message`. A message within
+    the limit is returned as is.
+    """
+    if max_body_size < 1 or len(message) <= max_body_size:
+        return message
+
+    subject, body = split_commit_message(message, max_body_size)
+    if len(subject) + 1 + len(body) >= len(message):
+        # The body was not truncated
+        return message
+
+    return f"{subject}\n{body}"
+
+
+def match_commit_header(
+    pattern: Pattern[str], subject: str, body: str
+) -> tuple[Match[str], str] | None:
+    """
+    Match a commit message, split by :func:`split_commit_message`, with the pattern of
+    a commit message (with ``subject`` & ``text`` groups, where the text is the body
+    after the blank line which follows the subject line). Return the match & the text
+    of the body, or None.
+
+    The pattern is only applied to the subject line, the text is taken from the body
+    with plain string operations. Only a header which continues on the next line (ie.
+    a subject line of ``feat:`` alone) is matched against the whole (bounded) message.
+    """
+    if (match := pattern.match(subject)) and (
+        match.group("subject").strip() or not body
+    ):
+        return match, body[1:] if body.startswith("\n") else ""
+
+    if body and (match := pattern.match(f"{subject}\n{body}")):
+        return match, match.group("text") or ""
+
+    return None
+
+
+def commit_message_view(commit: Commit, message: str) -> Commit:
+    """
+    Create a commit object which represents the given commit with another message
+    (ie. a piece of a squashed commit).
+
+    Unlike :func:`deep_copy_commit`, nothing is copied: the new commit object shares
+    every populated attribute (author, committer, tree, parents, ...) with the given
+    commit and the attributes which are not populated yet are not read from the
+    repository.
+    """
+    view = Commit(commit.repo, commit.binsha)
+    for attr in Commit.__slots__:
+        with suppress(AttributeError):
+            # Bypass the lazy loading of GitPython for unpopulated attributes
+            setattr(view, attr, object.__getattribute__(commit, attr))
+
+    view.message = message
+    return view
+
+
+# TODO: remove in v11, squashed commits are split with commit_message_view
 def deep_copy_commit(commit: Commit) -> dict[str, Any]:
     keys = [
         "repo",
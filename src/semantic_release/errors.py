@@ -88,6 +88,13 @@ class BuildDistributionsError(SemanticReleaseBaseError):
     """Raised when there is a failure to build the distribution files."""
 
 
+class VersionStampError(SemanticReleaseBaseError):
+    """
+    Raised when the version could not be stamped into several of the configured source
+    files, the error of each file is listed in the message.
+    """
+
+
 class GitAddError(SemanticReleaseBaseError):
     """Raised when there is a failure to add files to the git index."""
 
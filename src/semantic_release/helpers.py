@@ -3,8 +3,11 @@ from __future__ import annotations
 import importlib.util
 import os
 import re
+import shutil
 import string
 import sys
+import tempfile
+from contextlib import suppress
 from functools import lru_cache, reduce, wraps
 from pathlib import Path, PurePosixPath
 from re import IGNORECASE, compile as regexp
@@ -114,6 +117,30 @@ def check_tag_format(tag_format: str) -> None:
         )
 
 
+def write_text_atomically(path: Path, content: str) -> None:
+    """
+    Write the text to the file through a temporary file in the same directory which
+    then replaces the file, so that the file is never left partially written. The
+    permissions of an existing file are kept.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        # Same encoding & newline translation as Path.write_text()
+        with os.fdopen(fd, "w") as fp:
+            fp.write(content)
+
+        with suppress(FileNotFoundError):
+            shutil.copymode(path, tmp_path)
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
 _R = TypeVar("_R")
 _FuncType = Callable[..., _R]
 
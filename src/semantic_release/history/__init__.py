@@ -0,0 +1,12 @@
+from semantic_release.history.commit_history import CommitHistory
+from semantic_release.history.instrumentation import ParserInstrumentation
+from semantic_release.history.parse_cache import ParseResultCache
+from semantic_release.history.tags import TagIndex, TagInfo
+
+__all__ = [
+    "CommitHistory",
+    "ParserInstrumentation",
+    "ParseResultCache",
+    "TagIndex",
+    "TagInfo",
+]
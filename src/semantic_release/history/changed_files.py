@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from semantic_release.globals import logger
+from semantic_release.history.loader import start_git_log
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable, Mapping, Sequence
+
+    from git.objects.commit import Commit
+    from git.repo.base import Repo
+
+
+# Marks the start of a commit record in the stream, file names follow it
+_RECORD_MARKER = b"\x01"
+
+_READ_CHUNK_SIZE = 1 << 16
+
+
+class ChangedFilesIndex:
+    """
+    An index of the files changed by each commit of a revision range.
+
+    The changed paths of every commit within the range are read from a single streamed
+    ``git log --name-only`` invocation (on the first lookup) and memoized per commit sha,
+    so that parsers (ie. the monorepo parser) can look up the changed files of a commit
+    in O(1) instead of spawning a ``git diff`` per commit.
+
+    Paths are relative to the root of the repository (posix style) and are compared to
+    the first parent of the commit (or the empty tree for root commits), which matches
+    the file list of GitPython's ``commit.stats.files``. Commits outside of the indexed
+    range fall back to ``commit.stats.files``.
+
+    The ``changed_files`` (by commit sha) can also be given upfront, ie. the changed
+    files sent to a worker process along with the commits it parses, in which case
+    nothing is read from git.
+
+    A narrower range can be requested with :meth:`include` so that only the commits
+    that are actually parsed (ie. the commits since the last release) are indexed; the
+    whole range is then only indexed when a commit outside of it is looked up.
+
+    The optional ``timing_callback`` is called with the name of the phase
+    (``git_changed_files``) & the duration (in seconds) of each ``git log`` invocation
+    of the index, see
+    :py:class:`semantic_release.history.instrumentation.ParserInstrumentation`.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        revisions: Sequence[str] = ("HEAD",),
+        changed_files: Mapping[str, Sequence[str]] | None = None,
+    ) -> None:
+        self._repo = repo
+        self._revisions = tuple(revisions)
+        self._changed_files: dict[str, tuple[str, ...]] = {
+            sha: tuple(files) for sha, files in (changed_files or {}).items()
+        }
+        self._pending_revisions: list[tuple[str, ...]] = []
+        # Given changed files are the whole index, nothing is read from git
+        self._loaded = changed_files is not None
+        self.timing_callback: Callable[[str, float], None] | None = None
+
+    def __contains__(self, sha: object) -> bool:
+        return sha in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def include(self, revisions: Sequence[str]) -> None:
+        """
+        Index the given (narrower) revision range on the next lookup instead of the
+        whole range of the index, ie. the commits since the last release.
+        """
+        if not self._loaded:
+            self._pending_revisions.append(tuple(revisions))
+
+    def get_changed_files(self, commit: Commit) -> tuple[str, ...]:
+        """Return the paths of the files changed by the given commit."""
+        while self._pending_revisions:
+            self._index(self._pending_revisions.pop(0))
+
+        if (files := self._changed_files.get(commit.hexsha)) is not None:
+            return files
+
+        if (files := self._load().get(commit.hexsha)) is not None:
+            return files
+
+        logger.debug(
+            "commit %s is outside of the changed files index, reading its stats",
+            commit.hexsha[:7],
+        )
+        files = tuple(str(path) for path in commit.stats.files)
+        self._changed_files[commit.hexsha] = files
+        return files
+
+    def _load(self) -> dict[str, tuple[str, ...]]:
+        if not self._loaded:
+            self._pending_revisions.clear()
+            self._index(self._revisions)
+            self._loaded = True
+
+        return self._changed_files
+
+    def _index(self, revisions: Sequence[str]) -> None:
+        options = [
+            "-z",
+            # List merge commits once, with their diff against the first parent
+            "--diff-merges=first-parent",
+            "--no-color",
+            "--no-renames",
+            "--name-only",
+            f"--format={_RECORD_MARKER.decode()}%H",
+        ]
+        num_commits = len(self._changed_files)
+        start = perf_counter()
+        process = start_git_log(self._repo, options, revisions)
+        try:
+            current_sha: str | None = None
+            current_files: list[str] = []
+            buffer = b""
+            while chunk := process.stdout.read(_READ_CHUNK_SIZE):
+                *tokens, buffer = (buffer + chunk).split(b"\0")
+                for token in tokens:
+                    # File lists are separated from the record header by a newline
+                    token = token.lstrip(b"\n")  # noqa: PLW2901
+                    if not token.startswith(_RECORD_MARKER):
+                        if token:
+                            current_files.append(
+                                token.decode("utf-8", "surrogateescape")
+                            )
+                        continue
+
+                    self._store(current_sha, current_files)
+                    current_sha = token[1:].decode()
+                    current_files = []
+
+            self._store(current_sha, current_files)
+
+        finally:
+            process.stdout.close()
+
+        # Raises a GitCommandError if git failed
+        process.wait()
+        if self.timing_callback is not None:
+            self.timing_callback("git_changed_files", perf_counter() - start)
+
+        logger.debug(
+            "indexed the changed files of %s commits",
+            len(self._changed_files) - num_commits,
+        )
+
+    def _store(self, sha: str | None, files: list[str]) -> None:
+        if sha is None:
+            return
+
+        # A commit is indexed once even when it is within several included ranges
+        self._changed_files.setdefault(sha, tuple(files))
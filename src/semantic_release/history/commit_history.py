@@ -0,0 +1,470 @@
+from __future__ import annotations
+
+from copy import copy
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from semantic_release.commit_parser.record import CommitRecord
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.commit_parser.util import force_str
+from semantic_release.globals import logger
+from semantic_release.helpers import validate_types_in_sequence
+from semantic_release.history.changed_files import ChangedFilesIndex
+from semantic_release.history.graph import CommitGraph
+from semantic_release.history.loader import iter_commit_records
+from semantic_release.history.parallel import parse_in_parallel
+from semantic_release.history.tags import TagIndex
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable, Collection, Sequence
+
+    from git.objects.commit import Commit
+    from git.repo.base import Repo
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+    from semantic_release.history.parallel import ParseCallback
+    from semantic_release.history.parse_cache import ParseResultCache
+
+
+class CommitHistory:
+    """
+    A single-pass view of the commit history reachable from ``head``.
+
+    The commit history is streamed from the repository once (via a single ``git log``
+    invocation, see :func:`semantic_release.history.loader.iter_commit_records`) and every
+    commit is parsed at most once by the configured commit parser. The same instance
+    can then be shared between the version calculation
+    (:func:`semantic_release.version.algorithm.next_version`) and the changelog
+    history (:meth:`semantic_release.changelog.release_history.ReleaseHistory.from_git_history`)
+    so that a single run does not walk & parse the same history multiple times.
+
+    The changed files of all commits in the history are indexed lazily (in a single
+    pass) and provided to the commit parser through its ``changed_files_provider``.
+    Likewise, the tags of the repository are indexed once in the shared ``tag_index``.
+
+    Commits are held as compact :py:class:`CommitRecord` objects (rather than GitPython
+    commit objects which reference their whole ancestry) & the parse results reference
+    the same records, see :meth:`parse`.
+
+    When a ``parse_cache`` is provided, parse results are also looked up in (and added
+    to) the persistent parse result cache so that subsequent runs only need to parse the
+    commits that were made since the last run.
+
+    Optional callbacks report the time spent in the history, see
+    :py:class:`semantic_release.history.instrumentation.ParserInstrumentation`. The
+    ``timing_callback`` is called with the name of the phase (``git_log``) & the
+    duration (in seconds) of each ``git log`` invocation that loads commits, and the
+    ``parse_callback`` is called with the sha, the parse duration & the results of
+    each commit parsed by the commit parser.
+    """
+
+    def __init__(
+        self,
+        repo: Repo,
+        commit_parser: CommitParser[ParseResult, ParserOptions],
+        head: str = "HEAD",
+        parse_cache: ParseResultCache | None = None,
+        tag_index: TagIndex | None = None,
+        parse_jobs: int = 1,
+    ) -> None:
+        self._repo = repo
+        self._commit_parser = commit_parser
+        self._head = head
+        self._parse_cache = parse_cache
+        self._tag_index = tag_index if tag_index is not None else TagIndex(repo)
+        self._parse_jobs = parse_jobs
+        self._changed_files = ChangedFilesIndex(repo, [head])
+        self._graph: CommitGraph | None = None
+        self._records: dict[str, CommitRecord] = {}
+        self._parse_results: dict[str, list[ParseResult]] = {}
+        self._merged_tag_names: set[str] | None = None
+        self.timing_callback: Callable[[str, float], None] | None = None
+        self.parse_callback: ParseCallback | None = None
+
+    @property
+    def repo(self) -> Repo:
+        return self._repo
+
+    @property
+    def commit_parser(self) -> CommitParser[ParseResult, ParserOptions]:
+        return self._commit_parser
+
+    @commit_parser.setter
+    def commit_parser(
+        self, commit_parser: CommitParser[ParseResult, ParserOptions]
+    ) -> None:
+        # The parse results (& the persistent parse cache) belong to the previous parser
+        self._commit_parser = commit_parser
+        self._parse_results = {}
+        self._parse_cache = None
+
+    @property
+    def tag_index(self) -> TagIndex:
+        return self._tag_index
+
+    @property
+    def changed_files(self) -> ChangedFilesIndex:
+        return self._changed_files
+
+    def with_commit_parser(
+        self, commit_parser: CommitParser[ParseResult, ParserOptions]
+    ) -> CommitHistory:
+        """
+        Return a view of the same history that is parsed with another commit parser.
+
+        The view shares the commits of the whole history (which are loaded first), the
+        index of changed files and the tag index with this history, only the parse
+        results are separate as they depend on the commit parser.
+        """
+        # Load the commits & merged tags first, so that the copy shares them
+        self._load_graph()
+        self.merged_tag_names()
+
+        history = copy(self)
+        history.commit_parser = commit_parser
+        return history
+
+    @property
+    def head_commit(self) -> CommitRecord:
+        graph = self._load_graph()
+        return self.get_commit(graph.sha_of(graph.load_order()[0]))
+
+    def _load_graph(self) -> CommitGraph:
+        if self._graph is not None:
+            return self._graph
+
+        logger.debug("loading commit history reachable from %s", self._head)
+        self._graph = self._stream_graph([self._head], topo_order=True)
+        logger.debug("loaded %s commits into the commit graph", len(self._graph))
+        return self._graph
+
+    def _stream_graph(self, revisions: Sequence[str], topo_order: bool) -> CommitGraph:
+        graph = CommitGraph()
+        start = perf_counter()
+
+        # All commits are streamed (fully populated) from a single git invocation
+        for streamed_record in iter_commit_records(
+            self._repo, revisions, topo_order=topo_order
+        ):
+            record = self._records.setdefault(streamed_record.hexsha, streamed_record)
+            graph.add(record.hexsha, record.parent_shas)
+
+        if self.timing_callback is not None:
+            self.timing_callback("git_log", perf_counter() - start)
+
+        return graph
+
+    def get_commit(self, sha: str) -> CommitRecord:
+        """
+        Return the (memoized) record of the commit with the given sha. The full commit
+        object is only created when required, see :attr:`CommitRecord.commit`.
+        """
+        if (record := self._records.get(sha)) is not None:
+            return record
+
+        # Not part of the loaded history of head, read the commit from the repository
+        return self._records.setdefault(
+            sha, CommitRecord.from_commit(self._repo.commit(sha))
+        )
+
+    def reachable_shas(self) -> set[str]:
+        """Return the set of all commit shas reachable from ``head``."""
+        graph = self._load_graph()
+        return {graph.sha_of(node) for node in graph.load_order()}
+
+    def topo_ordered_commits(self) -> Sequence[CommitRecord]:
+        """
+        Return every commit reachable from ``head`` in the same order as
+        ``git rev-list --topo-order``.
+        """
+        graph = self._load_graph()
+        return [self.get_commit(graph.sha_of(node)) for node in graph.load_order()]
+
+    def topo_ordered_commits_until(
+        self, boundaries: Collection[str]
+    ) -> Sequence[CommitRecord]:
+        """
+        Return the commits reachable from ``head`` up to (and including) the given
+        boundary commits in the same order as ``git rev-list --topo-order``. The
+        ancestors of the boundary commits are omitted.
+
+        Unless the whole history is already loaded, only the commits of the bounded
+        range are read from the repository.
+        """
+        if not boundaries:
+            return self.topo_ordered_commits()
+
+        if self._graph is None:
+            graph = self._load_bounded_range(boundaries)
+            return [self.get_commit(graph.sha_of(node)) for node in graph.load_order()]
+
+        # The whole history is already loaded, resolve the ancestors in memory
+        graph = self._graph
+        stop = graph.reachable(
+            *(
+                parent
+                for sha in boundaries
+                if (node := graph.id_of(sha)) is not None
+                for parent in graph.parents(node)
+            )
+        )
+        return [
+            self.get_commit(graph.sha_of(node))
+            for node in graph.load_order()
+            if not stop[node]
+        ]
+
+    def merged_tag_names(self) -> set[str]:
+        """
+        Return the names of all tags which point (directly or through an annotated tag)
+        to a commit that is reachable from ``head``.
+
+        When the whole history is already loaded, the commits of the tags are looked up
+        in the commit graph, otherwise git resolves the tags merged into ``head``.
+        """
+        if self._merged_tag_names is not None:
+            return self._merged_tag_names
+
+        if (graph := self._graph) is not None:
+            self._merged_tag_names = {
+                tag_info.name
+                for tag_info in self._tag_index.infos()
+                if tag_info.commit_sha is not None
+                and (node := graph.id_of(tag_info.commit_sha)) is not None
+                and graph.is_loaded(node)
+            }
+        else:
+            self._merged_tag_names = set(
+                self._repo.git.for_each_ref(
+                    f"--merged={self._head}",
+                    "--format=%(refname:strip=2)",
+                    "refs/tags",
+                ).splitlines()
+            )
+
+        return self._merged_tag_names
+
+    def commits_since(self, rev: str = "") -> Sequence[CommitRecord]:
+        """
+        Return all the commits reachable from ``head`` which are not reachable from
+        ``rev`` (all commits if ``rev`` is empty).
+
+        Only the commits of the ``rev..head`` range are read from the repository so the
+        cost scales with the number of commits since ``rev`` rather than with the size
+        of the whole history.
+
+        The commits are returned in depth-first order where the rightmost parent of a
+        merge is visited first as the left side is generally the merged into branch.
+        """
+        stop = None
+        if not rev:
+            graph = self._load_graph()
+            start_sha = graph.sha_of(graph.load_order()[0])
+        elif self._graph is not None and (
+            (rev_node := self._graph.id_of(self._repo.commit(rev).hexsha)) is not None
+        ):
+            # The whole history is already loaded, resolve the stop nodes in memory
+            graph = self._graph
+            start_sha = graph.sha_of(graph.load_order()[0])
+            stop = graph.reachable(rev_node)
+        else:
+            graph = self._load_range(rev)
+            start_sha = self._repo.commit(self._head).hexsha
+
+        if (start := graph.id_of(start_sha)) is None:
+            return []
+
+        # Commits outside of the loaded range are reachable from rev and act as stop nodes
+        return [self.get_commit(graph.sha_of(node)) for node in graph.dfs(start, stop)]
+
+    def _load_range(self, rev: str) -> CommitGraph:
+        revisions = [self._head, f"^{rev}"]
+        logger.debug("loading commits of the range %s..%s", rev, self._head)
+
+        # Parse lookups of the changed files only need to cover the same range
+        self._changed_files.include(revisions)
+
+        # Commit records are shared with the full graph (if it is ever loaded)
+        return self._stream_graph(revisions, topo_order=False)
+
+    def _load_bounded_range(self, boundaries: Collection[str]) -> CommitGraph:
+        # Exclude the parents of each boundary commit (but not the commit itself)
+        revisions = [self._head, *(f"^{sha}^@" for sha in sorted(boundaries))]
+        logger.debug(
+            "loading commits of %s up to %s boundary commits",
+            self._head,
+            len(boundaries),
+        )
+
+        # Parse lookups of the changed files only need to cover the same range
+        self._changed_files.include(revisions)
+
+        return self._stream_graph(revisions, topo_order=True)
+
+    def parse_all(
+        self, commits: Sequence[Commit | CommitRecord]
+    ) -> list[list[ParseResult]]:
+        """
+        Parse all of the given commits and return their results in the same order.
+
+        The commits which are neither memoized nor cached are parsed as a single batch
+        with :meth:`CommitParser.parse_many`. When ``parse_jobs`` is greater than 1,
+        they are parsed by a pool of worker processes first (see
+        :func:`semantic_release.history.parallel.parse_in_parallel`). Any commit that
+        could not be parsed in parallel is parsed serially, so the results are always
+        the same as parsing each commit with :meth:`parse`.
+
+        :raises TypeError: when the commit parser returns an unexpected type
+        :raises ValueError: when the commit parser returns a result of another commit
+        """
+        unparsed: dict[str, Commit | CommitRecord] = {}
+        for commit in commits:
+            if commit.hexsha in self._parse_results or commit.hexsha in unparsed:
+                continue
+
+            if self._parse_cache is not None and (
+                (cached := self._parse_cache.get(commit)) is not None
+            ):
+                self._parse_results[commit.hexsha] = self._compact(commit, cached)
+                continue
+
+            unparsed[commit.hexsha] = commit
+
+        if unparsed and self._parse_jobs > 1:
+            parallel_results = parse_in_parallel(
+                repo=self._repo,
+                commit_parser=self._commit_parser,
+                commits=list(unparsed.values()),
+                jobs=self._parse_jobs,
+                changed_files=self._changed_files,
+                parse_callback=self.parse_callback,
+            )
+            for sha, results in parallel_results.items():
+                if self._parse_cache is not None:
+                    self._parse_cache.put(unparsed[sha], results)
+                self._parse_results[sha] = self._compact(unparsed.pop(sha), results)
+
+        if unparsed:
+            self._parse_batch(list(unparsed.values()))
+
+        return [self.parse(commit) for commit in commits]
+
+    def _parse_batch(self, commits: Sequence[Commit | CommitRecord]) -> None:
+        # Share the single-pass index of changed files with the parser
+        self._commit_parser.changed_files_provider = self._changed_files
+
+        batch_results: dict[str, list[ParseResult]] = {
+            commit.hexsha: [] for commit in commits
+        }
+        parse_times = dict.fromkeys(batch_results, 0.0)
+        start = perf_counter()
+        for result in self._commit_parser.parse_many(
+            commit.to_commit() if isinstance(commit, CommitRecord) else commit
+            for commit in commits
+        ):
+            # Validation type check for the parser results (important because of possible custom parsers)
+            if not isinstance(result, (ParseError, ParsedCommit)):
+                raise TypeError("Unexpected type returned from commit_parser.parse")
+
+            if (results := batch_results.get(result.commit.hexsha)) is None:
+                raise ValueError(
+                    f"Unexpected parse result of commit {result.commit.hexsha} returned "
+                    "from commit_parser.parse_many, which is not one of the parsed commits"
+                )
+
+            results.append(result)
+
+            # The time until each result is attributed to the commit of the result
+            parse_times[result.commit.hexsha] += perf_counter() - start
+            start = perf_counter()
+
+        for commit in commits:
+            results = batch_results[commit.hexsha]
+            if self.parse_callback is not None:
+                self.parse_callback(commit.hexsha, parse_times[commit.hexsha], results)
+            if self._parse_cache is not None:
+                self._parse_cache.put(commit, results)
+            self._parse_results[commit.hexsha] = self._compact(commit, results)
+
+    def parse(self, commit: Commit | CommitRecord) -> list[ParseResult]:
+        """
+        Parse the given commit with the configured commit parser. The result is
+        memoized per commit sha so each commit is parsed at most once.
+
+        The commit parser is given a (transient) full commit object & the memoized
+        results reference a compact :py:class:`CommitRecord` of the commit instead.
+
+        :raises TypeError: when the commit parser returns an unexpected type
+        """
+        if (memoized := self._parse_results.get(commit.hexsha)) is not None:
+            return memoized
+
+        if self._parse_cache is not None and (
+            (cached := self._parse_cache.get(commit)) is not None
+        ):
+            memoized = self._compact(commit, cached)
+            self._parse_results[commit.hexsha] = memoized
+            return memoized
+
+        # Share the single-pass index of changed files with the parser
+        self._commit_parser.changed_files_provider = self._changed_files
+
+        # returns a ParseResult or list of ParseResult objects,
+        # it is usually one, but we split a commit if a squashed merge is detected
+        start = perf_counter()
+        parse_results = self._commit_parser.parse(
+            commit.to_commit() if isinstance(commit, CommitRecord) else commit
+        )
+        parse_time = perf_counter() - start
+
+        results: list[ParseResult]
+        if isinstance(parse_results, (ParseError, ParsedCommit)):
+            results = [parse_results]
+        elif isinstance(parse_results, list) or type(parse_results) == tuple:
+            results = list(parse_results)
+        else:
+            raise TypeError("Unexpected type returned from commit_parser.parse")
+
+        # Validation type check for the parser results (important because of possible custom parsers)
+        if not validate_types_in_sequence(results, (ParseError, ParsedCommit)):
+            raise TypeError("Unexpected type returned from commit_parser.parse")
+
+        if self.parse_callback is not None:
+            self.parse_callback(commit.hexsha, parse_time, results)
+
+        if self._parse_cache is not None:
+            self._parse_cache.put(commit, results)
+
+        results = self._compact(commit, results)
+        self._parse_results[commit.hexsha] = results
+        return results
+
+    def _compact(
+        self, commit: Commit | CommitRecord, results: list[ParseResult]
+    ) -> list[ParseResult]:
+        # Drop the references to the full commit objects (& their ancestry), the
+        # results of the commit itself share the record of the loaded history
+        record = (
+            commit
+            if isinstance(commit, CommitRecord)
+            else self._records.get(commit.hexsha)
+        )
+        if record is None:
+            return [result.compact() for result in results]
+
+        return [
+            result._replace(
+                commit=(
+                    record
+                    if (message := force_str(result.commit.message)) == record.message
+                    else record.with_message(message)
+                )
+            )
+            if result.commit.hexsha == record.hexsha
+            else result.compact()
+            for result in results
+        ]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable, Sequence
+
+
+class CommitGraph:
+    """
+    A compact, append-only representation of a commit DAG.
+
+    Every commit sha is interned to a small integer node id on first sight (either as
+    a commit or as the parent of one). The parent adjacency of the loaded commits is
+    kept in compressed sparse row form (flat ``array`` objects) so that traversals and
+    reachability queries only operate on plain integers, regardless of the size of the
+    history.
+
+    Nodes that are only known as the parent of a loaded commit (ie. the commits just
+    outside of a loaded revision range) have no parent record and act as the boundary
+    of every traversal.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._shas: list[str] = []
+        # Record index of each node id (-1 when the commit itself was not loaded)
+        self._record_of = array("q")
+        # Node ids in load order & the offsets of their parents within the edges
+        self._records = array("q")
+        self._offsets = array("q", [0])
+        self._edges = array("q")
+
+    def __contains__(self, sha: object) -> bool:
+        node = self._ids.get(sha) if isinstance(sha, str) else None
+        return node is not None and self._record_of[node] >= 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def intern(self, sha: str) -> int:
+        """Return the node id of the given sha, assigning a new one if required."""
+        if (node := self._ids.get(sha)) is None:
+            node = len(self._shas)
+            self._ids[sha] = node
+            self._shas.append(sha)
+            self._record_of.append(-1)
+        return node
+
+    def add(self, sha: str, parent_shas: Iterable[str]) -> int:
+        """
+        Add a loaded commit & its parents (in order) to the graph and return its node
+        id. Adding the same commit again is a no-op.
+        """
+        node = self.intern(sha)
+        if self._record_of[node] >= 0:
+            return node
+
+        self._edges.extend(self.intern(parent_sha) for parent_sha in parent_shas)
+        self._record_of[node] = len(self._records)
+        self._records.append(node)
+        self._offsets.append(len(self._edges))
+        return node
+
+    def id_of(self, sha: str) -> int | None:
+        return self._ids.get(sha)
+
+    def sha_of(self, node: int) -> str:
+        return self._shas[node]
+
+    def is_loaded(self, node: int) -> bool:
+        """Return whether the commit of the node was loaded (ie. not a boundary node)."""
+        return self._record_of[node] >= 0
+
+    def parents(self, node: int) -> Sequence[int]:
+        """Return the node ids of the parents of a loaded commit (empty otherwise)."""
+        if (record := self._record_of[node]) < 0:
+            return ()
+        return self._edges[self._offsets[record] : self._offsets[record + 1]]
+
+    def load_order(self) -> Sequence[int]:
+        """Return the node ids of all loaded commits in the order they were added."""
+        return self._records
+
+    def dfs(self, start: int, stop: bytearray | None = None) -> list[int]:
+        """
+        Return the node ids of the loaded commits reachable from ``start`` (inclusive)
+        in depth-first order, where the rightmost parent of a merge is visited first as
+        the left side is generally the merged into branch.
+
+        Nodes flagged in the ``stop`` mask (see :meth:`reachable`) are not traversed.
+        """
+        visited = bytearray(len(self._shas))
+        if stop is not None:
+            visited[: len(stop)] = stop[: len(visited)]
+
+        order: list[int] = []
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if visited[node] or self._record_of[node] < 0:
+                continue
+
+            visited[node] = 1
+            order.append(node)
+
+            # Add all parents to the stack from left to right so the rightmost is popped first
+            stack.extend(self.parents(node))
+
+        return order
+
+    def reachable(self, *starts: int) -> bytearray:
+        """
+        Return a mask (indexed by node id) of all the nodes reachable from any of the
+        ``starts``, including the ``starts`` themselves and the boundary nodes of the
+        loaded graph.
+        """
+        mask = bytearray(len(self._shas))
+        stack = list(starts)
+        while stack:
+            node = stack.pop()
+            if mask[node]:
+                continue
+
+            mask[node] = 1
+            stack.extend(self.parents(node))
+
+        return mask
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import heapq
+import json
+import sys
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from types import TracebackType
+    from typing import Any, Callable
+
+    from typing_extensions import Self
+
+    from semantic_release.commit_parser import ParseResult
+    from semantic_release.history.commit_history import CommitHistory
+
+
+DEFAULT_SLOWEST_COMMITS = 10
+
+# The phases of parsing that are timed, by the name of the method of the commit parser
+# that implements them
+PARSER_PHASES = {
+    "parse_message": "parse_message",
+    "unsquash_commit": "unsquash_commit",
+    "_has_relevant_changed_files": "changed_files",
+}
+
+
+class _TimedMethod:
+    """
+    A timed method of an instrumented commit parser.
+
+    It is pickled as the plain method of the parser, so that the parser can still be
+    sent to the worker processes of parallel parsing (where the phase is not timed).
+    """
+
+    def __init__(self, obj: object, method_name: str, timings: list[float]) -> None:
+        self.obj = obj
+        self.method_name = method_name
+        self.method: Callable[..., Any] = getattr(obj, method_name)
+        self.timings = timings
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        start = perf_counter()
+        try:
+            return self.method(*args, **kwargs)
+        finally:
+            self.timings[0] += 1
+            self.timings[1] += perf_counter() - start
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return getattr, (self.obj, self.method_name)
+
+
+class ParserInstrumentation:
+    """
+    Opt-in instrumentation of the commit parser of a :py:class:`CommitHistory`.
+
+    The time it took to parse each commit is recorded per commit, along with the
+    number of :py:class:`ParsedCommit` & :py:class:`ParseError` results and of the
+    commits that were split into several commits (squashed commits). The time spent in
+    each phase of parsing (matching the commit message, splitting squashed commits,
+    looking up the changed files of monorepo commits) & in the git I/O of loading the
+    history is recorded separately, each phase includes the time of any nested calls.
+
+    The commits & the git I/O are recorded through the timing callbacks of the
+    :py:class:`CommitHistory` & its :py:class:`ChangedFilesIndex`. The phases of
+    parsing are only recorded for the commits parsed in this process, not for the
+    commits parsed by worker processes (see ``commit_parser_jobs``). Commits that are
+    found in the parse result cache are not recorded. The report is written as JSON
+    when leaving the context (to ``output`` or to stderr).
+    """
+
+    def __init__(
+        self,
+        slowest_commits: int = DEFAULT_SLOWEST_COMMITS,
+        output: Path | None = None,
+    ) -> None:
+        self.slowest_commits = slowest_commits
+        self.output = output
+        self.parsers: list[str] = []
+        self.commits = 0
+        self.parsed_commits = 0
+        self.parse_errors = 0
+        self.squashed_commits = 0
+        self.unsquashed_commits = 0
+        self.parse_time = 0.0
+        # phase to [number of calls, total duration]
+        self._phases: dict[str, list[float]] = {}
+        # min-heap of (duration, sha, number of results) of the slowest commits
+        self._slowest: list[tuple[float, str, int]] = []
+
+    def instrument(self, commit_history: CommitHistory) -> CommitHistory:
+        """Time the commit parser & the history loading of the given commit history."""
+        commit_parser = commit_history.commit_parser
+        if type(commit_parser).__qualname__ not in self.parsers:
+            self.parsers.append(type(commit_parser).__qualname__)
+
+        for method_name, phase in PARSER_PHASES.items():
+            self._time_parser_phase(commit_parser, method_name, phase)
+
+        commit_history.parse_callback = self.record_parse
+        # The git I/O of streaming the history & indexing the changed files
+        commit_history.timing_callback = self.record_phase
+        commit_history.changed_files.timing_callback = self.record_phase
+
+        return commit_history
+
+    def _time_parser_phase(
+        self, commit_parser: object, method_name: str, phase: str
+    ) -> None:
+        if method_name in vars(commit_parser) or not callable(
+            getattr(commit_parser, method_name, None)
+        ):
+            # Not implemented by the parser, or already timed (or customized)
+            return
+
+        timings = self._phases.setdefault(phase, [0, 0.0])
+        setattr(
+            commit_parser,
+            method_name,
+            _TimedMethod(commit_parser, method_name, timings),
+        )
+
+    def record_phase(self, phase: str, duration: float) -> None:
+        """Record a call of the given phase which took ``duration`` seconds."""
+        timings = self._phases.setdefault(phase, [0, 0.0])
+        timings[0] += 1
+        timings[1] += duration
+
+    def record_parse(
+        self,
+        sha: str,
+        duration: float,
+        results: ParseResult | list[ParseResult],
+    ) -> None:
+        """Record the duration & the results of parsing the commit with ``sha``."""
+        # ParsedCommit & ParseError are tuples themselves
+        if isinstance(results, (ParsedCommit, ParseError)) or not isinstance(
+            results, (list, tuple)
+        ):
+            results = [results]
+
+        self.commits += 1
+        self.parse_time += duration
+        self.parsed_commits += sum(isinstance(r, ParsedCommit) for r in results)
+        self.parse_errors += sum(isinstance(r, ParseError) for r in results)
+        if len(results) > 1:
+            self.squashed_commits += 1
+            self.unsquashed_commits += len(results)
+
+        if self.slowest_commits < 1:
+            return
+
+        entry = (duration, sha, len(results))
+        if len(self._slowest) < self.slowest_commits:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def report(self) -> dict[str, Any]:
+        """Return the recorded statistics as a JSON serializable dictionary."""
+        return {
+            "parsers": self.parsers,
+            "commits": self.commits,
+            "parsed_commits": self.parsed_commits,
+            "parse_errors": self.parse_errors,
+            "squashed_commits": self.squashed_commits,
+            "unsquashed_commits": self.unsquashed_commits,
+            "parse_time": round(self.parse_time, 6),
+            "phases": {
+                phase: {"calls": int(calls), "time": round(duration, 6)}
+                for phase, (calls, duration) in self._phases.items()
+            },
+            "slowest_commits": [
+                {"sha": sha, "time": round(duration, 6), "results": num_results}
+                for duration, sha, num_results in sorted(self._slowest, reverse=True)
+            ],
+        }
+
+    def write_report(self) -> None:
+        """Write the report as JSON to the output file (or to stderr)."""
+        report = json.dumps(self.report(), indent=2)
+
+        if self.output is None:
+            sys.stderr.write(f"{report}\n")
+            return
+
+        try:
+            self.output.parent.mkdir(parents=True, exist_ok=True)
+            self.output.write_text(f"{report}\n", encoding="utf-8")
+        except OSError as err:
+            logger.warning(
+                "Unable to write the parser statistics to %s: %s", self.output, err
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.write_report()
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from subprocess import PIPE
+from typing import TYPE_CHECKING
+
+from git.objects.util import utctz_to_altz
+
+from semantic_release.commit_parser.record import CommitRecord
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Generator, Sequence
+
+    from git.cmd import Git
+    from git.repo.base import Repo
+
+
+# Fields of a single commit record, each separated by a NUL byte. The message is
+# intentionally last as it is the only field which may contain arbitrary text.
+_LOG_FIELDS = (
+    "%H",  # commit sha
+    "%P",  # parent shas (space separated)
+    "%T",  # tree sha
+    "%an",  # author name
+    "%ae",  # author email
+    "%ad",  # author date (raw: "<timestamp> <utc offset>")
+    "%cn",  # committer name
+    "%ce",  # committer email
+    "%cd",  # committer date (raw: "<timestamp> <utc offset>")
+    "%B",  # raw commit message
+)
+_LOG_FORMAT = str.join("%x00", _LOG_FIELDS)
+_NUM_FIELDS = len(_LOG_FIELDS)
+
+_READ_CHUNK_SIZE = 1 << 16
+
+# Beyond this number of revisions (ie. one exclusion per release boundary), the
+# revisions are passed to git through stdin so that the command line never exceeds
+# the limits of the OS (ie. 32k characters on Windows)
+_MAX_REVISION_ARGS = 64
+
+
+def _decode(value: bytes) -> str:
+    return value.decode("utf-8", errors="replace")
+
+
+def _parse_raw_date(value: bytes) -> tuple[int, int]:
+    timestamp, _, utc_offset = _decode(value).partition(" ")
+    return int(timestamp), utctz_to_altz(utc_offset or "+0000")
+
+
+def start_git_log(
+    repo: Repo, options: Sequence[str], revisions: Sequence[str]
+) -> Git.AutoInterrupt:
+    """
+    Start a ``git log`` process with the given options for the given revisions, whose
+    output is to be streamed from its ``stdout``.
+
+    Long lists of revisions are passed through stdin (``--stdin``) rather than as
+    arguments of the command.
+    """
+    if len(revisions) <= _MAX_REVISION_ARGS:
+        logger.debug(
+            "streaming: git log %s", str.join(" ", [*options, *revisions, "--"])
+        )
+        return repo.git.log(*options, *revisions, "--", as_process=True)
+
+    logger.debug(
+        "streaming: git log %s (with %s revisions from stdin)",
+        str.join(" ", [*options, "--stdin", "--"]),
+        len(revisions),
+    )
+    process = repo.git.log(*options, "--stdin", "--", as_process=True, istream=PIPE)
+    # git reads all of the revisions before it writes any output
+    with process.proc.stdin as stdin:
+        stdin.write(str.join("", [f"{revision}\n" for revision in revisions]).encode())
+
+    return process
+
+
+def iter_commit_records(
+    repo: Repo,
+    revisions: Sequence[str] = ("HEAD",),
+    topo_order: bool = True,
+) -> Generator[CommitRecord, None, None]:
+    """
+    Stream compact records of the commits of the given revision range (any arguments
+    accepted by ``git log``, ie. ``HEAD`` or ``v1.0.0..HEAD``) from a single ``git log``
+    invocation.
+
+    Every record holds the fields that are required by the commit parsers & the
+    changelog (sha, parents, tree, author, committer, dates and the raw message) so
+    that no further object reads are required by GitPython. Unlike commit objects, the
+    records do not reference each other (the parents are referenced by sha) so only
+    the records which are kept by the caller stay in memory.
+
+    As this is a generator, the underlying ``git log`` process is terminated when the
+    caller stops the iteration early.
+    """
+    # The authors, committers & shas (as parents of the next commits) are repeated
+    # across the commits, share a single string of each between the records
+    shared_values: dict[bytes, str] = {}
+
+    def shared(value: bytes) -> str:
+        if (text := shared_values.get(value)) is None:
+            text = shared_values[value] = _decode(value)
+        return text
+
+    def to_record(fields: list[bytes]) -> CommitRecord:
+        authored_date, author_tz_offset = _parse_raw_date(fields[5])
+        committed_date, committer_tz_offset = _parse_raw_date(fields[8])
+        return CommitRecord(
+            repo=repo,
+            hexsha=shared(fields[0]),
+            parent_shas=tuple(map(shared, fields[1].split())),
+            tree_sha=_decode(fields[2]),
+            author_name=shared(fields[3]),
+            author_email=shared(fields[4]),
+            authored_date=authored_date,
+            author_tz_offset=author_tz_offset,
+            committer_name=shared(fields[6]),
+            committer_email=shared(fields[7]),
+            committed_date=committed_date,
+            committer_tz_offset=committer_tz_offset,
+            message=_decode(fields[9]),
+        )
+
+    options = [
+        "-z",
+        "--no-color",
+        "--no-show-signature",
+        "--encoding=UTF-8",
+        "--date=raw",
+        f"--format={_LOG_FORMAT}",
+        *(["--topo-order"] if topo_order else []),
+    ]
+    process = start_git_log(repo, options, revisions)
+    completed = False
+    num_commits = 0
+    try:
+        buffer = b""
+        fields: list[bytes] = []
+        while chunk := process.stdout.read(_READ_CHUNK_SIZE):
+            *tokens, buffer = (buffer + chunk).split(b"\0")
+            for token in tokens:
+                fields.append(token)
+                if len(fields) == _NUM_FIELDS:
+                    num_commits += 1
+                    yield to_record(fields)
+                    fields = []
+
+        # The last record is not terminated by a NUL byte
+        if buffer or fields:
+            fields.append(buffer)
+            if len(fields) == _NUM_FIELDS:
+                num_commits += 1
+                yield to_record(fields)
+
+        completed = True
+
+    finally:
+        if not completed and process.proc is not None:
+            # Iteration was stopped early, stop git from producing any more output
+            process.proc.kill()
+            process.proc.wait()
+        process.stdout.close()
+
+    # Raises a GitCommandError if git failed
+    process.wait()
+    logger.debug("streamed %s commits", num_commits)
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from git.repo.base import Repo
+
+from semantic_release.commit_parser.record import CommitRecord
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.globals import logger
+from semantic_release.history.changed_files import ChangedFilesIndex
+from semantic_release.history.parse_cache import (
+    deserialize_parse_results,
+    serialize_parse_results,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Callable, List, Optional, Sequence, Tuple
+
+    from git.objects.commit import Commit
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+
+    # The fields of a CommitRecord: sha, parent shas, tree sha,
+    # author (name, email, date, tz offset), committer (name, email, date, tz offset),
+    # message
+    CommitFields = Tuple[
+        str,
+        Tuple[str, ...],
+        str,
+        str,
+        str,
+        int,
+        int,
+        str,
+        str,
+        int,
+        int,
+        str,
+    ]
+
+    # The fields of a commit & its changed files (if the parser looks them up)
+    CommitPayload = Tuple[CommitFields, Optional[Tuple[str, ...]]]
+
+    # Called with the sha, the parse duration (in seconds) & the results of a commit
+    ParseCallback = Callable[[str, float, List[ParseResult]], None]
+
+
+# Below this number of commits, starting the worker processes costs more than it saves
+PARALLEL_PARSE_MIN_COMMITS = 256
+
+# Number of chunks per worker, small enough to keep all workers busy until the end
+_CHUNKS_PER_WORKER = 4
+_MIN_CHUNK_SIZE = 32
+
+# The commit parser & repository of the worker process, set by the pool initializer
+_worker_parser: CommitParser[ParseResult, ParserOptions] | None = None
+_worker_repo: Repo | None = None
+
+
+def _to_fields(commit: Commit | CommitRecord) -> CommitFields:
+    record = CommitRecord.from_commit(commit)
+    return (
+        record.hexsha,
+        record.parent_shas,
+        record.tree_sha,
+        record.author_name,
+        record.author_email,
+        record.authored_date,
+        record.author_tz_offset,
+        record.committer_name,
+        record.committer_email,
+        record.committed_date,
+        record.committer_tz_offset,
+        record.message,
+    )
+
+
+def _init_worker(parser_payload: bytes, repo_dir: str) -> None:
+    global _worker_parser, _worker_repo  # noqa: PLW0603
+
+    _worker_repo = Repo(repo_dir)
+    _worker_parser = pickle.loads(parser_payload)  # noqa: S301 (created by the parent)
+
+
+def _parse_chunk(chunk: list[CommitPayload]) -> list[tuple[str | None, float]]:
+    if _worker_parser is None or _worker_repo is None:
+        raise RuntimeError("Worker process was not initialized")
+
+    # The changed files of the chunk are looked up in the index of the parent process
+    _worker_parser.changed_files_provider = ChangedFilesIndex(
+        _worker_repo,
+        changed_files={
+            fields[0]: changed_files
+            for fields, changed_files in chunk
+            if changed_files is not None
+        },
+    )
+
+    payloads: list[tuple[str | None, float]] = []
+    for fields, _ in chunk:
+        commit = CommitRecord(_worker_repo, *fields).to_commit()
+        start = perf_counter()
+        parse_results = _worker_parser.parse(commit)
+        duration = perf_counter() - start
+        # NOTE: the results themselves are (named) tuples
+        results = (
+            [parse_results]
+            if isinstance(parse_results, (ParseError, ParsedCommit))
+            else list(parse_results)
+        )
+
+        # Anything other than exact built-in results can't be restored in the parent
+        payloads.append(
+            (
+                serialize_parse_results(commit, results)
+                if all(type(result) in (ParsedCommit, ParseError) for result in results)
+                else None,
+                duration,
+            )
+        )
+
+    return payloads
+
+
+def _pickle_parser(
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+) -> bytes | None:
+    # The changed files provider is bound to the repository of this process. It is
+    # detached from the parser itself (rather than from a copy), so that any methods
+    # bound to the parser (ie. the timed methods of the parser instrumentation) are
+    # pickled as methods of the same parser
+    changed_files_provider = commit_parser.changed_files_provider
+    commit_parser.changed_files_provider = None
+    try:
+        return pickle.dumps(commit_parser)
+    except (pickle.PicklingError, TypeError, AttributeError) as err:
+        logger.info(
+            "Commit parser %s can not be sent to worker processes: %s",
+            type(commit_parser).__qualname__,
+            err,
+        )
+        return None
+    finally:
+        commit_parser.changed_files_provider = changed_files_provider
+
+
+def parse_in_parallel(
+    repo: Repo,
+    commit_parser: CommitParser[ParseResult, ParserOptions],
+    commits: Sequence[Commit | CommitRecord],
+    jobs: int,
+    changed_files: ChangedFilesIndex | None = None,
+    parse_callback: ParseCallback | None = None,
+) -> dict[str, list[ParseResult]]:
+    """
+    Parse the given commits with a pool of ``jobs`` worker processes.
+
+    Commits are sent to the workers in chunks of plain fields (not GitPython objects),
+    parsed by a copy of the commit parser & the results are restored against the
+    original commit objects in the parent process. When the parser looks up the
+    changed files of the commits (``uses_changed_files``), they are read from the
+    given ``changed_files`` index of the parent process & sent along with each commit,
+    so that the changed files are indexed once rather than once per worker.
+
+    Parallel parsing is best effort: only parsers which opt in to the parse result
+    cache (``supports_result_cache``, i.e. their results solely depend on the commit)
+    and which can be pickled are run in parallel. The returned mapping (sha to results)
+    is empty when the parser is not supported or the pool fails, and it omits any
+    commit whose results could not be restored, so the caller must parse the missing
+    commits serially. This keeps the results identical to a serial run.
+
+    The optional ``parse_callback`` is called for each of the returned commits, with
+    the time it took a worker process to parse the commit.
+    """
+    if (workers := min(jobs, os.cpu_count() or 1)) < 2:
+        logger.debug(
+            "parallel commit parsing requires more than 1 CPU, parsing serially"
+        )
+        return {}
+
+    if len(commits) < PARALLEL_PARSE_MIN_COMMITS:
+        return {}
+
+    if not getattr(commit_parser, "supports_result_cache", False):
+        logger.info(
+            "Commit parser %s does not support parallel parsing, parsing serially",
+            type(commit_parser).__qualname__,
+        )
+        return {}
+
+    if (parser_payload := _pickle_parser(commit_parser)) is None:
+        return {}
+
+    repo_dir = str(repo.working_tree_dir or repo.git_dir)
+    # The changed files are only indexed when the parser looks them up
+    changed_files_index = (
+        changed_files if getattr(commit_parser, "uses_changed_files", False) else None
+    )
+    commit_payloads: list[CommitPayload] = [
+        (
+            _to_fields(commit),
+            changed_files_index.get_changed_files(commit)  # type: ignore[arg-type]
+            if changed_files_index is not None
+            else None,
+        )
+        for commit in commits
+    ]
+    chunk_size = max(
+        _MIN_CHUNK_SIZE, -(-len(commit_payloads) // (workers * _CHUNKS_PER_WORKER))
+    )
+    chunks = [
+        commit_payloads[start : start + chunk_size]
+        for start in range(0, len(commit_payloads), chunk_size)
+    ]
+
+    logger.info(
+        "parsing %s commits with %s worker processes (%s chunks)",
+        len(commit_payloads),
+        min(workers, len(chunks)),
+        len(chunks),
+    )
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(chunks)),
+            initializer=_init_worker,
+            initargs=(parser_payload, repo_dir),
+        ) as executor:
+            # map() yields the chunks in order, regardless of the order they complete
+            payloads = [
+                payload
+                for chunk_payloads in executor.map(_parse_chunk, chunks)
+                for payload in chunk_payloads
+            ]
+
+    except (BrokenProcessPool, OSError, pickle.PicklingError) as err:
+        logger.warning("Parallel commit parsing failed, parsing serially: %s", err)
+        return {}
+
+    except Exception as err:  # noqa: BLE001
+        # Let the serial parse raise the error (if any) in a deterministic order
+        logger.debug("Parallel commit parsing failed, parsing serially: %s", err)
+        return {}
+
+    parallel_results: dict[str, list[ParseResult]] = {}
+    for commit, (payload, duration) in zip(commits, payloads):
+        if payload is None:
+            continue
+
+        results = deserialize_parse_results(commit, payload)
+        if parse_callback is not None:
+            parse_callback(commit.hexsha, duration, results)
+        parallel_results[commit.hexsha] = results
+
+    return parallel_results
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.metadata
+import inspect
+import json
+import os
+import sqlite3
+import time
+from dataclasses import is_dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from semantic_release.commit_parser.record import CommitRecord
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.commit_parser.util import commit_message_view, force_str
+from semantic_release.enums import LevelBump
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from types import TracebackType
+    from typing import Any
+
+    from git.objects.commit import Commit
+    from typing_extensions import Self
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+
+
+# Bump whenever the stored payload layout changes
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = ".semantic_release_cache"
+DEFAULT_CACHE_MAX_ENTRIES = 100_000
+
+_CACHE_DB_FILENAME = "parse_results.sqlite3"
+
+
+def parser_fingerprint(
+    commit_parser: CommitParser[ParseResult, ParserOptions], repo_dir: Path
+) -> str:
+    """
+    Build a fingerprint of everything that can influence the results of the
+    given commit parser so that any change invalidates previously cached results.
+
+    This includes the parser class, its options, the version of python-semantic-release
+    (as the built-in parsers change with it), the working directory relative to the
+    repository (as path based options are relative to it) and, for any custom parser
+    code, the source of the modules that define the parser class hierarchy.
+    """
+    options = getattr(commit_parser, "options", None)
+    options_state = (
+        repr(options)
+        if is_dataclass(options) or not hasattr(options, "__dict__")
+        else repr((dict(options or {}), sorted(vars(options).items())))
+    )
+
+    custom_sources: list[str] = []
+    for cls in type(commit_parser).__mro__:
+        if cls.__module__.split(".", maxsplit=1)[0] in ("semantic_release", "abc"):
+            continue
+        if cls.__module__ in ("builtins", "typing"):
+            continue
+        try:
+            source_file = inspect.getsourcefile(cls)
+        except TypeError:
+            continue
+        if source_file and os.path.isfile(source_file):
+            custom_sources.append(
+                hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+            )
+
+    try:
+        psr_version = importlib.metadata.version("python-semantic-release")
+    except importlib.metadata.PackageNotFoundError:
+        psr_version = "unknown"
+
+    try:
+        rel_cwd = os.path.relpath(Path.cwd().resolve(), repo_dir.resolve())
+    except ValueError:
+        # Different drives on windows
+        rel_cwd = str(Path.cwd().resolve())
+
+    return hashlib.sha256(
+        json.dumps(
+            [
+                CACHE_FORMAT_VERSION,
+                psr_version,
+                f"{type(commit_parser).__module__}.{type(commit_parser).__qualname__}",
+                options_state,
+                custom_sources,
+                Path(rel_cwd).as_posix(),
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+
+
+def serialize_parse_results(
+    commit: Commit | CommitRecord, results: list[ParseResult]
+) -> str:
+    """
+    Serialize the parse results of a commit into a compact JSON payload, see
+    :func:`deserialize_parse_results`.
+    """
+
+    def serialize_result(result: ParseResult) -> list[Any]:
+        # Only store the message when the result refers to a piece of the commit
+        # (ie. a squashed commit) rather than the commit itself
+        message: str | None = force_str(result.commit.message)
+        if result.commit is commit or message == force_str(commit.message):
+            message = None
+
+        if isinstance(result, ParseError):
+            return ["e", result.error, message]
+
+        return [
+            "c",
+            int(result.bump),
+            result.type,
+            result.scope,
+            list(result.descriptions),
+            list(result.breaking_descriptions),
+            list(result.release_notices),
+            list(result.linked_issues),
+            result.linked_merge_request,
+            result.include_in_changelog,
+            message,
+        ]
+
+    return json.dumps(
+        [serialize_result(result) for result in results],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def deserialize_parse_results(
+    commit: Commit | CommitRecord, payload: str
+) -> list[ParseResult]:
+    """
+    Restore the parse results of a commit from a payload created by
+    :func:`serialize_parse_results`. Pieces of a squashed commit are restored as copies
+    of the given commit with their own message.
+    """
+
+    def result_commit(message: str | None) -> Commit | CommitRecord:
+        if message is None:
+            return commit
+        if isinstance(commit, CommitRecord):
+            return commit.with_message(message)
+        return commit_message_view(commit, message)
+
+    results: list[ParseResult] = []
+    for entry in json.loads(payload):
+        if entry[0] == "e":
+            results.append(ParseError(commit=result_commit(entry[2]), error=entry[1]))
+            continue
+
+        if entry[0] != "c":
+            raise ValueError(f"Unknown cache entry type {entry[0]!r}")
+
+        results.append(
+            ParsedCommit(
+                bump=LevelBump(entry[1]),
+                type=entry[2],
+                scope=entry[3],
+                descriptions=entry[4],
+                breaking_descriptions=entry[5],
+                commit=result_commit(entry[10]),
+                release_notices=tuple(entry[6]),
+                linked_issues=tuple(entry[7]),
+                linked_merge_request=entry[8],
+                include_in_changelog=entry[9],
+            )
+        )
+
+    return results
+
+
+class ParseResultCache:
+    """
+    A persistent on-disk cache of commit parser results, keyed by commit sha and
+    a fingerprint of the parser configuration (see :func:`parser_fingerprint`).
+
+    The cache is stored as a single SQLite database inside ``directory`` so it can be
+    persisted between runs (ie. restored as a cache artifact in CI). Results are stored
+    as compact JSON payloads and the least recently used entries are evicted once the
+    cache grows beyond ``max_entries``.
+
+    Only parsers that opt in via ``CommitParser.supports_result_cache`` are cached and
+    only results which are exactly :py:class:`ParsedCommit` or :py:class:`ParseError`
+    instances are stored. Any failure to read or write the cache is logged and the cache
+    is disabled for the rest of the run rather than failing the release.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        commit_parser: CommitParser[ParseResult, ParserOptions],
+        repo_dir: Path,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self._commit_parser = commit_parser
+        self._repo_dir = repo_dir
+        self._fingerprint: str | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._disabled = not getattr(commit_parser, "supports_result_cache", False)
+        self._pending: dict[str, str] = {}
+        self._used: set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+        if self._disabled:
+            logger.warning(
+                "Commit parser %s does not support the parse result cache, caching disabled",
+                type(commit_parser).__qualname__,
+            )
+
+    @property
+    def db_file(self) -> Path:
+        return self.directory / _CACHE_DB_FILENAME
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = parser_fingerprint(self._commit_parser, self._repo_dir)
+        return self._fingerprint
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.save()
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self._disabled:
+            return None
+
+        if self._connection is not None:
+            return self._connection
+
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            if not (gitignore := self.directory / ".gitignore").exists():
+                # Never let the cache end up in a release commit
+                gitignore.write_text(
+                    "# Created by python-semantic-release automatically.\n*\n"
+                )
+
+            connection = sqlite3.connect(str(self.db_file), timeout=30)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            format_version = connection.execute(
+                "SELECT value FROM meta WHERE key = 'format_version'"
+            ).fetchone()
+            if format_version is None or format_version[0] != str(CACHE_FORMAT_VERSION):
+                connection.execute("DROP TABLE IF EXISTS results")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('format_version', ?)",
+                    (str(CACHE_FORMAT_VERSION),),
+                )
+            connection.execute(
+                str.join(
+                    " ",
+                    [
+                        "CREATE TABLE IF NOT EXISTS results (",
+                        "fingerprint TEXT NOT NULL, sha TEXT NOT NULL,",
+                        "payload TEXT NOT NULL, last_used INTEGER NOT NULL,",
+                        "PRIMARY KEY (fingerprint, sha))",
+                    ],
+                )
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            connection.commit()
+
+        except (OSError, sqlite3.Error) as err:
+            self._disable(err)
+            return None
+
+        self._connection = connection
+        return connection
+
+    def _disable(self, err: Exception) -> None:
+        logger.warning(
+            "Unable to use the parse result cache, caching disabled: %s", err
+        )
+        self._disabled = True
+        self.close()
+
+    def get(self, commit: Commit | CommitRecord) -> list[ParseResult] | None:
+        """Return the cached parse results for the given commit, if any."""
+        if (connection := self._connect()) is None:
+            return None
+
+        try:
+            row = connection.execute(
+                "SELECT payload FROM results WHERE fingerprint = ? AND sha = ?",
+                (self.fingerprint, commit.hexsha),
+            ).fetchone()
+        except sqlite3.Error as err:
+            self._disable(err)
+            return None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        try:
+            results = deserialize_parse_results(commit, row[0])
+        except (ValueError, TypeError, IndexError) as err:
+            logger.debug("Ignoring corrupt cache entry for %s: %s", commit.hexsha, err)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._used.add(commit.hexsha)
+        return results
+
+    def put(self, commit: Commit | CommitRecord, results: list[ParseResult]) -> None:
+        """Queue the parse results of the given commit to be stored on :meth:`save`."""
+        if self._disabled:
+            return
+
+        # Subclasses may carry additional state which cannot be restored
+        if not all(type(result) in (ParsedCommit, ParseError) for result in results):
+            return
+
+        self._pending[commit.hexsha] = serialize_parse_results(commit, results)
+
+    def save(self) -> None:
+        """Write any pending results to disk and evict the least recently used entries."""
+        if not self._pending and not self._used:
+            return
+
+        if (connection := self._connect()) is None:
+            return
+
+        now = int(time.time())
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO results (fingerprint, sha, payload, last_used) VALUES (?, ?, ?, ?)",
+                    (
+                        (self.fingerprint, sha, payload, now)
+                        for sha, payload in self._pending.items()
+                    ),
+                )
+                connection.executemany(
+                    "UPDATE results SET last_used = ? WHERE fingerprint = ? AND sha = ?",
+                    ((now, self.fingerprint, sha) for sha in self._used),
+                )
+                (total_entries,) = connection.execute(
+                    "SELECT COUNT(*) FROM results"
+                ).fetchone()
+                if (excess := total_entries - self.max_entries) > 0:
+                    logger.debug("evicting %s entries from the parse cache", excess)
+                    connection.execute(
+                        str.join(
+                            " ",
+                            [
+                                "DELETE FROM results WHERE rowid IN (",
+                                "SELECT rowid FROM results ORDER BY last_used ASC LIMIT ?)",
+                            ],
+                        ),
+                        (excess,),
+                    )
+        except sqlite3.Error as err:
+            self._disable(err)
+            return
+
+        logger.debug(
+            "parse cache saved (%s hits, %s misses, %s new entries)",
+            self.hits,
+            self.misses,
+            len(self._pending),
+        )
+        self._pending.clear()
+        self._used.clear()
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.close()
+        finally:
+            self._connection = None
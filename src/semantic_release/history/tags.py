@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import logging
+from copy import copy
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, NamedTuple
+
+from git.objects.util import utctz_to_altz
+from git.refs.tag import TagReference
+from git.util import Actor
+
+from semantic_release.errors import InvalidVersion
+from semantic_release.globals import logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Iterable
+
+    from git.refs.tag import Tag
+    from git.repo.base import Repo
+
+    from semantic_release.version.translator import VersionTranslator
+    from semantic_release.version.version import Version
+
+
+# Fields of a single tag record, each separated by a NUL byte. Fields prefixed with
+# an asterisk are read from the object an annotated tag points to.
+_TAG_FIELDS = (
+    "%(refname:strip=2)",  # tag name
+    "%(objecttype)",  # "tag" for annotated tags, otherwise the type of the target
+    "%(objectname)",  # sha of the tag object (annotated) or of the target
+    "%(*objecttype)",  # type of the target of an annotated tag
+    "%(*objectname)",  # sha of the target of an annotated tag
+    "%(taggername)",
+    "%(taggeremail)",
+    "%(taggerdate:raw)",
+    "%(authorname)",  # author of the target of a lightweight tag
+    "%(authoremail)",
+    "%(authordate:raw)",
+    "%(committerdate:raw)",
+)
+_TAG_FORMAT = str.join("%00", _TAG_FIELDS)
+
+
+class TagInfo(NamedTuple):
+    """
+    The metadata of a single tag. ``commit_sha`` is the sha of the commit the tag
+    (eventually) points to, or ``None`` if the tag does not point to a commit.
+
+    For annotated tags, the ``tagger`` & ``tagged_date`` are read from the tag object,
+    otherwise the author of the tagged commit & its commit date are used.
+    """
+
+    name: str
+    object_sha: str
+    commit_sha: str | None
+    annotated: bool
+    tagger: Actor | None
+    tagged_date: datetime | None
+
+
+def _parse_raw_date(value: str) -> tuple[int, timezone]:
+    timestamp, _, utc_offset = value.partition(" ")
+    tz_offset = utctz_to_altz(utc_offset or "+0000")
+    return int(timestamp or 0), timezone(timedelta(seconds=-1 * tz_offset))
+
+
+def _parse_email(value: str) -> str:
+    return value[1:-1] if value.startswith("<") and value.endswith(">") else value
+
+
+def tags_and_versions(
+    tags: Iterable[Tag], translator: VersionTranslator
+) -> list[tuple[Tag, Version]]:
+    """
+    Return a list of 2-tuples, where each element is a tuple (tag, version)
+    from the tags in the Git repo and their corresponding `Version` according
+    to `Version.from_tag`. The returned list is sorted according to semver
+    ordering rules.
+
+    Tags which are not matched by `translator` are ignored.
+    """
+    ts_and_vs: list[tuple[Tag, Version]] = []
+    for tag in tags:
+        try:
+            version = translator.from_tag(tag.name)
+        except (NotImplementedError, InvalidVersion) as e:
+            logger.warning(
+                "Couldn't parse tag %s as as Version: %s",
+                tag.name,
+                str(e),
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            continue
+
+        if version:
+            ts_and_vs.append((tag, version))
+
+    logger.info("found %s previous tags", len(ts_and_vs))
+    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1].sort_key)
+
+
+class TagIndex:
+    """
+    An index of all the tags of a repository.
+
+    The name, target, peeled commit, tagger & tag date of every tag are read from a
+    single ``git for-each-ref refs/tags`` invocation (on first use) and the versions of
+    the tags are parsed once per translator, so that the same index can be shared by
+    every consumer of the tags within a single run.
+
+    When only the versions are needed, just the tags which match the literal prefix of
+    the translator's tag format (ie. ``refs/tags/pkg-a-v*``) are read from git, so that
+    the tags of the other packages of a monorepo are neither read nor parsed.
+    """
+
+    def __init__(self, repo: Repo) -> None:
+        self._repo = repo
+        self._tags: dict[str, TagInfo] | None = None
+        self._tag_refs: list[Tag] | None = None
+        # The tags read per ref glob, until all the tags are read
+        self._matching_tags: dict[str, dict[str, TagInfo]] = {}
+        self._versions: dict[tuple[str, str], list[tuple[Tag, Version]]] = {}
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._load()
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    @property
+    def tags(self) -> list[Tag]:
+        """All the tag references of the repository, sorted by name."""
+        if self._tag_refs is None:
+            self._tag_refs = [
+                TagReference(self._repo, f"refs/tags/{name}") for name in self._load()
+            ]
+        return self._tag_refs
+
+    def infos(self) -> list[TagInfo]:
+        """The metadata of all the tags of the repository, sorted by name."""
+        return list(self._load().values())
+
+    def get(self, name: str) -> TagInfo | None:
+        """Return the metadata of the tag with the given name (if it exists)."""
+        if self._tags is None:
+            for matching_tags in self._matching_tags.values():
+                if name in matching_tags:
+                    return matching_tags[name]
+
+        return self._load().get(name)
+
+    def versions(self, translator: VersionTranslator) -> list[tuple[Tag, Version]]:
+        """
+        Return the result of :func:`tags_and_versions` for all tags of the repository,
+        memoized per tag format & prerelease token of the translator.
+        """
+        key = (translator.tag_format, translator.prerelease_token)
+        if (ts_and_vs := self._versions.get(key)) is None:
+            ts_and_vs = tags_and_versions(
+                self._matching(translator.tag_ref_glob), translator
+            )
+            self._versions[key] = ts_and_vs
+
+        # The list & versions are shared between callers, which may change the
+        # returned versions (ie. their build metadata), so each gets copies
+        return [(tag, copy(version)) for tag, version in ts_and_vs]
+
+    def _matching(self, ref_glob: str | None) -> list[Tag]:
+        """
+        Return the tag references which match the ref glob, reading only those from
+        git unless all the tags have already been read.
+        """
+        if self._tags is not None or ref_glob is None:
+            return self.tags
+
+        if (matching_tags := self._matching_tags.get(ref_glob)) is None:
+            matching_tags = self._matching_tags[ref_glob] = self._read_tags(ref_glob)
+            logger.debug("indexed %s tags matching %s", len(matching_tags), ref_glob)
+
+        return [TagReference(self._repo, f"refs/tags/{name}") for name in matching_tags]
+
+    def _load(self) -> dict[str, TagInfo]:
+        if self._tags is not None:
+            return self._tags
+
+        self._tags = self._read_tags("refs/tags")
+        self._matching_tags.clear()
+
+        logger.debug("indexed %s tags", len(self._tags))
+        return self._tags
+
+    def _read_tags(self, ref_pattern: str) -> dict[str, TagInfo]:
+        output = self._repo.git.for_each_ref(
+            f"--format={_TAG_FORMAT}", "--sort=refname", ref_pattern
+        )
+
+        tags: dict[str, TagInfo] = {}
+        for line in output.splitlines():
+            info = self._to_tag_info(line.split("\0"))
+            tags[info.name] = info
+
+        return tags
+
+    def _to_tag_info(self, fields: list[str]) -> TagInfo:
+        (
+            name,
+            object_type,
+            object_sha,
+            target_type,
+            target_sha,
+            tagger_name,
+            tagger_email,
+            tagger_date,
+            author_name,
+            author_email,
+            author_date,
+            committer_date,
+        ) = fields
+
+        if object_type != "tag":
+            if object_type != "commit":
+                # Lightweight tag of a tree or blob
+                return TagInfo(name, object_sha, None, False, None, None)
+
+            # Lightweight tag, use the author & commit date of the tagged commit
+            # (in the timezone of the author)
+            committed_date, _ = _parse_raw_date(committer_date)
+            _, author_tz = _parse_raw_date(author_date)
+            return TagInfo(
+                name=name,
+                object_sha=object_sha,
+                commit_sha=object_sha,
+                annotated=False,
+                tagger=Actor(author_name, _parse_email(author_email)),
+                tagged_date=datetime.fromtimestamp(committed_date, tz=author_tz),
+            )
+
+        commit_sha = target_sha if target_type == "commit" else None
+        if target_type == "tag":
+            # A tag of a tag, let GitPython resolve the chain of tag objects
+            try:
+                commit_sha = TagReference(self._repo, f"refs/tags/{name}").commit.hexsha
+            except ValueError:
+                commit_sha = None
+
+        return TagInfo(
+            name=name,
+            object_sha=object_sha,
+            commit_sha=commit_sha,
+            annotated=True,
+            tagger=Actor(tagger_name, _parse_email(tagger_email)),
+            tagged_date=datetime.fromtimestamp(*_parse_raw_date(tagger_date)),
+        )
@@ -1,24 +1,16 @@
 from __future__ import annotations
 
-import logging
-from contextlib import suppress
-from functools import reduce
-from queue import LifoQueue
-from typing import TYPE_CHECKING, Iterable
+from typing import TYPE_CHECKING
 
 from semantic_release.commit_parser import ParsedCommit
-from semantic_release.commit_parser.token import ParseError
 from semantic_release.const import DEFAULT_VERSION
 from semantic_release.enums import LevelBump, SemanticReleaseLogLevels
-from semantic_release.errors import InternalError, InvalidVersion
+from semantic_release.errors import InternalError
 from semantic_release.globals import logger
-from semantic_release.helpers import validate_types_in_sequence
+from semantic_release.history import CommitHistory
+from semantic_release.history.tags import tags_and_versions  # noqa: F401 (re-export)
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Sequence
-
-    from git.objects.commit import Commit
-    from git.refs.tag import Tag
     from git.repo.base import Repo
 
     from semantic_release.commit_parser import (
@@ -30,81 +22,6 @@ if TYPE_CHECKING:  # pragma: no cover
     from semantic_release.version.version import Version
 
 
-def tags_and_versions(
-    tags: Iterable[Tag], translator: VersionTranslator
-) -> list[tuple[Tag, Version]]:
-    """
-    Return a list of 2-tuples, where each element is a tuple (tag, version)
-    from the tags in the Git repo and their corresponding `Version` according
-    to `Version.from_tag`. The returned list is sorted according to semver
-    ordering rules.
-
-    Tags which are not matched by `translator` are ignored.
-    """
-    ts_and_vs: list[tuple[Tag, Version]] = []
-    for tag in tags:
-        try:
-            version = translator.from_tag(tag.name)
-        except (NotImplementedError, InvalidVersion) as e:
-            logger.warning(
-                "Couldn't parse tag %s as as Version: %s",
-                tag.name,
-                str(e),
-                exc_info=logger.isEnabledFor(logging.DEBUG),
-            )
-            continue
-
-        if version:
-            ts_and_vs.append((tag, version))
-
-    logger.info("found %s previous tags", len(ts_and_vs))
-    return sorted(ts_and_vs, reverse=True, key=lambda v: v[1])
-
-
-def _traverse_graph_for_commits(
-    head_commit: Commit,
-    latest_release_tag_str: str = "",
-) -> Sequence[Commit]:
-    # Depth-first search
-    def dfs(start_commit: Commit, stop_nodes: set[Commit]) -> Sequence[Commit]:
-        # Create a stack for DFS
-        stack: LifoQueue[Commit] = LifoQueue()
-
-        # Create a set to store visited graph nodes (commit objects in this case)
-        visited: set[Commit] = set()
-
-        # Initialize the result
-        commits: list[Commit] = []
-
-        # Add the source node in the queue to start the search
-        stack.put(start_commit)
-
-        # Traverse the git history capturing each commit found before it reaches a stop node
-        while not stack.empty():
-            if (node := stack.get()) in visited or node in stop_nodes:
-                continue
-
-            visited.add(node)
-            commits.append(node)
-
-            # Add all parent commits to the stack from left to right so that the rightmost is popped first
-            # as the left side is generally the merged into branch
-            for parent in node.parents:
-                stack.put(parent)
-
-        return commits
-
-    # Run a Depth First Search to find all the commits since the last release
-    return dfs(
-        start_commit=head_commit,
-        stop_nodes=set(
-            head_commit.repo.iter_commits(latest_release_tag_str)
-            if latest_release_tag_str
-            else []
-        ),
-    )
-
-
 def _increment_version(
     latest_version: Version,
     latest_full_version: Version,
@@ -248,11 +165,21 @@ def next_version(
     allow_zero_version: bool,
     major_on_zero: bool,
     prerelease: bool = False,
+    commit_history: CommitHistory | None = None,
 ) -> Version:
     """
     Evaluate the history within `repo`, and based on the tags and commits in the repo
     history, identify the next semantic version that should be applied to a release
+
+    A `commit_history` can be provided to share the loaded commit graph and parse
+    results with other consumers of the history (ie. the changelog) in the same run.
     """
+    commit_history = commit_history or CommitHistory(
+        repo=repo,
+        commit_parser=commit_parser,
+        head=repo.active_branch.commit.hexsha,
+    )
+
     # Default initial version
     # Since the translator is configured by the user, we can't guarantee that it will
     # be able to parse the default version. So we first cast it to a tag using the default
@@ -267,23 +194,19 @@ def next_version(
         )
 
     # Step 1. All tags, sorted descending by semver ordering rules
-    all_git_tags_as_versions = tags_and_versions(repo.tags, translator)
+    all_git_tags_as_versions = commit_history.tag_index.versions(translator)
 
-    # Retrieve all commit hashes (regardless of merges) in the current branch's history from repo origin
-    commit_hash_set = {
-        commit.hexsha
-        for commit in _traverse_graph_for_commits(head_commit=repo.active_branch.commit)
-    }
+    # Retrieve the names of all tags (regardless of merges) in the current branch's history
+    # NOTE: tags that point to a Blob or Tree object rather than a commit object are never
+    # part of the history (tags that point to tags that then point to commits are resolved)
+    merged_tag_names = commit_history.merged_tag_names()
 
     # Filter all releases that are not found in the current branch's history
-    historic_versions: list[Version] = []
-    for tag, version in all_git_tags_as_versions:
-        # TODO: move this to tags_and_versions() function?
-        # Ignore the error that is raised when tag points to a Blob or Tree object rather
-        # than a commit object (tags that point to tags that then point to commits are resolved automatically)
-        with suppress(ValueError):
-            if tag.commit.hexsha in commit_hash_set:
-                historic_versions.append(version)
+    historic_versions: list[Version] = [
+        version
+        for tag, version in all_git_tags_as_versions
+        if tag.name in merged_tag_names
+    ]
 
     # Step 2. Get the latest final release version in the history of the current branch
     #  or fallback to the default 0.0.0 starting version value if none are found
@@ -328,9 +251,8 @@ def next_version(
     logger.info("The latest release in this branch's history was %s", latest_version)
 
     # Step 4. Walk the git tree to find all commits that have been made since the last release
-    commits_since_last_release = _traverse_graph_for_commits(
-        head_commit=repo.active_branch.commit,
-        latest_release_tag_str=(
+    commits_since_last_release = commit_history.commits_since(
+        rev=(
             # NOTE: the default_initial_version should not actually exist on the repository (ie v0.0.0)
             # so we provide an empty tag string when there are no tags on the repository yet
             latest_version.as_tag() if latest_version != default_initial_version else ""
@@ -344,28 +266,14 @@ def next_version(
     )
 
     # Step 5. apply the parser to each commit in the history (could return multiple results per commit)
-    parsed_results = list(map(commit_parser.parse, commits_since_last_release))
-
-    # Step 5A. Accumulate all parsed results into a single list accounting for possible multiple results per commit
-    consolidated_results: list[ParseResult] = reduce(
-        lambda accumulated_results, p_results: [
-            *accumulated_results,
-            *(
-                # Cast to list if not already a list
-                p_results
-                if isinstance(p_results, list) or type(p_results) == tuple
-                else [p_results]
-            ),
-        ],
-        parsed_results,
-        [],
-    )
-
-    # Step 5B. Validation type check for the parser results (important because of possible custom parsers)
-    if not validate_types_in_sequence(consolidated_results, (ParseError, ParsedCommit)):
-        raise TypeError("Unexpected type returned from commit_parser.parse")
-
-    # Step 5C. Parse the commits to determine the bump level that should be applied
+    # The results are type validated by the commit history as custom parsers are possible
+    consolidated_results: list[ParseResult] = [
+        parsed_result
+        for results in commit_history.parse_all(commits_since_last_release)
+        for parsed_result in results
+    ]
+
+    # Step 5A. Use the parsed commits to determine the bump level that should be applied
     parsed_levels: set[LevelBump] = {
         parsed_result.bump  # type: ignore[union-attr] # too complex for type checkers
         for parsed_result in filter(
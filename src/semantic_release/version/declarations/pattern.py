@@ -14,6 +14,7 @@ from deprecated.sphinx import deprecated
 from semantic_release.cli.util import noop_report
 from semantic_release.const import SEMVER_REGEX
 from semantic_release.globals import logger
+from semantic_release.helpers import write_text_atomically
 from semantic_release.version.declarations.enum import VersionStampType
 from semantic_release.version.declarations.i_version_replacer import IVersionReplacer
 from semantic_release.version.version import Version
@@ -71,6 +72,11 @@ class PatternVersionDeclaration(IVersionReplacer):
                 )
             )
 
+    @property
+    def path(self) -> Path:
+        """The (resolved) path of the configured source file."""
+        return self._path
+
     @property
     def content(self) -> str:
         """A cached property that stores the content of the configured source file."""
@@ -119,6 +125,16 @@ class PatternVersionDeclaration(IVersionReplacer):
         Replace the version in the source content with `new_version`, and return
         the updated content.
 
+        :param new_version: The new version number as a `Version` instance
+        """
+        return self.replace_content(self.content, new_version)
+
+    def replace_content(self, content: str, new_version: Version) -> str:
+        """
+        Replace the version in the given content of the source file with
+        `new_version`, and return the updated content.
+
+        :param content: The content of the source file
         :param new_version: The new version number as a `Version` instance
         """
         new_content, n_matches = self._search_pattern.subn(
@@ -130,7 +146,7 @@ class PatternVersionDeclaration(IVersionReplacer):
                 ),
                 group_match_name=self._VERSION_GROUP_NAME,
             ),
-            self.content,
+            content,
         )
 
         logger.debug(
@@ -164,7 +180,7 @@ class PatternVersionDeclaration(IVersionReplacer):
         if new_content == self.content:
             return None
 
-        self._path.write_text(new_content)
+        write_text_atomically(self._path, new_content)
         del self.content
 
         return self._path
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Union
+
+from semantic_release.errors import VersionStampError
+from semantic_release.globals import logger
+from semantic_release.helpers import write_text_atomically
+from semantic_release.version.declarations.pattern import PatternVersionDeclaration
+from semantic_release.version.declarations.toml import TomlVersionDeclaration
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
+    from typing import Iterable, Sequence
+
+    from semantic_release.version.declarations.i_version_replacer import (
+        IVersionReplacer,
+    )
+    from semantic_release.version.version import Version
+
+
+FileVersionDeclaration = Union[PatternVersionDeclaration, TomlVersionDeclaration]
+# Either the group of declarations of a file or another replacer
+StampItem = Union[List[FileVersionDeclaration], "IVersionReplacer"]
+
+
+def stamp_version_in_files(
+    version_declarations: Iterable[IVersionReplacer],
+    new_version: Version,
+    jobs: int = 1,
+) -> list[Path]:
+    """
+    Replace the version in the files of the version declarations with `new_version`
+    and return the paths of the files which changed, in the order of the declarations.
+
+    The declarations of the same file are grouped so that each file is read once, all
+    of its declarations are applied in order to the same content, and the file is
+    written once (atomically) if its content changed. Other implementations of
+    `IVersionReplacer` update their files themselves.
+
+    With more than one job, the files are stamped by a pool of ``jobs`` threads unless
+    other implementations of `IVersionReplacer` are configured (as they could update
+    the same files). The result is the same as a serial run.
+
+    Every file is stamped even if another one fails. The error of a single file is
+    raised as is, while the errors of several files are raised as a
+    `VersionStampError` listing each file.
+    """
+    stamp_order = _group_declarations(version_declarations)
+
+    def stamp(item: StampItem) -> Path | Exception | None:
+        try:
+            if isinstance(item, list):
+                return _stamp_file(item[0].path, item, new_version)
+            return item.update_file_w_version(new_version=new_version)
+        except Exception as err:  # noqa: BLE001, the errors of all files are raised
+            return err
+
+    workers = min(jobs, len(stamp_order))
+    if workers > 1 and all(isinstance(item, list) for item in stamp_order):
+        logger.info(
+            "stamping the version in %s files with %s threads",
+            len(stamp_order),
+            workers,
+        )
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() returns the results in the order of the files
+            results = list(executor.map(stamp, stamp_order))
+    else:
+        results = [stamp(item) for item in stamp_order]
+
+    changed_paths: list[Path] = []
+    seen_paths: set[Path] = set()
+    errors: list[tuple[str, Exception]] = []
+    for item, result in zip(stamp_order, results):
+        if isinstance(result, Exception):
+            file = str(item[0].path) if isinstance(item, list) else repr(item)
+            errors.append((file, result))
+        elif result is not None and result not in seen_paths:
+            seen_paths.add(result)
+            changed_paths.append(result)
+
+    _raise_stamp_errors(errors)
+    return changed_paths
+
+
+def _group_declarations(
+    version_declarations: Iterable[IVersionReplacer],
+) -> list[StampItem]:
+    """
+    Return the groups of declarations of each file & the other replacers, in the
+    order of their first declaration.
+    """
+    grouped_declarations: dict[Path, list[FileVersionDeclaration]] = {}
+    stamp_order: list[StampItem] = []
+
+    for declaration in version_declarations:
+        if not isinstance(
+            declaration, (PatternVersionDeclaration, TomlVersionDeclaration)
+        ):
+            stamp_order.append(declaration)
+            continue
+
+        if (file_declarations := grouped_declarations.get(declaration.path)) is None:
+            file_declarations = grouped_declarations[declaration.path] = []
+            stamp_order.append(file_declarations)
+
+        file_declarations.append(declaration)
+
+    return stamp_order
+
+
+def _raise_stamp_errors(errors: Sequence[tuple[str, Exception]]) -> None:
+    if len(errors) == 1:
+        raise errors[0][1]
+
+    if errors:
+        raise VersionStampError(
+            str.join(
+                "\n",
+                [
+                    f"Failed to stamp the version in {len(errors)} files:",
+                    *(f"    {file}: {err!r}" for file, err in errors),
+                ],
+            )
+        ) from errors[0][1]
+
+
+def _stamp_file(
+    path: Path,
+    declarations: Sequence[FileVersionDeclaration],
+    new_version: Version,
+) -> Path | None:
+    try:
+        content = path.read_text()
+    except FileNotFoundError as err:
+        raise FileNotFoundError(f"path {path!r} does not exist") from err
+
+    new_content = content
+    for declaration in declarations:
+        new_content = declaration.replace_content(new_content, new_version)
+        # The file is about to change, drop any content read before
+        del declaration.content
+
+    if new_content == content:
+        return None
+
+    logger.debug("writing %s version declaration(s) to %s", len(declarations), path)
+    write_text_atomically(path, new_content)
+    return path
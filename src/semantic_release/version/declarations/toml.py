@@ -9,8 +9,10 @@ from dotty_dict import Dotty
 
 from semantic_release.cli.util import noop_report
 from semantic_release.globals import logger
+from semantic_release.helpers import write_text_atomically
 from semantic_release.version.declarations.enum import VersionStampType
 from semantic_release.version.declarations.i_version_replacer import IVersionReplacer
+from semantic_release.version.declarations.toml_scanner import find_toml_value_span
 from semantic_release.version.version import Version
 
 
@@ -23,6 +25,11 @@ class TomlVersionDeclaration(IVersionReplacer):
         self._stamp_format = stamp_format
         self._search_text = search_text
 
+    @property
+    def path(self) -> Path:
+        """The (resolved) path of the configured source file."""
+        return self._path
+
     @property
     def content(self) -> str:
         """A cached property that stores the content of the configured source file."""
@@ -64,20 +71,47 @@ class TomlVersionDeclaration(IVersionReplacer):
         Replace the version in the source content with `new_version`, and return the
         updated content.
         """
-        content = self._load()
-        if self._search_text in content:
+        return self.replace_content(self.content, new_version)
+
+    def replace_content(self, content: str, new_version: Version) -> str:
+        """
+        Replace the version in the given content of the source file with
+        `new_version`, and return the updated content.
+
+        The value of the key is located by a lightweight scan of the content and
+        replaced in place, so that the rest of the content is left untouched. The
+        content is only parsed (and serialized) in full when the scan can not locate
+        the value.
+        """
+        new_value = (
+            new_version.as_tag()
+            if self._stamp_format == VersionStampType.TAG_FORMAT
+            else str(new_version)
+        )
+
+        if span := find_toml_value_span(content, self._search_text.split(".")):
             logger.info(
                 "found %r in source file contents, replacing with %s",
                 self._search_text,
                 new_version,
             )
-            content[self._search_text] = (
-                new_version.as_tag()
-                if self._stamp_format == VersionStampType.TAG_FORMAT
-                else str(new_version)
+            start, end = span
+            # Written the same way as a replacement of the value through tomlkit
+            return str.join(
+                "",
+                [content[:start], tomlkit.item(new_value).as_string(), content[end:]],
+            )
+
+        toml_content = Dotty(tomlkit.loads(content))
+        if self._search_text in toml_content:
+            logger.info(
+                "found %r in source file contents, replacing with %s",
+                self._search_text,
+                new_version,
             )
+            toml_content[self._search_text] = new_value
 
-        return tomlkit.dumps(cast(Dict[str, Any], content))
+        return tomlkit.dumps(cast(Dict[str, Any], toml_content))
 
     def _load(self) -> Dotty:
         """Load the content of the source file into a Dotty for easier searching"""
@@ -93,7 +127,10 @@ class TomlVersionDeclaration(IVersionReplacer):
                 )
                 return None
 
-            if self._search_text not in self._load():
+            if (
+                find_toml_value_span(self.content, self._search_text.split(".")) is None
+                and self._search_text not in self._load()
+            ):
                 noop_report(
                     f"VERSION PATTERN NOT FOUND: no version to stamp in file {self._path!r}",
                 )
@@ -105,7 +142,7 @@ class TomlVersionDeclaration(IVersionReplacer):
         if new_content == self.content:
             return None
 
-        self._path.write_text(new_content)
+        write_text_atomically(self._path, new_content)
         del self.content
 
         return self._path
@@ -0,0 +1,177 @@
+"""
+A lightweight scanner of TOML documents which locates the span of the value of a key,
+so that the value can be replaced without a full parse & serialization of the document.
+"""
+
+from __future__ import annotations
+
+from re import compile as regexp
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Sequence
+
+
+_BARE_KEY = r"[A-Za-z0-9_-]+"
+_BASIC_STRING = r'"(?:[^"\\\n]|\\.)*"'
+_LITERAL_STRING = r"'[^'\n]*'"
+_SIMPLE_KEY = f"(?:{_BARE_KEY}|{_BASIC_STRING}|{_LITERAL_STRING})"
+_DOTTED_KEY = rf"{_SIMPLE_KEY}(?:[ \t]*\.[ \t]*{_SIMPLE_KEY})*"
+
+_simple_key_pattern = regexp(_SIMPLE_KEY)
+_whitespace_pattern = regexp(r"(?:[ \t\r\n]+|#[^\n]*)+")
+_table_header_pattern = regexp(
+    rf"(?P<array>\[)?\[[ \t]*(?P<key>{_DOTTED_KEY})[ \t]*\](?(array)\])"
+    r"[ \t]*(?:#[^\n]*)?(?=\r?\n|$)"
+)
+_key_value_pattern = regexp(rf"(?P<key>{_DOTTED_KEY})[ \t]*=[ \t]*")
+_end_of_line_pattern = regexp(r"[ \t]*(?:#[^\n]*)?(?:\r?\n|$)")
+_value_patterns = (
+    ('"""', regexp(r'"""(?:\\[\s\S]|[^\\])*?"{3,5}')),
+    ("'''", regexp(r"'''[\s\S]*?'{3,5}")),
+    ('"', regexp(_BASIC_STRING)),
+    ("'", regexp(_LITERAL_STRING)),
+)
+# Numbers, booleans & dates without a space separator
+_scalar_pattern = regexp(r"[^\s#,\[\]{}=\"']+")
+
+
+def find_toml_value_span(content: str, key: Sequence[str]) -> tuple[int, int] | None:
+    """
+    Return the (start, end) span of the value of the given key (as the parts of its
+    dotted key) in the TOML document, if the key is found and its value is a string,
+    number, boolean or date.
+
+    None is returned when the key is not found, or as soon as the document uses any
+    syntax the scanner does not follow (ie. the values of arrays of tables, keys with
+    escape sequences or invalid documents), in which case the document has to be
+    parsed in full.
+    """
+    key_path = tuple(key)
+    table: tuple[str, ...] | None = ()
+    spans: list[tuple[int, int]] = []
+    pos = 0
+
+    while True:
+        if match := _whitespace_pattern.match(content, pos):
+            pos = match.end()
+
+        if pos >= len(content):
+            break
+
+        if content[pos] == "[":
+            if (table_header := _scan_table_header(content, pos)) is None:
+                return None
+
+            table, pos = table_header
+            continue
+
+        if (key_value := _scan_key_value(content, pos)) is None:
+            return None
+
+        key_parts, value_span, pos = key_value
+        if table is not None and (*table, *key_parts) == key_path:
+            spans.append(value_span)
+
+    # A duplicate key is an invalid document, which is left to the parser to report
+    if len(spans) != 1:
+        return None
+
+    start, end = spans[0]
+    return None if content[start] in "[{" else (start, end)
+
+
+def _scan_table_header(
+    content: str, pos: int
+) -> tuple[tuple[str, ...] | None, int] | None:
+    """
+    Return the key of the table (None when the table is not followed) & the end of
+    the table header that starts at the given position.
+    """
+    if not (match := _table_header_pattern.match(content, pos)):
+        return None
+
+    # The tables of an array of tables are not followed
+    table = None if match.group("array") else _parse_key(match.group("key"))
+    return table, match.end()
+
+
+def _scan_key_value(
+    content: str, pos: int
+) -> tuple[tuple[str, ...], tuple[int, int], int] | None:
+    """
+    Return the parts of the key, the span of the value & the end of the line of the
+    key/value pair that starts at the given position.
+    """
+    if not (match := _key_value_pattern.match(content, pos)):
+        return None
+
+    if (key_parts := _parse_key(match.group("key"))) is None:
+        return None
+
+    value_start = match.end()
+    if (value_end := _skip_value(content, value_start)) is None:
+        return None
+
+    if not (match := _end_of_line_pattern.match(content, value_end)):
+        return None
+
+    return key_parts, (value_start, value_end), match.end()
+
+
+def _parse_key(dotted_key: str) -> tuple[str, ...] | None:
+    parts = []
+    for match in _simple_key_pattern.finditer(dotted_key):
+        part = match.group()
+        if part[0] == '"':
+            if "\\" in part:
+                return None
+            part = part[1:-1]
+        elif part[0] == "'":
+            part = part[1:-1]
+
+        parts.append(part)
+
+    return tuple(parts)
+
+
+def _skip_value(content: str, pos: int) -> int | None:
+    """Return the end of the value that starts at the given position."""
+    for prefix, pattern in _value_patterns:
+        if content.startswith(prefix, pos):
+            return match.end() if (match := pattern.match(content, pos)) else None
+
+    if content.startswith(("[", "{"), pos):
+        return _skip_collection(content, pos)
+
+    return match.end() if (match := _scalar_pattern.match(content, pos)) else None
+
+
+def _skip_collection(content: str, pos: int) -> int | None:
+    """Return the end of the array or inline table that starts at the given position."""
+    closing_brackets = {"[": "]", "{": "}"}
+    expected_closing = [closing_brackets[content[pos]]]
+    pos += 1
+
+    while expected_closing:
+        if match := _whitespace_pattern.match(content, pos):
+            pos = match.end()
+
+        if pos >= len(content):
+            return None
+
+        char = content[pos]
+        if char == expected_closing[-1]:
+            expected_closing.pop()
+            pos += 1
+        elif char in closing_brackets:
+            expected_closing.append(closing_brackets[char])
+            pos += 1
+        elif char in ",=.":
+            pos += 1
+        elif (end := _skip_value(content, pos)) is not None and end > pos:
+            pos = end
+        else:
+            return None
+
+    return pos
@@ -0,0 +1,229 @@
+"""
+Release planning for all of the packages of a monorepo in a single history walk.
+
+Each package of a monorepo is released with its own path filters, scope prefix & tag
+format (see :py:class:`ConventionalCommitMonorepoParser`). Rather than walking & parsing
+the whole history once per package, :func:`plan_package_releases` loads the history,
+the changed files of the commits & the tags once and shares the parsing of the commit
+messages between the packages, only the (cheap) routing of each commit to the packages
+(by its changed files & scope) is done per package.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, NamedTuple, cast
+
+from semantic_release.changelog.exclusion import CommitExclusionMatcher
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.commit_parser.conventional.options import (
+    ConventionalCommitParserOptions,
+)
+from semantic_release.commit_parser.conventional.options_monorepo import (
+    ConventionalCommitMonorepoParserOptions,
+)
+from semantic_release.commit_parser.conventional.parser import (
+    ConventionalCommitParser,
+)
+from semantic_release.commit_parser.conventional.parser_monorepo import (
+    ConventionalCommitMonorepoParser,
+)
+from semantic_release.globals import logger
+from semantic_release.history import CommitHistory
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:  # pragma: no cover
+    from re import Match as RegexMatch, Pattern
+    from typing import Iterable, Sequence
+
+    from git.repo.base import Repo
+
+    from semantic_release.commit_parser import (
+        CommitParser,
+        ParseResult,
+        ParserOptions,
+    )
+    from semantic_release.commit_parser.token import ParsedMessageResult
+    from semantic_release.version.version import Version
+
+# The number of commits which are routed to all of the packages at once, which bounds
+# the messages held by the memo of the shared message parser
+_ROUTING_CHUNK_SIZE = 1000
+
+
+class PackageDefinition(NamedTuple):
+    """
+    A package of a monorepo. The ``path_filters`` & ``scope_prefix`` are the same as
+    the options of the :py:class:`ConventionalCommitMonorepoParser` (the path filters
+    are relative to the current working directory).
+    """
+
+    name: str
+    path_filters: tuple[str, ...] = (".",)
+    scope_prefix: str = ""
+    tag_format: str = "v{version}"
+
+
+class PackageRelease(NamedTuple):
+    """The planned release of a single package."""
+
+    package: PackageDefinition
+    translator: VersionTranslator
+    commit_parser: ConventionalCommitMonorepoParser
+    commit_history: CommitHistory
+    next_version: Version
+    release_history: ReleaseHistory | None
+
+
+class _SharedMessageParser(ConventionalCommitParser):
+    # Memoizes the results of the commit messages (which do not depend on the package)
+    # so that the package parsers only parse each commit message once. The memo only
+    # covers the commits which are being routed to the packages, see clear_memo()
+
+    def __init__(self, options: ConventionalCommitParserOptions | None = None) -> None:
+        super().__init__(options)
+        self._squashed_messages: dict[str, list[str]] = {}
+        self._message_results: dict[tuple[str | None, ...], ParsedMessageResult] = {}
+
+    def clear_memo(self) -> None:
+        self._squashed_messages.clear()
+        self._message_results.clear()
+
+    def unsquash_commit_message(self, message: str) -> list[str]:
+        if (messages := self._squashed_messages.get(message)) is None:
+            messages = super().unsquash_commit_message(message)
+            self._squashed_messages[message] = messages
+        return messages
+
+    def create_parsed_message_result(
+        self, match: RegexMatch[str], text: str
+    ) -> ParsedMessageResult:
+        # The result only depends on the groups of the match & the text of the body
+        key = (*match.group("type", "scope", "break", "subject"), text)
+        if (result := self._message_results.get(key)) is None:
+            result = super().create_parsed_message_result(match, text)
+            self._message_results[key] = result
+        return result
+
+
+def plan_package_releases(
+    repo: Repo,
+    packages: Sequence[PackageDefinition],
+    parser_options: ConventionalCommitParserOptions | None = None,
+    allow_zero_version: bool = True,
+    major_on_zero: bool = True,
+    prerelease: bool = False,
+    prerelease_token: str = "rc",  # noqa: S107
+    exclude_commit_patterns: Iterable[Pattern[str]] = (),
+    release_history: bool = True,
+) -> dict[str, PackageRelease]:
+    """
+    Determine the next version (and the release history for the changelog, unless
+    ``release_history`` is False) of each of the given packages of a monorepo.
+
+    The commit history of the active branch is walked once, the changed files of the
+    commits & the tags are indexed once. With the release histories, the commits are
+    routed to all of the packages in chunks, so that each commit message is parsed once
+    (with the given conventional commit ``parser_options``) for all of the packages
+    while only the parsed messages of one chunk are held in memory. The
+    results are the same as running ``next_version`` & ``ReleaseHistory.from_git_history``
+    with a :py:class:`ConventionalCommitMonorepoParser` for each package separately.
+
+    :return: The planned releases, by package name
+    """
+    package_names = [package.name for package in packages]
+    if len(set(package_names)) != len(package_names):
+        raise ValueError(f"Duplicate package names in {package_names}")
+
+    base_options = parser_options or ConventionalCommitParserOptions()
+    base_parser = _SharedMessageParser(base_options)
+    conventional_options = {
+        field: getattr(base_options, field)
+        for field in ConventionalCommitParserOptions().__dataclass_fields__
+    }
+
+    # The commit messages are matched against the exclusion patterns once
+    exclusion_matcher = CommitExclusionMatcher(
+        exclude_commit_patterns, max_body_size=base_options.max_body_size
+    )
+
+    shared_history = CommitHistory(
+        repo=repo,
+        # The commit parsers are invariant in the type of their options
+        commit_parser=cast("CommitParser[ParseResult, ParserOptions]", base_parser),
+        head=repo.active_branch.commit.hexsha,
+    )
+
+    package_parsers: list[ConventionalCommitMonorepoParser] = []
+    package_histories: list[CommitHistory] = []
+    for package in packages:
+        commit_parser = ConventionalCommitMonorepoParser(
+            options=ConventionalCommitMonorepoParserOptions(
+                **conventional_options,
+                path_filters=package.path_filters,
+                scope_prefix=package.scope_prefix,
+            ),
+            base_parser=base_parser,
+        )
+        package_parsers.append(commit_parser)
+        package_histories.append(
+            shared_history.with_commit_parser(
+                cast("CommitParser[ParseResult, ParserOptions]", commit_parser)
+            )
+        )
+
+    if release_history:
+        # The release histories parse the whole history, so each chunk of commits is
+        # routed to all of the packages (which memoize their results by sha) before the
+        # messages of the chunk are dropped from the shared memo
+        all_commits = shared_history.topo_ordered_commits()
+        for start in range(0, len(all_commits), _ROUTING_CHUNK_SIZE):
+            chunk = all_commits[start : start + _ROUTING_CHUNK_SIZE]
+            for commit_history in package_histories:
+                commit_history.parse_all(chunk)
+            base_parser.clear_memo()
+
+    planned_releases: dict[str, PackageRelease] = {}
+    for package, commit_parser, commit_history in zip(
+        packages, package_parsers, package_histories
+    ):
+        package_parser = cast("CommitParser[ParseResult, ParserOptions]", commit_parser)
+        translator = VersionTranslator(
+            tag_format=package.tag_format, prerelease_token=prerelease_token
+        )
+
+        logger.info("determining the next version of package %s", package.name)
+        version = next_version(
+            repo=repo,
+            translator=translator,
+            commit_parser=package_parser,
+            allow_zero_version=allow_zero_version,
+            major_on_zero=major_on_zero,
+            prerelease=prerelease,
+            commit_history=commit_history,
+        )
+
+        planned_releases[package.name] = PackageRelease(
+            package=package,
+            translator=translator,
+            commit_parser=commit_parser,
+            commit_history=commit_history,
+            next_version=version,
+            release_history=(
+                ReleaseHistory.from_git_history(
+                    repo=repo,
+                    translator=translator,
+                    commit_parser=package_parser,
+                    exclude_commit_patterns=exclusion_matcher,
+                    commit_history=commit_history,
+                )
+                if release_history
+                else None
+            ),
+        )
+
+        # Without the release histories, each package only parses the commits since
+        # its own last release, which are not shared through the memo
+        base_parser.clear_memo()
+
+    return planned_releases
@@ -15,6 +15,7 @@ class VersionTranslator:
     """
 
     _VERSION_REGEX = SEMVER_REGEX
+    _TAG_FORMAT_SPECIAL_CHARS = re.compile(r"[\\.^$*+?{}\[\]|()#\s]")
 
     @classmethod
     def _invert_tag_format_to_re(cls, tag_format: str) -> re.Pattern[str]:
@@ -38,6 +39,37 @@ class VersionTranslator:
         logger.debug("inverted tag_format %r to %r", tag_format, pat.pattern)
         return pat
 
+    @classmethod
+    def _tag_format_to_ref_glob(cls, tag_format: str) -> str | None:
+        """
+        Create a glob of the tag references which can match the inverted "tag_format"
+        (see `_invert_tag_format_to_re`) from the literal prefix of the format, so that
+        only the matching tags have to be read from git.
+
+        For example, a tag_format of 'pkg-a-v{version}' results in 'refs/tags/pkg-a-v*'.
+        None is returned when the format has no literal prefix, as every tag could
+        then match, or when a slash follows the prefix.
+        """
+        # The format is used as a (verbose) regex, where an alternation would apply
+        # to the whole prefix
+        if "|" in tag_format:
+            return None
+
+        # The prefix is only literal up to the first special character or whitespace
+        # (which are also the characters a glob would treat specially or that a tag
+        # can't contain), less the character before a quantifier
+        prefix = tag_format.partition(r"{version}")[0]
+        if match := cls._TAG_FORMAT_SPECIAL_CHARS.search(prefix):
+            end = match.start() - (match.group() in "?*+{")
+            prefix = prefix[: max(end, 0)]
+
+        # A '*' of a ref glob does not match a slash, so the rest of the format (after
+        # the prefix) must not contain one. A version never contains a slash.
+        if "/" in tag_format[len(prefix) :]:
+            return None
+
+        return f"refs/tags/{prefix}*" if prefix else None
+
     def __init__(
         self,
         tag_format: str = "v{version}",
@@ -47,6 +79,7 @@ class VersionTranslator:
         self.tag_format = tag_format
         self.prerelease_token = prerelease_token
         self.from_tag_re = self._invert_tag_format_to_re(self.tag_format)
+        self.tag_ref_glob = self._tag_format_to_ref_glob(self.tag_format)
 
     def from_string(self, version_str: str) -> Version:
         """
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import re
-from functools import wraps
-from itertools import zip_longest
+from functools import lru_cache, wraps
 from typing import Callable, Union, overload
 
 from semantic_release.const import SEMVER_REGEX
@@ -17,6 +16,8 @@ from semantic_release.helpers import check_tag_format
 VersionComparable = Union["Version", str]
 VersionComparator = Callable[["Version", "Version"], bool]
 
+_PRERELEASE_REGEX = re.compile(r"(?P<token>[a-zA-Z0-9-\.]+)\.(?P<revision>\d+)")
+
 
 @overload
 def _comparator(
@@ -63,7 +64,65 @@ def _comparator(
     return _wrapper
 
 
+@lru_cache(maxsize=16384)
+def _parse_version_str(
+    version_str: str,
+    version_regex: re.Pattern[str] = SEMVER_REGEX,
+) -> tuple[int, int, int, str | None, int | None, str]:
+    """
+    Parse the components of a version string with the given version regex. The
+    result is memoized (keyed by both arguments) as the same version strings (ie. the
+    tags of the repository) are parsed over and over again.
+    """
+    logger.debug("attempting to parse string %r as Version", version_str)
+    match = version_regex.fullmatch(version_str)
+    if not match:
+        raise InvalidVersion(f"{version_str!r} is not a valid Version")
+
+    prerelease_token: str | None = None
+    prerelease_revision: int | None = None
+    if prerelease := match.group("prerelease"):
+        pm = _PRERELEASE_REGEX.match(prerelease)
+        if not pm:
+            raise NotImplementedError(
+                f"{Version.__qualname__} currently supports only prereleases "
+                r"of the format (-([a-zA-Z0-9-])\.\(\d+)), for example "
+                r"'1.2.3-my-custom-3rc.4'."
+            )
+        prerelease_token = pm.group("token")
+        prerelease_revision = int(pm.group("revision"))
+
+    return (
+        int(match.group("major")),
+        int(match.group("minor")),
+        int(match.group("patch")),
+        prerelease_token,
+        prerelease_revision,
+        match.group("buildmetadata") or "",
+    )
+
+
 class Version:
+    """
+    A semantic version.
+
+    The sort key of the components which determine the precedence of a version
+    (major, minor, patch & the prerelease token and revision) is computed when it is
+    first needed, and computed again after any of those components is changed
+    (see :attr:`sort_key`).
+    """
+
+    __slots__ = (
+        "_major",
+        "_minor",
+        "_patch",
+        "_prerelease_token",
+        "_prerelease_revision",
+        "_sort_key",
+        "_tag_format",
+        "build_metadata",
+    )
+
     _VERSION_REGEX = SEMVER_REGEX
 
     def __init__(
@@ -77,14 +136,94 @@ class Version:
         build_metadata: str = "",
         tag_format: str = "v{version}",
     ) -> None:
-        self.major = major
-        self.minor = minor
-        self.patch = patch
-        self.prerelease_token = prerelease_token
-        self.prerelease_revision = prerelease_revision
+        self._major = major
+        self._minor = minor
+        self._patch = patch
+        self._prerelease_token = prerelease_token
+        self._prerelease_revision = prerelease_revision
+        self._sort_key: tuple[int, int, int, bool, tuple[str, ...], int] | None = None
         self.build_metadata = build_metadata
         self._tag_format = tag_format
 
+    @property
+    def major(self) -> int:
+        return self._major
+
+    @major.setter
+    def major(self, major: int) -> None:
+        self._major = major
+        self._sort_key = None
+
+    @property
+    def minor(self) -> int:
+        return self._minor
+
+    @minor.setter
+    def minor(self, minor: int) -> None:
+        self._minor = minor
+        self._sort_key = None
+
+    @property
+    def patch(self) -> int:
+        return self._patch
+
+    @patch.setter
+    def patch(self, patch: int) -> None:
+        self._patch = patch
+        self._sort_key = None
+
+    @property
+    def prerelease_token(self) -> str:
+        return self._prerelease_token
+
+    @prerelease_token.setter
+    def prerelease_token(self, prerelease_token: str) -> None:
+        self._prerelease_token = prerelease_token
+        self._sort_key = None
+
+    @property
+    def prerelease_revision(self) -> int | None:
+        return self._prerelease_revision
+
+    @prerelease_revision.setter
+    def prerelease_revision(self, prerelease_revision: int | None) -> None:
+        self._prerelease_revision = prerelease_revision
+        self._sort_key = None
+
+    @property
+    def sort_key(self) -> tuple[int, int, int, bool, tuple[str, ...], int]:
+        """
+        A tuple which sorts versions by their semver precedence, for use as the key
+        of ``sorted()`` so that large lists of versions are sorted without calling
+        the comparison methods of each version.
+
+        Two versions are equal when their sort keys are equal, so the prerelease token
+        of a final version is part of its key even though it isn't released.
+        """
+        if self._sort_key is None:
+            # https://semver.org/#spec-item-11 -
+            # build metadata is not used for comparison
+            #
+            # Note we only support the following versioning currently, which
+            # is a subset of the full spec:
+            # (\d+\.\d+\.\d+)(-\w+\.\d+)?(\+.*)?
+            #
+            # A prerelease is less than the full version, and according to the semver
+            # spec 11.4 there are many other rules for comparing precedence of
+            # pre-release versions. Here we just compare the prerelease tokens
+            # (lexically, per dot separated identifier, where the longest token is
+            # greater), and their revision numbers
+            self._sort_key = (
+                self._major,
+                self._minor,
+                self._patch,
+                self._prerelease_revision is None,
+                tuple(self._prerelease_token.split(".")),
+                self._prerelease_revision or 0,
+            )
+
+        return self._sort_key
+
     @property
     def tag_format(self) -> str:
         return self._tag_format
@@ -94,7 +233,6 @@ class Version:
         check_tag_format(new_format)
         self._tag_format = new_format
 
-    # Maybe cache?
     @classmethod
     def parse(
         cls,
@@ -107,53 +245,30 @@ class Version:
         Inspired by `semver.version:VersionInfo.parse`, this implementation doesn't
         allow optional minor and patch versions.
 
+        The parsing of each version string is memoized, but a new instance is
+        returned for every call.
+
         :param prerelease_token: will be ignored if the version string is a prerelease,
             the parsed token from `version_str` will be used instead.
         """
         if not isinstance(version_str, str):
             raise InvalidVersion(f"{version_str!r} cannot be parsed as a Version")
 
-        logger.debug("attempting to parse string %r as Version", version_str)
-        match = cls._VERSION_REGEX.fullmatch(version_str)
-        if not match:
-            raise InvalidVersion(f"{version_str!r} is not a valid Version")
-
-        prerelease = match.group("prerelease")
-        if prerelease:
-            pm = re.match(r"(?P<token>[a-zA-Z0-9-\.]+)\.(?P<revision>\d+)", prerelease)
-            if not pm:
-                raise NotImplementedError(
-                    f"{cls.__qualname__} currently supports only prereleases "
-                    r"of the format (-([a-zA-Z0-9-])\.\(\d+)), for example "
-                    r"'1.2.3-my-custom-3rc.4'."
-                )
-            prerelease_token, prerelease_revision = pm.groups()
-            logger.debug(
-                "parsed prerelease_token %s, prerelease_revision %s from version "
-                "string %s",
-                prerelease_token,
-                prerelease_revision,
-                version_str,
-            )
-        else:
-            prerelease_revision = None
-            logger.debug("version string %s parsed as a non-prerelease", version_str)
-
-        build_metadata = match.group("buildmetadata") or ""
-        logger.debug(
-            "parsed build metadata %r from version string %s",
+        (
+            major,
+            minor,
+            patch,
+            parsed_prerelease_token,
+            prerelease_revision,
             build_metadata,
-            version_str,
-        )
+        ) = _parse_version_str(version_str, cls._VERSION_REGEX)
 
         return Version(
-            int(match.group("major")),
-            int(match.group("minor")),
-            int(match.group("patch")),
-            prerelease_token=prerelease_token,
-            prerelease_revision=(
-                int(prerelease_revision) if prerelease_revision else None
-            ),
+            major,
+            minor,
+            patch,
+            prerelease_token=parsed_prerelease_token or prerelease_token,
+            prerelease_revision=prerelease_revision,
             build_metadata=build_metadata,
             tag_format=tag_format,
         )
@@ -272,22 +387,13 @@ class Version:
         # If we use str(self) we don't capture tag_format, so another
         # instance with a tag_format "special_{version}_format" would
         # collide with an instance using "v{version}"/other format
-        return hash(self.__repr__())
+        return hash((self.sort_key, self.build_metadata, self._tag_format))
 
     @_comparator(type_guard=False)
     def __eq__(self, other: Version) -> bool:  # type: ignore[override]
         # https://semver.org/#spec-item-11 -
         # build metadata is not used for comparison
-        return all(
-            getattr(self, attr) == getattr(other, attr)
-            for attr in (
-                "major",
-                "minor",
-                "patch",
-                "prerelease_token",
-                "prerelease_revision",
-            )
-        )
+        return self.sort_key == other.sort_key
 
     @_comparator(type_guard=False)
     def __neq__(self, other: Version) -> bool:
@@ -297,57 +403,21 @@ class Version:
     # but can't because of the decorator
     @_comparator
     def __gt__(self, other: Version) -> bool:  # type: ignore[has-type]
-        # https://semver.org/#spec-item-11 -
-        # build metadata is not used for comparison
-
-        # Note we only support the following versioning currently, which
-        # is a subset of the full spec:
-        # (\d+\.\d+\.\d+)(-\w+\.\d+)?(\+.*)?
-        if self.major != other.major:
-            return self.major > other.major
-        if self.minor != other.minor:
-            return self.minor > other.minor
-        if self.patch != other.patch:
-            return self.patch > other.patch
-        # If just one is a prerelease, then self > other if other is the prerelease
-        # If neither are prereleases then they're equal (so return False)
-        if not (self.is_prerelease and other.is_prerelease):
-            return other.is_prerelease
-        # If both are prereleases...
-        # According to the semver spec 11.4 there are many other rules for
-        # comparing precedence of pre-release versions. Here we just compare
-        # the prerelease tokens, and their revision numbers
-        if self.prerelease_token != other.prerelease_token:
-            for self_tk, other_tk in zip_longest(
-                self.prerelease_token.split("."),
-                other.prerelease_token.split("."),
-                fillvalue=None,
-            ):
-                if self_tk == other_tk:
-                    continue
-                if (self_tk is None) ^ (other_tk is None):
-                    # Longest token (i.e. non-None) is greater
-                    return other_tk is None
-                # Lexical sort, e.g. "rc" > "beta" > "alpha"
-                # we have eliminated that one or both might be None above,
-                # but mypy doesn't recognise this
-                return self_tk > other_tk  # type: ignore[operator]
-        # We have eliminated that one or both aren't prereleases by the above
-        return self.prerelease_revision > other.prerelease_revision  # type: ignore[operator]  # noqa: E501
+        return self.sort_key > other.sort_key
 
     # mypy wants to compare signature types with __le__,
     # but can't because of the decorator
     @_comparator
     def __ge__(self, other: Version) -> bool:  # type: ignore[has-type]
-        return self.__gt__(other) or self.__eq__(other)
+        return self.sort_key >= other.sort_key
 
     @_comparator
     def __lt__(self, other: Version) -> bool:
-        return not (self.__gt__(other) or self.__eq__(other))
+        return self.sort_key < other.sort_key
 
     @_comparator
     def __le__(self, other: Version) -> bool:
-        return not self.__gt__(other)
+        return self.sort_key <= other.sort_key
 
     def __sub__(self, other: Version) -> LevelBump:
         if not isinstance(other, Version):
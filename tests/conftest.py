@@ -117,6 +117,12 @@ def pytest_addoption(parser: pytest.Parser, pluginmanager: pytest.PytestPluginMa
         default=False,
         action="store_true",
     )
+    parser.addoption(
+        "--perf",
+        help="Run the performance benchmarks (tests/perf)",
+        default=False,
+        action="store_true",
+    )
 
 
 def pytest_configure(config: pytest.Config):
@@ -155,7 +161,7 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
             only unit tests that are not marked comprehensive are executed
 
         pytest --comprehensive
-            all tests are executed
+            all tests (except the performance benchmarks) are executed
 
         pytest -m unit
             only unit tests that are not marked comprehensive are executed (same as no options)
@@ -178,6 +184,9 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
         pytest -k "test_name" --comprehensive
             all tests that match the substring "test_name" are executed
 
+        pytest -m perf --perf
+            only the performance benchmarks that are not marked comprehensive are executed
+
     """
     disable_comprehensive_tests = not config.getoption("--comprehensive")
     comprehensive_test_skip_marker = pytest.mark.skip(
@@ -192,6 +201,14 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
             if disable_comprehensive_tests and "comprehensive" in item.keywords:
                 item.add_marker(comprehensive_test_skip_marker)
 
+    if not config.getoption("--perf"):
+        perf_test_skip_marker = pytest.mark.skip(
+            reason="performance benchmarks are disabled by default, use --perf"
+        )
+        for item in items:
+            if "perf" in item.keywords:
+                item.add_marker(perf_test_skip_marker)
+
 
 @pytest.fixture
 def cli_runner() -> CliRunner:
@@ -339,7 +356,15 @@ def set_cached_repo_data(request: pytest.FixtureRequest) -> SetCachedRepoDataFn:
             return obj.__fspath__()
 
         if isinstance(obj, Version):
-            return obj.__dict__
+            return {
+                "major": obj.major,
+                "minor": obj.minor,
+                "patch": obj.patch,
+                "prerelease_token": obj.prerelease_token,
+                "prerelease_revision": obj.prerelease_revision,
+                "build_metadata": obj.build_metadata,
+                "tag_format": obj.tag_format,
+            }
 
         return obj
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from textwrap import dedent
 from typing import TYPE_CHECKING
@@ -17,7 +18,7 @@ from tests.fixtures.repos import (
     repo_w_no_tags_conventional_commits,
     repo_w_trunk_only_conventional_commits,
 )
-from tests.util import assert_successful_exit_code
+from tests.util import add_text_to_file, assert_successful_exit_code
 
 if TYPE_CHECKING:
     from unittest.mock import MagicMock
@@ -280,3 +281,92 @@ def test_version_only_tag_push(
     assert head_before == head_after
     assert mocked_git_push.call_count == 1  # 0 for commit, 1 for tag
     assert post_mocker.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_version_w_commit_parser_cache(
+    repo_result: BuiltRepoResult,
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    file_in_repo: str,
+    mocked_git_push: MagicMock,
+    post_mocker: Mocker,
+):
+    repo = repo_result["repo"]
+    cache_dir = Path(repo.working_dir, ".semantic_release_cache")
+
+    # setup: enable the parse cache & add a commit to release
+    update_pyproject_toml("tool.semantic_release.commit_parser_cache.enabled", True)
+    add_text_to_file(repo, file_in_repo)
+    repo.git.commit(m="feat: add a new feature", a=True)
+    repo_status_before = repo.git.status(short=True)
+
+    # Execute (once to populate the cache and once to read from it)
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--print"]
+    first_result = run_cli(cli_cmd[1:])
+    second_result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(first_result, cli_cmd)
+    assert_successful_exit_code(second_result, cli_cmd)
+    assert first_result.stdout == second_result.stdout
+    assert cache_dir.joinpath("parse_results.sqlite3").exists()
+
+    # The cache must never show up as a change to the repository
+    assert repo_status_before == repo.git.status(short=True)
+    assert mocked_git_push.call_count == 0
+    assert post_mocker.call_count == 0
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_version_w_commit_parser_stats(
+    repo_result: BuiltRepoResult,
+    run_cli: RunCliFn,
+    update_pyproject_toml: UpdatePyprojectTomlFn,
+    file_in_repo: str,
+    tmp_path_factory: pytest.TempPathFactory,
+    mocked_git_push: MagicMock,
+    post_mocker: Mocker,
+):
+    repo = repo_result["repo"]
+    stats_file = tmp_path_factory.mktemp("stats") / "parser_stats.json"
+
+    # setup: enable the parser statistics & add a commit to release
+    update_pyproject_toml("tool.semantic_release.commit_parser_stats.enabled", True)
+    update_pyproject_toml(
+        "tool.semantic_release.commit_parser_stats.output", str(stats_file)
+    )
+    update_pyproject_toml(
+        "tool.semantic_release.commit_parser_stats.slowest_commits", 2
+    )
+    add_text_to_file(repo, file_in_repo)
+    repo.git.commit(m="feat: add a new feature", a=True)
+    add_text_to_file(repo, file_in_repo)
+    repo.git.commit(m="fix: fix the new feature", a=True)
+
+    # Execute
+    cli_cmd = [MAIN_PROG_NAME, VERSION_SUBCMD, "--print"]
+    result = run_cli(cli_cmd[1:])
+
+    # Evaluate
+    assert_successful_exit_code(result, cli_cmd)
+    stats = json.loads(stats_file.read_text(encoding="utf-8"))
+    assert stats["parsers"] == ["ConventionalCommitParser"]
+    assert stats["commits"] > 0
+    assert stats["commits"] <= len(list(repo.iter_commits()))
+    assert stats["parsed_commits"] + stats["parse_errors"] >= stats["commits"]
+    assert stats["phases"]["parse_message"]["calls"] > 0
+    assert stats["phases"]["git_log"]["calls"] > 0
+    assert len(stats["slowest_commits"]) == 2
+    assert all(
+        repo.commit(commit["sha"]).hexsha == commit["sha"]
+        for commit in stats["slowest_commits"]
+    )
+    assert mocked_git_push.call_count == 0
+    assert post_mocker.call_count == 0
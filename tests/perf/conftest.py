@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
+from semantic_release.commit_parser.conventional.options_monorepo import (
+    ConventionalCommitMonorepoParserOptions,
+)
+from semantic_release.commit_parser.conventional.parser_monorepo import (
+    ConventionalCommitMonorepoParser,
+)
+from semantic_release.version.translator import VersionTranslator
+
+from tests.perf.synthetic_repo import (
+    MONOREPO_PACKAGES,
+    SyntheticRepoSpec,
+    build_synthetic_repo,
+)
+
+if TYPE_CHECKING:
+    from git import Repo
+
+    from semantic_release.commit_parser import CommitParser, ParseResult, ParserOptions
+
+
+SYNTHETIC_REPO_SPECS = [
+    pytest.param(SyntheticRepoSpec(1_000, tag_every=10), id="linear-1k"),
+    # 1000 tags
+    pytest.param(SyntheticRepoSpec(10_000, tag_every=10), id="linear-10k"),
+    pytest.param(
+        SyntheticRepoSpec(10_000, tag_every=20, layout="merges", annotated_tags=True),
+        id="merges-10k",
+    ),
+    pytest.param(SyntheticRepoSpec(10_000, layout="squash"), id="squash-10k"),
+    pytest.param(SyntheticRepoSpec(10_000, layout="monorepo"), id="monorepo-10k"),
+    pytest.param(
+        SyntheticRepoSpec(100_000, tag_every=50),
+        id="linear-100k",
+        marks=pytest.mark.comprehensive,
+    ),
+]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Apply the perf marker to all tests in the performance test directory."""
+    perf_test_directory = Path(__file__).parent
+    for item in items:
+        if perf_test_directory in item.path.parents:
+            item.add_marker(pytest.mark.perf)
+
+
+@pytest.fixture(scope="session", params=SYNTHETIC_REPO_SPECS)
+def synthetic_repo_spec(request: pytest.FixtureRequest) -> SyntheticRepoSpec:
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def synthetic_repo(
+    synthetic_repo_spec: SyntheticRepoSpec,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Repo:
+    """
+    A synthetic repository of the given spec, the repository is built once per session
+    and must not be modified by the benchmarks.
+    """
+    repo_dir = tmp_path_factory.mktemp("synthetic") / synthetic_repo_spec.name
+    return build_synthetic_repo(repo_dir, synthetic_repo_spec)
+
+
+@pytest.fixture
+def synthetic_repo_translator(
+    synthetic_repo_spec: SyntheticRepoSpec,
+) -> VersionTranslator:
+    return VersionTranslator(tag_format=synthetic_repo_spec.tag_format())
+
+
+@pytest.fixture
+def synthetic_repo_parser(
+    synthetic_repo: Repo,
+    synthetic_repo_spec: SyntheticRepoSpec,
+    monkeypatch: pytest.MonkeyPatch,
+) -> CommitParser[ParseResult, ParserOptions]:
+    if synthetic_repo_spec.layout != "monorepo":
+        return ConventionalCommitParser()  # type: ignore[return-value]
+
+    # Path filters are relative to the current working directory
+    monkeypatch.chdir(str(synthetic_repo.working_dir))
+    return ConventionalCommitMonorepoParser(  # type: ignore[return-value]
+        ConventionalCommitMonorepoParserOptions(
+            path_filters=(f"packages/{MONOREPO_PACKAGES[0]}",)
+        )
+    )
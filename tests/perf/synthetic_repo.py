@@ -0,0 +1,228 @@
+"""
+Fast generator of large synthetic repositories for the performance benchmarks.
+
+Instead of creating each commit with separate git invocations (like the repository
+fixtures of the test suite), the whole history is written as a single stream to
+``git fast-import`` which creates 100k commits in a matter of seconds.
+"""
+
+from __future__ import annotations
+
+import random
+import subprocess
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from git import Repo
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Iterator, Literal
+
+    RepoLayout = Literal["linear", "merges", "squash", "monorepo"]
+
+
+COMMIT_TYPES = ("feat", "fix", "fix", "docs", "refactor", "chore", "perf", "test")
+SCOPES = ("cli", "parser", "changelog", "config", "hvcs", "version")
+MONOREPO_PACKAGES = ("pkg-a", "pkg-b")
+
+_AUTHOR = "Benchmark Author <benchmark@example.com>"
+_START_TIMESTAMP = 1_600_000_000
+
+
+@dataclass(frozen=True)
+class SyntheticRepoSpec:
+    """
+    The shape of a synthetic repository.
+
+    :param num_commits: The number of commits on the main branch (excluding the
+        commits of merged feature branches)
+    :param tag_every: A release is tagged every ``tag_every`` commits
+    :param layout: ``linear`` (conventional commits only), ``merges`` (feature branches
+        merged into main), ``squash`` (squash merged pull requests holding multiple
+        conventional commits) or ``monorepo`` (two packages, tagged independently)
+    :param annotated_tags: Whether the release tags are annotated
+    :param seed: The seed of the pseudo-random commit types, scopes & files
+    """
+
+    num_commits: int
+    tag_every: int = 50
+    layout: RepoLayout = "linear"
+    annotated_tags: bool = False
+    seed: int = 123456
+
+    @property
+    def name(self) -> str:
+        return f"{self.layout}-{self.num_commits}"
+
+    def tag_format(self, package: str = MONOREPO_PACKAGES[0]) -> str:
+        return f"{package}-v{{version}}" if self.layout == "monorepo" else "v{version}"
+
+
+def _data(content: str) -> bytes:
+    payload = content.encode("utf-8")
+    return b"data %d\n%s\n" % (len(payload), payload)
+
+
+class _StreamWriter:
+    def __init__(self, spec: SyntheticRepoSpec) -> None:
+        self.spec = spec
+        self.rng = random.Random(spec.seed)  # noqa: S311 (not used for security)
+        self.next_mark = 1
+        self.timestamp = _START_TIMESTAMP
+        self.versions = dict.fromkeys(
+            MONOREPO_PACKAGES if spec.layout == "monorepo" else ("",), (0, 1, 0)
+        )
+        self.pending_bumps: dict[str, int] = {}
+
+    def commit(
+        self,
+        ref: str,
+        message: str,
+        path: str,
+        parents: tuple[int, ...],
+    ) -> tuple[int, bytes]:
+        mark = self.next_mark
+        self.next_mark += 1
+        self.timestamp += 60
+        signature = f"{_AUTHOR} {self.timestamp} +0000"
+
+        chunks = [
+            f"commit {ref}\nmark :{mark}\n".encode(),
+            f"author {signature}\ncommitter {signature}\n".encode(),
+            _data(message),
+        ]
+        if parents:
+            chunks.append(f"from :{parents[0]}\n".encode())
+            chunks.extend(f"merge :{parent}\n".encode() for parent in parents[1:])
+
+        chunks.append(f"M 100644 inline {path}\n".encode())
+        chunks.append(_data(f"change {mark} of {path}"))
+        return mark, b"".join(chunks)
+
+    def tag(self, name: str, mark: int) -> bytes:
+        if not self.spec.annotated_tags:
+            return f"reset refs/tags/{name}\nfrom :{mark}\n\n".encode()
+
+        return b"".join(
+            [
+                f"tag {name}\nfrom :{mark}\n".encode(),
+                f"tagger {_AUTHOR} {self.timestamp} +0000\n".encode(),
+                _data(f"Release {name}"),
+            ]
+        )
+
+    def conventional_message(self, index: int) -> tuple[str, int]:
+        commit_type = self.rng.choice(COMMIT_TYPES)
+        scope = self.rng.choice(SCOPES)
+        bump = (
+            2 if commit_type == "feat" else 1 if commit_type in ("fix", "perf") else 0
+        )
+        message = str.join(
+            "\n",
+            [
+                f"{commit_type}({scope}): change number {index}",
+                "",
+                f"Some body text describing change {index}",
+                "over multiple lines.",
+                "",
+                f"Closes: #{index}",
+            ],
+        )
+        return message, bump
+
+    def squash_message(self, index: int) -> tuple[str, int]:
+        messages = [self.conventional_message(index * 10 + i) for i in range(4)]
+        subject = messages[0][0].split("\n", maxsplit=1)[0]
+        body = str.join(
+            "\n\n", (f"* {msg.split(chr(10), 1)[0]}" for msg, _ in messages[1:])
+        )
+        return (
+            f"{subject} (#{index})\n\n{body}",
+            max(bump for _, bump in messages),
+        )
+
+    def release(self, package: str, mark: int) -> Iterator[bytes]:
+        if not (bump := self.pending_bumps.pop(package, 0)):
+            return
+
+        major, minor, patch = self.versions[package]
+        version = (major, minor + 1, 0) if bump > 1 else (major, minor, patch + 1)
+        self.versions[package] = version
+
+        prefix = f"{package}-v" if package else "v"
+        yield self.tag(f"{prefix}{str.join('.', map(str, version))}", mark)
+
+
+def generate_fast_import_stream(spec: SyntheticRepoSpec) -> Iterator[bytes]:
+    """Yield the ``git fast-import`` stream of the synthetic repository."""
+    writer = _StreamWriter(spec)
+    main_ref = "refs/heads/main"
+    head: tuple[int, ...] = ()
+
+    for index in range(1, spec.num_commits + 1):
+        package = ""
+        path = f"src/module_{writer.rng.randrange(50)}.py"
+
+        if spec.layout == "monorepo":
+            package = writer.rng.choice(MONOREPO_PACKAGES)
+            path = f"packages/{package}/{path}"
+
+        if spec.layout == "squash" and index % 5 == 0:
+            message, bump = writer.squash_message(index)
+        else:
+            message, bump = writer.conventional_message(index)
+
+        if spec.layout == "merges" and index % 10 == 0:
+            # A short feature branch which is merged back into main
+            branch_ref = f"refs/heads/feature/{index}"
+            branch_head = head
+            bump = 0
+            for offset in range(2):
+                branch_message, branch_bump = writer.conventional_message(
+                    index * 10 + offset
+                )
+                branch_mark, chunk = writer.commit(
+                    branch_ref, branch_message, f"src/feature_{index}.py", branch_head
+                )
+                branch_head = (branch_mark,)
+                bump = max(bump, branch_bump)
+                yield chunk
+
+            message = f"Merge branch 'feature/{index}'"
+            mark, chunk = writer.commit(main_ref, message, path, (*head, *branch_head))
+            yield chunk
+            yield f"reset {branch_ref}\nfrom 0000000000000000000000000000000000000000\n\n".encode()
+        else:
+            mark, chunk = writer.commit(main_ref, message, path, head)
+            yield chunk
+
+        head = (mark,)
+        writer.pending_bumps[package] = max(writer.pending_bumps.get(package, 0), bump)
+
+        if index % spec.tag_every == 0:
+            for tagged_package in writer.versions:
+                yield from writer.release(tagged_package, mark)
+
+    yield b"done\n"
+
+
+def build_synthetic_repo(path: Path, spec: SyntheticRepoSpec) -> Repo:
+    """Create a repository with the history described by ``spec`` at ``path``."""
+    path.mkdir(parents=True, exist_ok=True)
+    repo = Repo.init(path, initial_branch="main")
+
+    with repo.config_writer("repository") as config:
+        config.set_value("user", "name", "Benchmark Author")
+        config.set_value("user", "email", "benchmark@example.com")
+        config.set_value("commit", "gpgsign", "false")
+        config.set_value("tag", "gpgsign", "false")
+
+    subprocess.run(  # noqa: S603
+        ["git", "fast-import", "--quiet", "--done"],  # noqa: S607
+        input=b"".join(generate_fast_import_stream(spec)),
+        cwd=path,
+        check=True,
+    )
+    repo.git.reset("--hard", "main")
+    return repo
@@ -0,0 +1,217 @@
+"""
+Benchmarks of each phase of a release on large synthetic repositories.
+
+Run with ``pytest -m perf --perf`` (add ``--comprehensive`` for the 100k commit
+repository), see the contributing guide to store & compare against a baseline. The
+benchmarks of the ``load-commits`` group compare the commit loader with GitPython.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from semantic_release.changelog.context import ChangelogMode, make_changelog_context
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.cli.changelog_writer import render_default_changelog_file
+from semantic_release.cli.config import ChangelogOutputFormat
+from semantic_release.history import CommitHistory, TagIndex
+from semantic_release.history.loader import iter_commit_records
+from semantic_release.hvcs.github import Github
+from semantic_release.version.algorithm import next_version
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Dict, Tuple
+
+    from git import Repo
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from semantic_release.commit_parser import CommitParser, ParseResult, ParserOptions
+    from semantic_release.version.translator import VersionTranslator
+
+    SetupFn = Callable[[], Tuple[Tuple[Any, ...], Dict[str, Any]]]
+
+
+ROUNDS = 3
+
+
+def run_benchmark(
+    benchmark: BenchmarkFixture, target: Callable[..., Any], setup: SetupFn
+) -> Any:
+    # Every round starts from a cold state (no memoized history, tags or results)
+    return benchmark.pedantic(  # type: ignore[no-untyped-call]
+        target, setup=setup, rounds=ROUNDS, iterations=1
+    )
+
+
+def test_tag_versions(
+    benchmark: BenchmarkFixture,
+    synthetic_repo: Repo,
+    synthetic_repo_translator: VersionTranslator,
+):
+    result = run_benchmark(
+        benchmark,
+        lambda tag_index: tag_index.versions(synthetic_repo_translator),
+        setup=lambda: ((TagIndex(synthetic_repo),), {}),
+    )
+
+    assert result
+
+
+def test_load_commit_history(
+    benchmark: BenchmarkFixture,
+    synthetic_repo: Repo,
+    synthetic_repo_parser: CommitParser[ParseResult, ParserOptions],
+):
+    result = run_benchmark(
+        benchmark,
+        lambda commit_history: commit_history.topo_ordered_commits(),
+        setup=lambda: ((CommitHistory(synthetic_repo, synthetic_repo_parser),), {}),
+    )
+
+    assert result
+
+
+@pytest.mark.benchmark(group="load-commits")
+def test_load_commit_records(benchmark: BenchmarkFixture, synthetic_repo: Repo):
+    # The single git log stream of the commit history
+    result = run_benchmark(
+        benchmark,
+        lambda: [
+            (record.message, record.author, record.parent_shas)
+            for record in iter_commit_records(synthetic_repo)
+        ],
+        setup=lambda: ((), {}),
+    )
+
+    assert result
+
+
+@pytest.mark.benchmark(group="load-commits")
+def test_load_gitpython_commits(benchmark: BenchmarkFixture, synthetic_repo: Repo):
+    # The baseline of the loader, GitPython reads each commit object on first use
+    result = run_benchmark(
+        benchmark,
+        lambda: [
+            (commit.message, commit.author, commit.parents)
+            for commit in synthetic_repo.iter_commits("HEAD", topo_order=True)
+        ],
+        setup=lambda: ((), {}),
+    )
+
+    assert result
+
+
+def test_parse_commits(
+    benchmark: BenchmarkFixture,
+    synthetic_repo: Repo,
+    synthetic_repo_parser: CommitParser[ParseResult, ParserOptions],
+):
+    def setup() -> tuple[tuple[CommitHistory, list[Any]], dict[str, Any]]:
+        commit_history = CommitHistory(synthetic_repo, synthetic_repo_parser)
+        return (commit_history, list(commit_history.topo_ordered_commits())), {}
+
+    result = run_benchmark(
+        benchmark,
+        lambda commit_history, commits: commit_history.parse_all(commits),
+        setup=setup,
+    )
+
+    assert result
+
+
+def test_next_version(
+    benchmark: BenchmarkFixture,
+    synthetic_repo: Repo,
+    synthetic_repo_translator: VersionTranslator,
+    synthetic_repo_parser: CommitParser[ParseResult, ParserOptions],
+):
+    result = run_benchmark(
+        benchmark,
+        lambda commit_history: next_version(
+            repo=synthetic_repo,
+            translator=synthetic_repo_translator,
+            commit_parser=synthetic_repo_parser,
+            allow_zero_version=True,
+            major_on_zero=False,
+            commit_history=commit_history,
+        ),
+        setup=lambda: ((CommitHistory(synthetic_repo, synthetic_repo_parser),), {}),
+    )
+
+    assert result
+
+
+def test_release_history(
+    benchmark: BenchmarkFixture,
+    synthetic_repo: Repo,
+    synthetic_repo_translator: VersionTranslator,
+    synthetic_repo_parser: CommitParser[ParseResult, ParserOptions],
+):
+    result = run_benchmark(
+        benchmark,
+        lambda commit_history: ReleaseHistory.from_git_history(
+            repo=synthetic_repo,
+            translator=synthetic_repo_translator,
+            commit_parser=synthetic_repo_parser,
+            commit_history=commit_history,
+        ),
+        setup=lambda: ((CommitHistory(synthetic_repo, synthetic_repo_parser),), {}),
+    )
+
+    assert result.released
+
+
+def test_release_history_of_latest_release(
+    benchmark: BenchmarkFixture,
+    synthetic_repo: Repo,
+    synthetic_repo_translator: VersionTranslator,
+    synthetic_repo_parser: CommitParser[ParseResult, ParserOptions],
+):
+    result = run_benchmark(
+        benchmark,
+        lambda commit_history: ReleaseHistory.from_git_history(
+            repo=synthetic_repo,
+            translator=synthetic_repo_translator,
+            commit_parser=synthetic_repo_parser,
+            commit_history=commit_history,
+            latest_releases=1,
+        ),
+        setup=lambda: ((CommitHistory(synthetic_repo, synthetic_repo_parser),), {}),
+    )
+
+    assert result.released
+
+
+def test_render_changelog(
+    benchmark: BenchmarkFixture,
+    synthetic_repo: Repo,
+    synthetic_repo_translator: VersionTranslator,
+    synthetic_repo_parser: CommitParser[ParseResult, ParserOptions],
+):
+    changelog_context = make_changelog_context(
+        hvcs_client=Github("https://github.com/example/synthetic.git"),
+        release_history=ReleaseHistory.from_git_history(
+            repo=synthetic_repo,
+            translator=synthetic_repo_translator,
+            commit_parser=synthetic_repo_parser,
+        ),
+        mode=ChangelogMode.INIT,
+        prev_changelog_file=Path("CHANGELOG.md"),
+        insertion_flag="<!-- version list -->",
+        mask_initial_release=True,
+    )
+
+    result = run_benchmark(
+        benchmark,
+        lambda: render_default_changelog_file(
+            output_format=ChangelogOutputFormat.MARKDOWN,
+            changelog_context=changelog_context,
+            changelog_style="conventional",
+        ),
+        setup=lambda: ((), {}),
+    )
+
+    assert result
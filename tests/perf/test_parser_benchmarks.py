@@ -0,0 +1,252 @@
+"""
+Benchmarks of the commit parsers on large commit messages.
+
+Grouped dependency updates (dependabot) hold a long yaml document of the updated
+dependencies (with many ``key: value`` lines that look like git footers) followed by
+the git trailers of the commit. Squash merged pull requests hold the messages of all
+of the squashed commits. Gitmoji histories use the whole gitmoji set as commit types.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.commit_parser.angular import (
+    AngularCommitParser,
+    AngularParserOptions,
+)
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitMonorepoParser,
+    ConventionalCommitMonorepoParserOptions,
+    ConventionalCommitParser,
+)
+from semantic_release.commit_parser.emoji import EmojiCommitParser, EmojiParserOptions
+from semantic_release.commit_parser.scipy import ScipyCommitParser
+from semantic_release.commit_parser.token import ParsedCommit
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from semantic_release.commit_parser import CommitParser, ParseResult, ParserOptions
+
+    from tests.conftest import MakeCommitObjFn
+
+
+NUM_DEPENDENCIES = 50
+NUM_SQUASHED_COMMITS = 60
+NUM_GITMOJI_COMMITS = 200
+NUM_PATH_FILTERS = 40
+NUM_CHANGED_FILES = 2000
+
+# The gitmoji set (https://gitmoji.dev), by bump level
+GITMOJI_MAJOR = (":boom:",)
+GITMOJI_MINOR = (
+    ":sparkles:", ":children_crossing:", ":lipstick:", ":iphone:", ":egg:",
+    ":chart_with_upwards_trend:", ":tada:", ":globe_with_meridians:", ":card_file_box:",
+    ":busts_in_silhouette:", ":building_construction:", ":alembic:", ":passport_control:",
+    ":triangular_flag_on_post:", ":seedling:", ":necktie:", ":bricks:", ":thread:",
+)  # fmt: skip
+GITMOJI_PATCH = (
+    ":ambulance:", ":lock:", ":bug:", ":zap:", ":goal_net:", ":alien:", ":wheelchair:",
+    ":speech_balloon:", ":mag:", ":apple:", ":penguin:", ":checkered_flag:", ":robot:",
+    ":green_apple:", ":adhesive_bandage:", ":arrow_down:", ":arrow_up:", ":pushpin:",
+    ":heavy_plus_sign:", ":heavy_minus_sign:", ":closed_lock_with_key:", ":pencil2:",
+    ":rewind:", ":package:", ":dizzy:", ":safety_vest:", ":stethoscope:",
+    ":money_with_wings:", ":label:", ":loud_sound:", ":mute:", ":wrench:",
+)  # fmt: skip
+GITMOJI_OTHER = (
+    ":art:", ":fire:", ":memo:", ":rocket:", ":white_check_mark:", ":bookmark:",
+    ":rotating_light:", ":construction:", ":green_heart:", ":construction_worker:",
+    ":recycle:", ":hammer:", ":poop:", ":twisted_rightwards_arrows:", ":truck:",
+    ":page_facing_up:", ":bento:", ":bulb:", ":beers:", ":clown_face:", ":see_no_evil:",
+    ":camera_flash:", ":wastebasket:", ":monocle_face:", ":coffin:", ":test_tube:",
+    ":technologist:",
+)  # fmt: skip
+
+
+def dependabot_body(num_dependencies: int) -> str:
+    dependencies = [f"dependency-{index}" for index in range(num_dependencies)]
+    return str.join(
+        "\n",
+        [
+            f"Bumps the production group with {num_dependencies} updates:",
+            "",
+            *(
+                f"Updates `{dep}` from 1.{index}.0 to 1.{index + 1}.0\n"
+                f"- [Release notes](https://github.com/example/{dep}/releases)\n"
+                f"- [Commits](https://github.com/example/{dep}/compare/v1.{index}.0...v1.{index + 1}.0)\n"
+                for index, dep in enumerate(dependencies)
+            ),
+            "---",
+            "updated-dependencies:",
+            *(
+                f"- dependency-name: {dep}\n"
+                "  dependency-type: direct:production\n"
+                "  update-type: version-update:semver-minor\n"
+                "  dependency-group: production"
+                for dep in dependencies
+            ),
+            "...",
+            "",
+            "Resolves: #123",
+            "Signed-off-by: dependabot[bot] <support@github.com>",
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "parser, subject",
+    [
+        pytest.param(
+            ConventionalCommitParser(),
+            "build(deps): bump the production group with 50 updates",
+            id="conventional",
+        ),
+        pytest.param(
+            AngularCommitParser(),
+            "build(deps): bump the production group with 50 updates",
+            id="angular",
+        ),
+        pytest.param(
+            EmojiCommitParser(),
+            ":arrow_up: bump the production group with 50 updates",
+            id="emoji",
+        ),
+        pytest.param(
+            ScipyCommitParser(),
+            "MAINT: bump the production group with 50 updates",
+            id="scipy",
+        ),
+    ],
+)
+def test_parse_dependabot_commit(
+    benchmark: BenchmarkFixture,
+    make_commit_obj: MakeCommitObjFn,
+    parser: CommitParser[ParseResult, ParserOptions],
+    subject: str,
+):
+    commit = make_commit_obj(f"{subject}\n\n{dependabot_body(NUM_DEPENDENCIES)}")
+
+    result = benchmark(parser.parse, commit)
+
+    parsed_results = result if isinstance(result, list) else [result]
+    assert all(isinstance(parsed, ParsedCommit) for parsed in parsed_results)
+
+
+def squash_merge_message(subjects: list[str]) -> str:
+    return str.join(
+        "\n\n",
+        [
+            f"{subjects[0]} (#100)",
+            *(
+                f"* {subject}\n\n  Some description of change {index}\n  over two lines."
+                for index, subject in enumerate(subjects[1:])
+            ),
+            "Closes: #99",
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "parser, subject_format",
+    [
+        pytest.param(
+            ConventionalCommitParser(),
+            "fix(parser): change number {}",
+            id="conventional",
+        ),
+        pytest.param(
+            AngularCommitParser(AngularParserOptions(parse_squash_commits=True)),
+            "fix(parser): change number {}",
+            id="angular",
+        ),
+        pytest.param(EmojiCommitParser(), ":bug: change number {}", id="emoji"),
+        pytest.param(ScipyCommitParser(), "BUG: change number {}", id="scipy"),
+    ],
+)
+def test_parse_squashed_commit(
+    benchmark: BenchmarkFixture,
+    make_commit_obj: MakeCommitObjFn,
+    parser: CommitParser[ParseResult, ParserOptions],
+    subject_format: str,
+):
+    commit = make_commit_obj(
+        squash_merge_message(
+            [subject_format.format(index) for index in range(NUM_SQUASHED_COMMITS)]
+        )
+    )
+
+    result = benchmark(parser.parse, commit)
+
+    assert isinstance(result, list)
+    assert len(result) == NUM_SQUASHED_COMMITS
+
+
+def gitmoji_message(index: int) -> str:
+    gitmojis = [*GITMOJI_OTHER, *GITMOJI_PATCH, *GITMOJI_MINOR, *GITMOJI_MAJOR]
+    gitmoji = gitmojis[index * 7 % len(gitmojis)]
+    if index % 10:
+        return f"{gitmoji} change number {index}\n\nSome description of the change."
+
+    # Every tenth commit is a squash merged pull request
+    return squash_merge_message(
+        [
+            f"{gitmojis[(index + offset) * 11 % len(gitmojis)]} change number {offset}"
+            for offset in range(5)
+        ]
+    )
+
+
+def test_parse_gitmoji_history(
+    benchmark: BenchmarkFixture,
+    make_commit_obj: MakeCommitObjFn,
+):
+    parser = EmojiCommitParser(
+        EmojiParserOptions(
+            major_tags=GITMOJI_MAJOR,
+            minor_tags=GITMOJI_MINOR,
+            patch_tags=GITMOJI_PATCH,
+            other_allowed_tags=GITMOJI_OTHER,
+        )
+    )
+    commits = [
+        make_commit_obj(gitmoji_message(index)) for index in range(NUM_GITMOJI_COMMITS)
+    ]
+
+    results = benchmark(lambda: list(parser.parse_many(commits)))
+
+    assert all(isinstance(result, ParsedCommit) for result in results)
+    assert len(results) > NUM_GITMOJI_COMMITS
+
+
+def test_parse_monorepo_commit_with_many_changed_files(
+    benchmark: BenchmarkFixture,
+    make_commit_obj: MakeCommitObjFn,
+):
+    parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(
+            path_filters=(
+                ".",
+                *(f"!generated_{index}/**" for index in range(NUM_PATH_FILTERS - 1)),
+            ),
+        )
+    )
+    commit = make_commit_obj("fix: update the generated files")
+    # Only the last changed file is not ignored
+    changed_files = [
+        *(
+            f"generated_{index % (NUM_PATH_FILTERS - 1)}/file_{index}.py"
+            for index in range(NUM_CHANGED_FILES - 1)
+        ),
+        "src/module.py",
+    ]
+    parser.changed_files_provider = mock.Mock(
+        get_changed_files=mock.Mock(return_value=changed_files)
+    )
+
+    result = benchmark(parser.parse_commit, commit)
+
+    assert isinstance(result, ParsedCommit)
@@ -0,0 +1,80 @@
+"""
+Benchmarks of stamping the new version into the source files of a large monorepo.
+
+Each package has an ``__init__.py``, a ``package.json`` & a Helm ``Chart.yaml`` (with
+both the chart & the app version) declared through ``version_variables``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from semantic_release.version.declarations.pattern import PatternVersionDeclaration
+from semantic_release.version.declarations.stamp import stamp_version_in_files
+from semantic_release.version.version import Version
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+NUM_PACKAGES = 100
+ROUNDS = 5
+
+PACKAGE_FILES = {
+    "__init__.py": '"""A package."""\n\n__version__ = "{version}"\n',
+    "package.json": '{{\n  "name": "package",\n  "version": "{version}"\n}}\n',
+    "Chart.yaml": "apiVersion: v2\nversion: {version}\nappVersion: {version}\n",
+}
+
+PACKAGE_VERSION_VARIABLES = [
+    "__init__.py:__version__",
+    "package.json:version",
+    "Chart.yaml:version",
+    "Chart.yaml:appVersion",
+]
+
+
+@pytest.fixture
+def package_dirs(tmp_path: Path) -> list[Path]:
+    package_dirs = [tmp_path / f"package-{index}" for index in range(NUM_PACKAGES)]
+    for package_dir in package_dirs:
+        package_dir.mkdir()
+
+    return package_dirs
+
+
+def reset_package_files(package_dirs: list[Path]) -> None:
+    for package_dir in package_dirs:
+        for file_name, content in PACKAGE_FILES.items():
+            (package_dir / file_name).write_text(content.format(version="1.0.0"))
+
+
+@pytest.mark.parametrize("jobs", [1, 8])
+def test_stamp_version_in_files(
+    benchmark: BenchmarkFixture, package_dirs: list[Path], jobs: int
+):
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            str(package_dir / version_variable), tag_format="v{version}"
+        )
+        for package_dir in package_dirs
+        for version_variable in PACKAGE_VERSION_VARIABLES
+    ]
+    new_version = Version.parse("1.1.0")
+
+    def setup() -> tuple[tuple[()], dict[str, int]]:
+        reset_package_files(package_dirs)
+        return (), {"jobs": jobs}
+
+    result = benchmark.pedantic(  # type: ignore[no-untyped-call]
+        lambda jobs: stamp_version_in_files(declarations, new_version, jobs=jobs),
+        setup=setup,
+        rounds=ROUNDS,
+        iterations=1,
+    )
+
+    assert len(result) == len(PACKAGE_FILES) * NUM_PACKAGES
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from re import DOTALL, IGNORECASE, VERBOSE, compile as regexp
+from typing import TYPE_CHECKING
+
+import pytest
+
+from semantic_release.changelog.exclusion import CommitExclusionMatcher
+
+if TYPE_CHECKING:
+    from re import Pattern
+
+
+MESSAGES = [
+    "chore(release): 1.2.0",
+    "chore: update the dependencies",
+    "CHORE: update the dependencies",
+    "docs: document the feature",
+    "docs docs: repeated",
+    "feat: add a feature",
+    "ci: update the workflow",
+    "",
+]
+
+
+@pytest.mark.parametrize(
+    "patterns, is_combined",
+    [
+        (
+            [regexp(r"^chore\(release\):"), regexp(r"chore"), regexp(r"docs")],
+            True,
+        ),
+        ([regexp(r"chore"), regexp(r"^chore\(release\):")], True),
+        (
+            [
+                regexp(r"(?P<type>docs|ci)\b"),
+                regexp(r"(\w+)(?:\(\w+\))?: update"),
+            ],
+            True,
+        ),
+        ([regexp(r"chore", IGNORECASE), regexp(r"docs", IGNORECASE)], True),
+        ([regexp(r"chore")], False),
+        # Not combined, but still matched in order
+        ([regexp(r"(\w+) \1"), regexp(r"docs")], False),
+        ([regexp(r"(?i)chore"), regexp(r"docs")], False),
+        ([regexp(r"(?i)chore"), regexp(r"(?i)docs")], False),
+        ([regexp(r"chore  # comment", VERBOSE), regexp(r"docs", VERBOSE)], False),
+    ],
+)
+def test_matcher_matches_patterns_in_order(
+    patterns: list[Pattern[str]], is_combined: bool
+):
+    matcher = CommitExclusionMatcher(patterns)
+
+    assert is_combined == (matcher._matcher is not None)
+    for sha, message in zip("abcdefgh", MESSAGES):
+        expected = next((p for p in patterns if p.match(message)), None)
+        assert expected is matcher.match(sha * 40, message)
+
+
+def test_matcher_caches_matches_per_commit(monkeypatch: pytest.MonkeyPatch):
+    matcher = CommitExclusionMatcher([regexp("chore"), regexp("docs")])
+    matched_messages = []
+    match_index = matcher._match_index
+
+    def counting_match_index(commit_message: str) -> int | None:
+        matched_messages.append(commit_message)
+        return match_index(commit_message)
+
+    monkeypatch.setattr(matcher, "_match_index", counting_match_index)
+
+    for _ in range(3):
+        matcher.match("a" * 40, "chore: a chore")
+        matcher.record_exclusion("a" * 40, "chore: a chore")
+        matcher.match("b" * 40, "feat: a feature")
+        matcher.match("b" * 40, "docs: a squashed piece", piece=1)
+
+    assert matched_messages == [
+        "chore: a chore",
+        "feat: a feature",
+        "docs: a squashed piece",
+    ]
+
+
+def test_matcher_limits_the_message_body():
+    matcher = CommitExclusionMatcher([regexp(r"feat.*\bsecret\b", DOTALL)], 20)
+    unlimited_matcher = CommitExclusionMatcher(matcher.patterns)
+    message = "feat: a feature\n\nsome lines\nof text\nwith a secret"
+
+    assert matcher.match("a" * 40, message) is None
+    assert unlimited_matcher.match("a" * 40, message) is unlimited_matcher.patterns[0]
+
+
+def test_matcher_counts_excluded_commits_per_pattern():
+    patterns = [regexp("chore"), regexp("docs"), regexp("never")]
+    matcher = CommitExclusionMatcher(patterns)
+
+    for sha, message, piece in [
+        ("a" * 40, "chore: a chore", 0),
+        ("b" * 40, "docs: some docs", 0),
+        ("c" * 40, "chore: another chore", 0),
+        # counted once per commit
+        ("a" * 40, "chore: a chore", 0),
+        # the pieces of a squashed commit are counted separately
+        ("d" * 40, "chore: squashed chore", 0),
+        ("d" * 40, "docs: squashed docs", 1),
+        ("e" * 40, "feat: not excluded", 0),
+    ]:
+        matcher.record_exclusion(sha, message, piece)
+
+    assert matcher.exclusion_counts() == list(zip(patterns, [3, 2, 0]))
+    assert list(matcher) == patterns
+    assert len(matcher) == 3
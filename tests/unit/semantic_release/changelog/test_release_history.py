@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import datetime
+from re import compile as regexp
 from typing import TYPE_CHECKING, NamedTuple
 
 import pytest
 from git import Actor
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
+from semantic_release.changelog.exclusion import CommitExclusionMatcher
 from semantic_release.changelog.release_history import ReleaseHistory
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
@@ -302,3 +304,94 @@ def test_all_matching_repo_tags_are_released(
 
     for tag in repo.tags:
         assert translator.from_tag(tag.name) in release_history.released
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_trunk_only_n_prereleases_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+@pytest.mark.parametrize("latest_releases", [0, 1, 2])
+def test_bounded_release_history_matches_latest_releases(
+    repo_result: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    file_in_repo: str,
+    latest_releases: int,
+):
+    repo = repo_result["repo"]
+    add_text_to_file(repo, file_in_repo)
+    repo.git.commit(m=CONVENTIONAL_COMMITS_MINOR[0])
+
+    release_history = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+    )
+    bounded_history = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        latest_releases=latest_releases,
+    )
+    expected_versions = list(release_history.released)[: latest_releases + 1]
+
+    assert release_history.unreleased == bounded_history.unreleased
+    assert len(release_history.released) > len(bounded_history.released)
+    # The previous release is known, but only the latest releases are complete
+    assert expected_versions == list(bounded_history.released)[: latest_releases + 1]
+    for version in expected_versions[:latest_releases]:
+        assert release_history.released[version] == bounded_history.released[version]
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [lazy_fixture(repo_w_trunk_only_conventional_commits.__name__)],
+)
+def test_release_history_counts_excluded_commits_per_pattern(
+    repo_result: BuiltRepoResult, default_conventional_parser: ConventionalCommitParser
+):
+    repo = repo_result["repo"]
+    # Excludes the release commits
+    patterns = [regexp(r"^\d+\.\d+\.\d+"), regexp(r"^never")]
+    exclusion_matcher = CommitExclusionMatcher(patterns)
+
+    def count_elements(release_history: ReleaseHistory) -> int:
+        return sum(map(len, release_history.unreleased.values())) + sum(
+            len(results)
+            for release in release_history.released.values()
+            for results in release["elements"].values()
+        )
+
+    full_history = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+    )
+    expected_history = ReleaseHistory.from_git_history(
+        repo=repo,
+        translator=VersionTranslator(),
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        exclude_commit_patterns=patterns,
+    )
+
+    # Action (twice, the commits are only counted once)
+    for _ in range(2):
+        actual_history = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=VersionTranslator(),
+            commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+            exclude_commit_patterns=exclusion_matcher,
+        )
+
+    assert expected_history.unreleased == actual_history.unreleased
+    assert expected_history.released == actual_history.released
+    num_excluded = count_elements(full_history) - count_elements(actual_history)
+    assert num_excluded > 0
+    assert [
+        (patterns[0], num_excluded),
+        (patterns[1], 0),
+    ] == exclusion_matcher.exclusion_counts()
@@ -1230,3 +1230,101 @@ def test_parser_ignore_merge_commit(
 
     assert isinstance(parsed_result, ParseError)
     assert "Ignoring merge commit" in parsed_result.error
+
+
+def test_parser_parse_many_matches_parse(
+    default_conventional_parser: ConventionalCommitParser,
+    make_commit_obj: MakeCommitObjFn,
+):
+    parser = ConventionalCommitParser(
+        options=ConventionalCommitParserOptions(
+            **{
+                **default_conventional_parser.options.__dict__,
+                "ignore_merge_commits": True,
+            }
+        )
+    )
+
+    merge_commit = make_commit_obj("Merge branch 'feat/add-new-feature' into 'main'")
+    merge_commit.parents = [
+        make_commit_obj("fix: fix a bug"),
+        make_commit_obj("feat: add a new feature"),
+    ]
+    commits = [
+        make_commit_obj("feat(parser): add a new feature (#10)"),
+        merge_commit,
+        make_commit_obj("not a conventional commit"),
+        make_commit_obj(
+            dedent(
+                """\
+                feat(cli): add a new command (#11)
+
+                * fix(cli): fix the new command
+
+                * docs(cli): document the new command
+                """
+            )
+        ),
+    ]
+
+    expected_results = []
+    for commit in commits:
+        parsed = parser.parse(commit)
+        expected_results.extend(parsed if isinstance(parsed, list) else [parsed])
+
+    # Action
+    results = list(parser.parse_many(commits))
+
+    # Evaluate: a flat stream of the results (3 for the squashed commit) in order
+    assert len(results) == 6
+    assert [(type(r), r.commit.message) for r in results] == [
+        (type(r), r.commit.message) for r in expected_results
+    ]
+    assert [
+        r.linked_merge_request for r in results[-3:] if isinstance(r, ParsedCommit)
+    ] == ["#11"] * 3
+
+
+def test_parser_parse_many_uses_customized_parse(
+    make_commit_obj: MakeCommitObjFn,
+):
+    class CustomParser(ConventionalCommitParser):
+        def parse(self, commit):
+            return ParseError(commit, error="custom")
+
+    commits = [make_commit_obj("feat: add a new feature"), make_commit_obj("fix: a")]
+
+    results = list(CustomParser().parse_many(commits))
+
+    errors = [result.error for result in results if isinstance(result, ParseError)]
+    assert errors == ["custom", "custom"]
+
+
+def test_parser_limits_the_analyzed_body_size(
+    default_conventional_parser: ConventionalCommitParser,
+    make_commit_obj: MakeCommitObjFn,
+):
+    parser = ConventionalCommitParser(
+        options=ConventionalCommitParserOptions(
+            **{
+                **default_conventional_parser.options.__dict__,
+                "max_body_size": 100,
+            }
+        )
+    )
+    message_head = "fix(deps): update the lock file\n\nCloses: #12"
+    lock_file_diff = "\n".join(f"+ package-{i}==1.0.{i}" for i in range(10_000))
+    commit = make_commit_obj(f"{message_head}\n\n{lock_file_diff}")
+
+    # Action
+    parsed_results = parser.parse(commit)
+
+    assert isinstance(parsed_results, list)
+    assert 1 == len(parsed_results)
+    result = next(iter(parsed_results))
+    assert isinstance(result, ParsedCommit)
+    assert LevelBump.PATCH == result.bump
+    assert ("#12",) == result.linked_issues
+    # Only the lines within the limit are analyzed
+    assert sum(len(line) for line in result.descriptions) < 200
+    assert commit.hexsha == result.commit.hexsha
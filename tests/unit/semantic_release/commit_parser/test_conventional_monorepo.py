@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+
+from semantic_release.commit_parser.conventional.options_monorepo import (
+    ConventionalCommitMonorepoParserOptions,
+)
+from semantic_release.commit_parser.conventional.parser_monorepo import (
+    ConventionalCommitMonorepoParser,
+)
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "path_filters, changed_files, is_relevant",
+    [
+        ((".",), ["packages/pkg1/src/module.py"], True),
+        ((".",), ["packages/pkg2/src/module.py"], False),
+        ((".", "!*.md"), ["packages/pkg1/README.md"], False),
+        ((".", "!*.md"), ["packages/pkg1/README.md", "packages/pkg1/a.py"], True),
+        ((".", "!tests/**"), ["packages/pkg1/tests/test_a.py"], False),
+        (("src/*.py",), ["packages/pkg1/src/a.py"], True),
+        (("src/*.py",), ["packages/pkg1/src/a.md"], False),
+        # Path filters outside of the repository are ignored
+        (("../../../",), ["packages/pkg1/src/module.py"], False),
+        (("!*.md",), ["packages/pkg1/src/module.py"], False),
+    ],
+)
+def test_parser_filters_commits_by_changed_files(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    monkeypatch: pytest.MonkeyPatch,
+    path_filters: tuple[str, ...],
+    changed_files: list[str],
+    is_relevant: bool,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    package_dir = Path(str(repo.working_dir), "packages", "pkg1")
+    package_dir.mkdir(parents=True, exist_ok=True)
+    monkeypatch.chdir(package_dir)
+
+    parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(
+            path_filters=path_filters, scope_prefix="pkg1-"
+        )
+    )
+    parser.changed_files_provider = mock.Mock(
+        get_changed_files=mock.Mock(return_value=changed_files)
+    )
+    commit = repo.head.commit
+    commit.message = "fix: a fix"
+
+    # Action: a commit without a scope is only parsed with relevant changed files
+    result = parser.parse_commit(commit)
+
+    assert isinstance(result, ParsedCommit if is_relevant else ParseError)
+
+
+def test_parser_resolves_path_filters_once_per_working_directory(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    package_dirs = [
+        Path(str(repo.working_dir), "packages", name) for name in ("pkg1", "pkg2")
+    ]
+    parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(path_filters=(".",))
+    )
+    parser.changed_files_provider = mock.Mock(
+        get_changed_files=mock.Mock(return_value=["packages/pkg1/a.py"])
+    )
+    commit = repo.head.commit
+
+    resolved_paths: list[Path] = []
+    path_resolve = Path.resolve
+
+    def resolve(path: Path, strict: bool = False) -> Path:
+        resolved_paths.append(path)
+        return path_resolve(path, strict)
+
+    monkeypatch.setattr(Path, "resolve", resolve)
+
+    results: list[bool] = []
+    for package_dir in (*package_dirs, package_dirs[0]):
+        package_dir.mkdir(parents=True, exist_ok=True)
+        monkeypatch.chdir(package_dir)
+        results.extend(parser._has_relevant_changed_files(commit) for _ in range(3))
+
+    # The git root & working directory are resolved once per working directory
+    assert len(resolved_paths) == 4
+    assert results == [True] * 3 + [False] * 3 + [True] * 3
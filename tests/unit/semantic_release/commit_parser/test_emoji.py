@@ -1073,3 +1073,75 @@ def test_parser_ignore_merge_commit(
 
     assert isinstance(parsed_result, ParseError)
     assert "Ignoring merge commit" in parsed_result.error
+
+
+def test_parser_parse_many_matches_parse(
+    default_emoji_parser: EmojiCommitParser,
+    make_commit_obj: MakeCommitObjFn,
+):
+    commits = [
+        make_commit_obj(":sparkles: Add a new feature"),
+        make_commit_obj("Not an emoji commit"),
+        make_commit_obj(
+            dedent(
+                """\
+                :sparkles: Add a new command (#11)
+
+                * :bug: Fix the new command
+
+                * :memo: Document the new command
+                """
+            )
+        ),
+    ]
+
+    expected_results = []
+    for commit in commits:
+        parsed = default_emoji_parser.parse(commit)
+        expected_results.extend(parsed if isinstance(parsed, list) else [parsed])
+
+    # Action
+    results = list(default_emoji_parser.parse_many(commits))
+
+    # Evaluate: a flat stream of the results (3 for the squashed commit) in order
+    assert len(results) == 5
+    assert [(type(r), r.commit.message) for r in results] == [
+        (type(r), r.commit.message) for r in expected_results
+    ]
+
+
+def test_parser_with_large_emoji_set(make_commit_obj: MakeCommitObjFn):
+    parser = EmojiCommitParser(
+        EmojiParserOptions(
+            major_tags=(":boom:",),
+            minor_tags=(":sparkles:", *(f":custom_{index}:" for index in range(500))),
+            patch_tags=(":bug:", ":bug:fire:"),
+        )
+    )
+    commit = make_commit_obj(
+        dedent(
+            """\
+            :custom_250:(parser): add a custom change (#12)
+
+            * :bug:fire: fix a bug
+
+            * :custom_499: add another custom change
+            """
+        )
+    )
+
+    results = parser.parse(commit)
+
+    assert isinstance(results, list)
+    parsed_commits = [result for result in results if isinstance(result, ParsedCommit)]
+    assert [result.type for result in parsed_commits] == [
+        ":custom_250:",
+        ":bug:fire:",
+        ":custom_499:",
+    ]
+    assert [result.scope for result in parsed_commits] == ["parser", "", ""]
+    assert [result.bump for result in parsed_commits] == [
+        LevelBump.MINOR,
+        LevelBump.PATCH,
+        LevelBump.MINOR,
+    ]
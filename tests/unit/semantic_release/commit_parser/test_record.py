@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from semantic_release.commit_parser import ParsedCommit
+from semantic_release.commit_parser.record import CommitRecord
+from semantic_release.version.version import LevelBump
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def test_commit_record_from_commit(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit = repo.head.commit
+
+    record = CommitRecord.from_commit(commit)
+
+    assert commit.hexsha == record.hexsha
+    assert commit.hexsha[:7] == record.short_hash
+    assert commit.message == record.message
+    assert commit.author == record.author
+    assert commit.author.email == record.author.email
+    assert commit.committer == record.committer
+    assert commit.committed_datetime == record.committed_datetime
+    assert commit.authored_datetime == record.authored_datetime
+    assert tuple(p.hexsha for p in commit.parents) == record.parent_shas
+    assert commit == record
+    assert record is CommitRecord.from_commit(record)
+
+
+def test_commit_record_rehydrates_commit(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    head_commit = repo.head.commit
+
+    record = CommitRecord.from_commit(head_commit)
+
+    # Attributes which are not part of the record are provided by the full commit
+    assert head_commit.tree.hexsha == record.tree.hexsha
+    assert head_commit.stats.total == record.stats.total
+    assert [p.hexsha for p in head_commit.parents] == [p.hexsha for p in record.parents]
+    assert record.commit is record.commit
+
+
+def test_commit_record_with_message_keeps_message_when_rehydrated(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    record = CommitRecord.from_commit(repo.head.commit)
+
+    piece = record.with_message("fix: a piece of a squashed commit")
+
+    assert record.hexsha == piece.hexsha
+    assert record != piece
+    assert piece.commit.message == "fix: a piece of a squashed commit"
+    assert record.commit.tree.hexsha == piece.commit.tree.hexsha
+
+
+def test_parsed_commit_compact(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    commit = repo_w_no_tags_conventional_commits["repo"].head.commit
+    parsed_commit = ParsedCommit(
+        bump=LevelBump.MINOR,
+        type="feature",
+        scope="parser",
+        descriptions=["Add new parser pattern"],
+        breaking_descriptions=[],
+        commit=commit,
+    )
+
+    compact_commit = parsed_commit.compact()
+
+    assert isinstance(compact_commit.commit, CommitRecord)
+    assert parsed_commit.message == compact_commit.message
+    assert parsed_commit.hexsha == compact_commit.hexsha
+    assert parsed_commit.is_merge_commit() == compact_commit.is_merge_commit()
+    assert parsed_commit == compact_commit
@@ -1,6 +1,27 @@
+from __future__ import annotations
+
+from functools import reduce
+from re import DOTALL, MULTILINE, compile as regexp
+from typing import TYPE_CHECKING
+
 import pytest
 
-from semantic_release.commit_parser.util import parse_paragraphs
+from semantic_release.commit_parser import ConventionalCommitParser
+from semantic_release.commit_parser.util import (
+    CommitBodyTokenizer,
+    combine_text_filters,
+    commit_message_view,
+    limit_message_body,
+    literal_alternation,
+    match_commit_header,
+    parse_issue_references,
+    parse_paragraphs,
+    split_commit_message,
+)
+from semantic_release.helpers import text_reducer
+
+if TYPE_CHECKING:
+    from tests.conftest import MakeCommitObjFn
 
 
 @pytest.mark.parametrize(
@@ -24,3 +45,216 @@ from semantic_release.commit_parser.util import parse_paragraphs
 )
 def test_parse_paragraphs(text, expected):
     assert parse_paragraphs(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (
+            "Closes: #1\nSigned-off-by: someone",
+            ["Closes: #1", "Signed-off-by: someone"],
+        ),
+        (
+            # Double space indents are removed from the footers
+            "  Closes: #1\n  Refs: #2\n  Signed-off-by: someone",
+            ["Closes: #1", "Refs: #2", "Signed-off-by: someone"],
+        ),
+        (
+            # Deeper indented lines are not treated as footers (ie. yaml)
+            "updated-dependencies:\n- dependency-name: foo\n    dependency-type: direct:production\n",
+            [
+                "updated-dependencies:\n- dependency-name: foo\n    dependency-type: direct:production"
+            ],
+        ),
+        (
+            "Some description\nwrapped: over lines\n\nCloses: #1",
+            ["Some description wrapped: over lines", "Closes: #1"],
+        ),
+    ],
+)
+def test_parse_paragraphs_spreads_out_git_footers(text, expected):
+    assert parse_paragraphs(text) == expected
+
+
+@pytest.mark.parametrize(
+    "issue_predicate, expected",
+    [
+        ("#123", {"#123"}),
+        ("#1, #2 and #3", {"#1", "#2", "#3"}),
+        ("#1; #2 / #3 & #4", {"#1", "#2", "#3", "#4"}),
+        ("ABC-10 ABC-2", {"ABC-10", "ABC-2"}),
+        ("the issue tracker", set()),
+    ],
+)
+def test_parse_issue_references(issue_predicate, expected):
+    assert parse_issue_references(issue_predicate) == expected
+
+
+def test_commit_body_tokenizer_classifies_paragraphs():
+    tokenizer = CommitBodyTokenizer(
+        notice_selector=regexp(r"NOTICE: (?P<notice>.+)"),
+        issue_selector=regexp(r"^Closes: (?P<issue_predicate>.+)$"),
+    )
+    body = str.join(
+        "\n\n",
+        [
+            "A description\nwrapped over lines",
+            "BREAKING CHANGE: removed the option",
+            "NOTICE: the option is deprecated",
+            "Closes: #12, #3",
+        ],
+    )
+
+    assert tokenizer.tokenize("feat: subject", body) == {
+        "breaking_descriptions": ["removed the option"],
+        "descriptions": ["feat: subject", "A description wrapped over lines"],
+        "notices": ["the option is deprecated"],
+        "linked_issues": ["#3", "#12"],
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "commit 63ec09b9e844e616dcaa7bae35a0b66671b59fbb\nAuthor: someone <someone@example.com>\nDate:   Sun Oct 13 12:05:23 2024 -0600",
+        "Squashed commit of the following:\n\ncommit 63ec09b9e844e616dcaa7bae35a0b66671b59fbb",
+        "    feat(parser):  add  a feature\n    Author: not a header",
+        "* fix: a fix\n  Date: 2024\nsome text\n  commit abc123",
+    ],
+)
+def test_combine_text_filters_matches_filters_in_order(text: str):
+    filters = tuple(ConventionalCommitParser().filters.values())
+
+    combined_filters = combine_text_filters(filters)
+
+    # The 4 git header line filters are combined into one
+    assert len(filters) - 3 == len(combined_filters)
+    assert reduce(text_reducer, filters, text) == reduce(
+        text_reducer, combined_filters, text
+    )
+
+
+def test_combine_text_filters_keeps_order_of_other_filters():
+    filters = (
+        (regexp(r"^a$\n?", flags=MULTILINE), ""),
+        (regexp(r"b"), "a"),
+        (regexp(r"^a$\n?", flags=MULTILINE), ""),
+    )
+
+    assert filters == combine_text_filters(filters)
+
+
+@pytest.mark.parametrize(
+    "literals, text, expected",
+    [
+        ([":bug:", ":boom:", ":sparkles:"], ":boom: a change", ":boom:"),
+        ([":bug:", ":boom:", ":sparkles:"], ":memo: a change", None),
+        # The literal listed first takes precedence when both are a prefix of the text
+        (["⚡", "⚡️"], "⚡️ a change", "⚡"),
+        (["⚡️", "⚡"], "⚡️ a change", "⚡️"),
+        ([":b:", ":bug:", ":bu"], ":bug: a change", ":bug:"),
+        ([":bu", ":bug:", ":b:"], ":bug: a change", ":bu"),
+        # Literals with regular expression characters are joined as given
+        ([":+1:", ":bug:"], "::1: a change", "::1:"),
+    ],
+)
+def test_literal_alternation_matches_alternation_in_order(
+    literals: list[str], text: str, expected: str | None
+):
+    pattern = regexp(f"^(?:{literal_alternation(literals)})")
+    alternation_pattern = regexp(f"^(?:{str.join('|', literals)})")
+
+    match = pattern.match(text)
+    alternation_match = alternation_pattern.match(text)
+
+    assert expected == (match.group() if match else None)
+    assert expected == (alternation_match.group() if alternation_match else None)
+
+
+def test_literal_alternation_factors_common_prefixes():
+    alternation = literal_alternation([":boom:", ":sparkles:", ":bug:", ":bugs:"])
+
+    assert alternation == ":(?:b(?:oom:|ug(?::|s:))|sparkles:)"
+
+
+@pytest.mark.parametrize(
+    "message, max_body_size, expected",
+    [
+        ("feat: a feature\n\nbody", 0, "feat: a feature\n\nbody"),
+        ("feat: a feature\n\nbody", 6, "feat: a feature\n\nbody"),
+        # The subject line is never truncated
+        ("feat: a long feature subject", 4, "feat: a long feature subject"),
+        # Truncated at the last line break within the limit
+        ("feat: a feature\n\nline 1\nline 2", 10, "feat: a feature\n\nline 1"),
+        # or within a line without a line break
+        ("feat: a feature\nline 1 line 2", 9, "feat: a feature\nline 1 li"),
+    ],
+)
+def test_limit_message_body(message: str, max_body_size: int, expected: str):
+    assert expected == limit_message_body(message, max_body_size)
+
+
+@pytest.mark.parametrize(
+    "message, max_body_size, expected",
+    [
+        ("feat: a feature", 0, ("feat: a feature", "")),
+        ("feat: a feature\n\nbody", 0, ("feat: a feature", "\nbody")),
+        ("feat: a feature\nline 1\nline 2", 0, ("feat: a feature", "line 1\nline 2")),
+        ("feat: a feature\n\nline 1\nline 2", 10, ("feat: a feature", "\nline 1")),
+    ],
+)
+def test_split_commit_message(
+    message: str, max_body_size: int, expected: tuple[str, str]
+):
+    assert expected == split_commit_message(message, max_body_size)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "feat: a feature",
+        "feat(scope)!: a feature\n\nbody\n\nBREAKING CHANGE: a change",
+        "feat: a feature\nno blank line\n\nbody",
+        "feat: a feature\n\n",
+        # Headers which continue on the next line
+        "feat:\n\na feature\n\nbody",
+        "feat:  \n\na feature",
+        "feat:  ",
+        "not a conventional commit\n\nfeat: a feature",
+    ],
+)
+def test_match_commit_header_matches_whole_message(message: str):
+    pattern = regexp(
+        r"^(?P<type>feat|fix)(?:\((?P<scope>[^\n]+)\))?(?P<break>!)?:\s+"
+        r"(?P<subject>[^\n]+)(?:\n\n(?P<text>.+))?",
+        flags=DOTALL,
+    )
+    expected = pattern.match(message)
+
+    header = match_commit_header(pattern, *split_commit_message(message))
+
+    if expected is None:
+        assert header is None
+    else:
+        assert header is not None
+        match, text = header
+        assert expected.group("type", "scope", "break", "subject") == match.group(
+            "type", "scope", "break", "subject"
+        )
+        assert (expected.group("text") or "") == text
+
+
+def test_commit_message_view_shares_commit_attributes(
+    make_commit_obj: MakeCommitObjFn,
+):
+    commit = make_commit_obj("feat: first\n\nfix: second")
+
+    view = commit_message_view(commit, "fix: second")
+
+    assert view.message == "fix: second"
+    assert commit.message == "feat: first\n\nfix: second"
+    assert commit.hexsha == view.hexsha
+    assert commit.author is view.author
+    assert commit.committer is view.committer
+    assert commit.parents is view.parents
+    assert commit.authored_date == view.authored_date
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Commit, Git
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.commit_parser.conventional.options_monorepo import (
+    ConventionalCommitMonorepoParserOptions,
+)
+from semantic_release.commit_parser.conventional.parser_monorepo import (
+    ConventionalCommitMonorepoParser,
+)
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.history.changed_files import ChangedFilesIndex
+
+from tests.fixtures.repos import (
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits,
+    repo_w_no_tags_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from tests.conftest import MakeCommitObjFn
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_no_tags_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_changed_files_match_commit_stats(repo_result: BuiltRepoResult):
+    repo = repo_result["repo"]
+    changed_files_index = ChangedFilesIndex(repo)
+
+    for commit in repo.iter_commits("HEAD"):
+        assert commit.hexsha in changed_files_index
+        assert sorted(map(str, commit.stats.files)) == sorted(
+            changed_files_index.get_changed_files(commit)
+        )
+
+
+def test_changed_files_of_merge_without_changes(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    default_branch = repo.active_branch
+    feature_branch = repo.create_head("feature")
+    feature_branch.checkout()
+
+    feature_file = Path(str(repo.working_dir), "feature.txt")
+    feature_file.write_text("feature\n")
+    repo.index.add([str(feature_file)])
+    repo.index.commit("feat: add a feature file")
+
+    default_branch.checkout()
+    # Merge without taking any changes from the feature branch
+    repo.git.merge("-s", "ours", "--no-edit", feature_branch.name)
+    merge_commit = repo.head.commit
+
+    changed_files_index = ChangedFilesIndex(repo)
+
+    assert merge_commit.stats.files == {}
+    assert changed_files_index.get_changed_files(merge_commit) == ()
+
+
+def test_changed_files_are_read_in_a_single_pass(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    changed_files_index = ChangedFilesIndex(repo)
+    commits = list(repo.iter_commits("HEAD"))
+
+    with mock.patch.object(
+        Git, "_call_process", autospec=True, side_effect=Git._call_process
+    ) as mocked_git_call, mock.patch.object(
+        Commit, "stats", new_callable=mock.PropertyMock
+    ) as mocked_stats:
+        for commit in commits:
+            changed_files_index.get_changed_files(commit)
+
+    assert mocked_git_call.call_count == 1
+    assert mocked_git_call.call_args.args[1] == "log"
+    assert mocked_stats.call_count == 0
+    assert len(commits) == len(changed_files_index)
+
+
+def test_given_changed_files_are_not_read_from_git(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    head_commit = repo.head.commit
+    changed_files_index = ChangedFilesIndex(
+        repo, changed_files={head_commit.hexsha: ["given.txt"]}
+    )
+
+    with mock.patch.object(
+        Git, "_call_process", autospec=True, side_effect=Git._call_process
+    ) as mocked_git_call:
+        changed_files = changed_files_index.get_changed_files(head_commit)
+
+    assert mocked_git_call.call_count == 0
+    assert changed_files == ("given.txt",)
+    assert len(changed_files_index) == 1
+
+
+def test_monorepo_parser_uses_changed_files_provider(
+    make_commit_obj: MakeCommitObjFn,
+):
+    parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(path_filters=("pkg1",))
+    )
+    commit = make_commit_obj("feat: add a new feature")
+    changed_files_provider = mock.Mock(spec=ChangedFilesIndex)
+    parser.changed_files_provider = changed_files_provider
+
+    changed_files_provider.get_changed_files.return_value = ("pkg1/file.py",)
+    assert isinstance(parser.parse_commit(commit), ParsedCommit)
+
+    changed_files_provider.get_changed_files.return_value = ("pkg2/file.py",)
+    assert isinstance(parser.parse_commit(commit), ParseError)
+
+
+def test_changed_files_of_included_range(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    tag = min(repo.tags, key=lambda tag: tag.commit.committed_date)
+    commits = list(repo.iter_commits(f"{tag.name}..HEAD"))
+    assert commits
+
+    expected_files = {
+        commit.hexsha: sorted(map(str, commit.stats.files)) for commit in commits
+    }
+    changed_files_index = ChangedFilesIndex(repo)
+    changed_files_index.include(["HEAD", f"^{tag.name}"])
+
+    with mock.patch.object(
+        Git, "_call_process", autospec=True, side_effect=Git._call_process
+    ) as mocked_git_call:
+        for commit in commits:
+            assert expected_files[commit.hexsha] == sorted(
+                changed_files_index.get_changed_files(commit)
+            )
+
+    assert mocked_git_call.call_count == 1
+    assert f"^{tag.name}" in mocked_git_call.call_args.args
@@ -0,0 +1,410 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Git
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.commit_parser.record import CommitRecord
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.history import CommitHistory, loader
+
+from tests.fixtures.repos import (
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits,
+    repo_w_no_tags_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from git import Commit
+
+    from semantic_release.commit_parser.conventional import ConventionalCommitParser
+    from semantic_release.commit_parser.emoji import EmojiCommitParser
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_no_tags_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_topo_ordered_commits_match_git_log(
+    repo_result: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_result["repo"]
+    expected_shas = [
+        commit.hexsha for commit in repo.iter_commits("HEAD", topo_order=True)
+    ]
+
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    actual_commits = commit_history.topo_ordered_commits()
+
+    assert expected_shas == [commit.hexsha for commit in actual_commits]
+    assert set(expected_shas) == commit_history.reachable_shas()
+    assert commit_history.head_commit.hexsha == repo.head.commit.hexsha
+    for commit in actual_commits:
+        assert [p.hexsha for p in commit.parents] == [
+            p.hexsha for p in repo.commit(commit.hexsha).parents
+        ]
+
+
+def depth_first_shas(head_commit: Commit, rev: str) -> list[str]:
+    """The commits since rev, in depth-first order with the rightmost parents first."""
+    visited = (
+        {commit.hexsha for commit in head_commit.repo.iter_commits(rev)}
+        if rev
+        else set()
+    )
+    shas: list[str] = []
+    stack = [head_commit]
+    while stack:
+        if (commit := stack.pop()).hexsha in visited:
+            continue
+
+        visited.add(commit.hexsha)
+        shas.append(commit.hexsha)
+        stack.extend(commit.parents)
+
+    return shas
+
+
+@pytest.mark.parametrize("load_whole_history", [False, True])
+def test_commits_since_visits_the_rightmost_parent_first(
+    repo_w_initial_commit: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    load_whole_history: bool,
+):
+    r"""
+    * merge commit 6 (start)
+    |\
+    | * commit 5
+    | * commit 4
+    |/
+    * commit 3
+    * commit 2
+    * commit 1
+    * v1.0.0
+    """
+    repo = repo_w_initial_commit["repo"]
+    repo.git.tag("v1.0.0")
+    default_branch = repo.active_branch
+
+    def commit(message: str) -> str:
+        repo.git.commit("--allow-empty", "-m", message)
+        return repo.head.commit.hexsha
+
+    trunk_shas = [commit(f"fix: commit {number}") for number in (1, 2, 3)]
+    repo.git.checkout("-b", "feature")
+    branch_shas = [commit(f"fix: commit {number}") for number in (4, 5)]
+    default_branch.checkout()
+    repo.git.merge("--no-ff", "-m", "Merge branch 'feature'", "feature")
+
+    expected_shas = [
+        repo.head.commit.hexsha,
+        *reversed(branch_shas),
+        *reversed(trunk_shas),
+    ]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    if load_whole_history:
+        commit_history.topo_ordered_commits()
+
+    actual_shas = [commit.hexsha for commit in commit_history.commits_since("v1.0.0")]
+
+    assert actual_shas == expected_shas
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_commits_since_matches_graph_traversal(
+    repo_result: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_result["repo"]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    for rev in ["", *(tag.name for tag in repo.tags)]:
+        expected_shas = depth_first_shas(repo.head.commit, rev)
+
+        actual_shas = [commit.hexsha for commit in commit_history.commits_since(rev)]
+
+        assert expected_shas == actual_shas
+
+
+def test_commits_since_only_loads_the_range(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    tag = min(repo.tags, key=lambda tag: tag.commit.committed_date)
+    expected_shas = {commit.hexsha for commit in repo.iter_commits(f"{tag.name}..HEAD")}
+    assert expected_shas
+
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    with mock.patch.object(
+        CommitHistory, "_load_graph", side_effect=AssertionError
+    ) as mocked_load_graph:
+        actual_commits = commit_history.commits_since(tag.name)
+
+    assert mocked_load_graph.call_count == 0
+    assert expected_shas == {commit.hexsha for commit in actual_commits}
+
+
+def test_topo_ordered_commits_until_boundaries(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    boundaries = {
+        tag.commit.hexsha
+        for tag in sorted(repo.tags, key=lambda tag: tag.commit.committed_date)[:2]
+    }
+    excluded_shas = {
+        commit.hexsha
+        for sha in boundaries
+        for parent in repo.commit(sha).parents
+        for commit in repo.iter_commits(parent.hexsha)
+    }
+    expected_shas = [
+        commit.hexsha
+        for commit in repo.iter_commits("HEAD", topo_order=True)
+        if commit.hexsha not in excluded_shas
+    ]
+    assert boundaries.intersection(expected_shas)
+
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    with mock.patch.object(
+        CommitHistory, "_load_graph", side_effect=AssertionError
+    ) as mocked_load_graph:
+        bounded_commits = commit_history.topo_ordered_commits_until(boundaries)
+
+    assert mocked_load_graph.call_count == 0
+    assert expected_shas == [commit.hexsha for commit in bounded_commits]
+
+    # Same result when the whole history is already loaded
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    commit_history.topo_ordered_commits()
+
+    assert expected_shas == [
+        commit.hexsha
+        for commit in commit_history.topo_ordered_commits_until(boundaries)
+    ]
+
+
+def test_topo_ordered_commits_until_many_boundaries(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    boundaries = {tag.commit.hexsha for tag in repo.tags}
+    assert len(boundaries) > 1
+
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    commit_history.topo_ordered_commits()
+    expected_shas = [
+        commit.hexsha
+        for commit in commit_history.topo_ordered_commits_until(boundaries)
+    ]
+
+    # The boundaries are passed to git through stdin rather than as arguments
+    monkeypatch.setattr(loader, "_MAX_REVISION_ARGS", 1)
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    with mock.patch.object(
+        Git, "_call_process", autospec=True, side_effect=Git._call_process
+    ) as mocked_git_call:
+        bounded_commits = commit_history.topo_ordered_commits_until(boundaries)
+
+    assert mocked_git_call.call_count == 1
+    assert "--stdin" in mocked_git_call.call_args.args
+    assert not any(arg.startswith("^") for arg in mocked_git_call.call_args.args[2:])
+    assert [commit.hexsha for commit in bounded_commits] == expected_shas
+
+
+def test_merged_tag_names_match_history(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    reachable_shas = {commit.hexsha for commit in repo.iter_commits("HEAD")}
+    expected_names = {
+        tag.name for tag in repo.tags if tag.commit.hexsha in reachable_shas
+    }
+
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    assert expected_names == commit_history.merged_tag_names()
+
+
+def test_merged_tag_names_from_loaded_history(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    expected_names = CommitHistory(
+        repo,
+        default_conventional_parser,  # type: ignore[arg-type]
+    ).merged_tag_names()
+
+    # Load the whole history first, so the tags are looked up in the commit graph
+    commit_history.topo_ordered_commits()
+    with mock.patch.object(
+        Git, "_call_process", autospec=True, side_effect=Git._call_process
+    ) as mocked_git_call:
+        merged_tag_names = commit_history.merged_tag_names()
+
+    assert expected_names == merged_tag_names
+    assert not any(
+        str(arg).startswith("--merged")
+        for call in mocked_git_call.call_args_list
+        for arg in call.args
+    )
+
+
+def test_parse_results_are_memoized(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    head_commit = commit_history.head_commit
+
+    with mock.patch.object(
+        default_conventional_parser,
+        "parse",
+        wraps=default_conventional_parser.parse,
+    ) as mocked_parse:
+        first_results = commit_history.parse(head_commit)
+        second_results = commit_history.parse(head_commit)
+
+    assert mocked_parse.call_count == 1
+    assert first_results is second_results
+    assert isinstance(first_results, list)
+    assert isinstance(first_results[0], ParsedCommit)
+    # The memoized results do not reference the full commit objects
+    assert isinstance(first_results[0].commit, CommitRecord)
+    assert head_commit.hexsha == first_results[0].hexsha
+
+
+@pytest.mark.parametrize("bad_result", [None, "fix: not a parse result", [None]])
+def test_parse_raises_on_unexpected_parser_result(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    bad_result: object,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    with mock.patch.object(
+        default_conventional_parser, "parse", return_value=bad_result
+    ), pytest.raises(TypeError):
+        commit_history.parse(commit_history.head_commit)
+
+
+def test_parse_all_parses_commits_as_a_batch(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commits = CommitHistory(repo, default_conventional_parser).topo_ordered_commits()  # type: ignore[arg-type]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    with mock.patch.object(
+        default_conventional_parser,
+        "parse_many",
+        wraps=default_conventional_parser.parse_many,
+    ) as mocked_parse_many:
+        all_results = commit_history.parse_all(commits)
+
+    assert mocked_parse_many.call_count == 1
+    expected_results = [
+        CommitHistory(repo, default_conventional_parser).parse(commit)  # type: ignore[arg-type]
+        for commit in commits
+    ]
+    assert [
+        [(result.commit.hexsha, result.commit.message) for result in results]
+        for results in expected_results
+    ] == [
+        [(result.commit.hexsha, result.commit.message) for result in results]
+        for results in all_results
+    ]
+    # The batch results are memoized
+    assert all(
+        commit_history.parse(commit) is results
+        for commit, results in zip(commits, all_results)
+    )
+
+
+def test_parse_all_raises_on_unexpected_parser_result(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+
+    with mock.patch.object(
+        default_conventional_parser, "parse", return_value=None
+    ), pytest.raises(TypeError):
+        commit_history.parse_all(commit_history.topo_ordered_commits())
+
+
+def test_parse_all_raises_on_parser_result_of_another_commit(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    commits = commit_history.topo_ordered_commits()
+    other_commit = repo.commit(commits[-1].hexsha)
+
+    with mock.patch.object(
+        default_conventional_parser,
+        "parse",
+        return_value=ParseError(other_commit, error="another commit"),
+    ), pytest.raises(ValueError):
+        commit_history.parse_all(commits[:-1])
+
+
+def test_with_commit_parser_shares_history_but_not_parse_results(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+    default_emoji_parser: EmojiCommitParser,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    head_commit = commit_history.head_commit
+    conventional_results = commit_history.parse(head_commit)
+
+    # Action
+    emoji_history = commit_history.with_commit_parser(default_emoji_parser)  # type: ignore[arg-type]
+
+    assert default_emoji_parser is emoji_history.commit_parser
+    assert commit_history.tag_index is emoji_history.tag_index
+    assert commit_history.changed_files is emoji_history.changed_files
+    assert head_commit is emoji_history.head_commit
+    assert [commit.hexsha for commit in commit_history.topo_ordered_commits()] == [
+        commit.hexsha for commit in emoji_history.topo_ordered_commits()
+    ]
+    assert commit_history.merged_tag_names() == emoji_history.merged_tag_names()
+
+    emoji_results = emoji_history.parse(head_commit)
+    assert emoji_results is not conventional_results
+    assert conventional_results is commit_history.parse(head_commit)
+    assert head_commit.hexsha == emoji_results[0].commit.hexsha
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from semantic_release.history.graph import CommitGraph
+
+
+@pytest.fixture
+def commit_graph() -> CommitGraph:
+    """
+    * 6 (merge)
+    |\
+    | * 5
+    | * 4
+    |/
+    * 3
+    * 2
+    * 1 (boundary, not loaded)
+    """
+    graph = CommitGraph()
+    graph.add("6", ["3", "5"])
+    graph.add("5", ["4"])
+    graph.add("4", ["3"])
+    graph.add("3", ["2"])
+    graph.add("2", ["1"])
+    return graph
+
+
+def test_graph_interns_shas(commit_graph: CommitGraph):
+    assert len(commit_graph) == 5
+    assert "2" in commit_graph
+    assert "1" not in commit_graph
+    assert "unknown" not in commit_graph
+
+    node = commit_graph.id_of("3")
+    assert node is not None
+    assert commit_graph.sha_of(node) == "3"
+    assert node == commit_graph.intern("3")
+    assert node == commit_graph.add("3", ["something-else"])
+    assert [commit_graph.sha_of(p) for p in commit_graph.parents(node)] == ["2"]
+
+
+def test_graph_load_order(commit_graph: CommitGraph):
+    load_order = [commit_graph.sha_of(node) for node in commit_graph.load_order()]
+
+    assert load_order == ["6", "5", "4", "3", "2"]
+
+
+def test_graph_dfs_visits_rightmost_parent_first(commit_graph: CommitGraph):
+    start = commit_graph.intern("6")
+
+    dfs_order = [commit_graph.sha_of(node) for node in commit_graph.dfs(start)]
+
+    assert dfs_order == ["6", "5", "4", "3", "2"]
+
+
+def test_graph_dfs_with_stop_nodes(commit_graph: CommitGraph):
+    start = commit_graph.intern("6")
+    stop = commit_graph.reachable(commit_graph.intern("3"))
+
+    dfs_order = [commit_graph.sha_of(node) for node in commit_graph.dfs(start, stop)]
+
+    assert dfs_order == ["6", "5", "4"]
+
+
+def test_graph_is_loaded(commit_graph: CommitGraph):
+    assert commit_graph.is_loaded(commit_graph.intern("2"))
+    assert not commit_graph.is_loaded(commit_graph.intern("1"))
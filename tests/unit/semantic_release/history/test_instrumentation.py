@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.enums import LevelBump
+from semantic_release.history import CommitHistory, ParserInstrumentation, parallel
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def test_instrumentation_records_parsing_of_history(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    # The parser is instrumented in place, so it must not be shared between tests
+    commit_parser = ConventionalCommitParser()
+    expected_results = CommitHistory(repo, commit_parser).parse_all(  # type: ignore[arg-type]
+        CommitHistory(repo, commit_parser).topo_ordered_commits()  # type: ignore[arg-type]
+    )
+    instrumentation = ParserInstrumentation(slowest_commits=2)
+
+    # Action
+    commit_history = instrumentation.instrument(CommitHistory(repo, commit_parser))  # type: ignore[arg-type]
+    commits = commit_history.topo_ordered_commits()
+    actual_results = commit_history.parse_all(commits)
+
+    assert [
+        [(result.commit.hexsha, type(result)) for result in results]
+        for results in actual_results
+    ] == [
+        [(result.commit.hexsha, type(result)) for result in results]
+        for results in expected_results
+    ]
+
+    report = instrumentation.report()
+    all_results = [result for results in actual_results for result in results]
+    assert report["parsers"] == ["ConventionalCommitParser"]
+    assert report["commits"] == len(commits)
+    assert report["parsed_commits"] == sum(
+        isinstance(result, ParsedCommit) for result in all_results
+    )
+    assert report["parse_errors"] == sum(
+        isinstance(result, ParseError) for result in all_results
+    )
+    assert report["phases"]["unsquash_commit"]["calls"] == len(commits)
+    assert report["phases"]["git_log"]["calls"] == 1
+
+    slowest_commits = report["slowest_commits"]
+    assert len(slowest_commits) == 2
+    assert slowest_commits[0]["time"] >= slowest_commits[1]["time"]
+    assert {commit["sha"] for commit in slowest_commits} <= {
+        commit.hexsha for commit in commits
+    }
+
+
+def test_instrumentation_wraps_a_parser_once(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    # The parser is instrumented in place, so it must not be shared between tests
+    commit_parser = ConventionalCommitParser()
+    instrumentation = ParserInstrumentation()
+
+    # Action
+    for _ in range(2):
+        commit_history = instrumentation.instrument(CommitHistory(repo, commit_parser))  # type: ignore[arg-type]
+        commit_history.parse(commit_history.head_commit)
+
+    report = instrumentation.report()
+    assert report["commits"] == 2
+    assert report["phases"]["parse_message"]["calls"] == 2
+
+
+def test_instrumentation_records_parallel_parsing(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(parallel, "PARALLEL_PARSE_MIN_COMMITS", 1)
+    # Run (at least) 2 worker processes even on single CPU machines
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 2)
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    # The parser is instrumented in place, so it must not be shared between tests
+    commit_parser = ConventionalCommitParser()
+    instrumentation = ParserInstrumentation()
+    commit_history = instrumentation.instrument(
+        CommitHistory(repo, commit_parser, parse_jobs=2)  # type: ignore[arg-type]
+    )
+    commits = commit_history.topo_ordered_commits()
+
+    with mock.patch.object(CommitHistory, "_parse_batch") as mocked_parse_batch:
+        # Action
+        commit_history.parse_all(commits)
+
+    # The instrumented parser is still sent to the worker processes
+    assert mocked_parse_batch.call_count == 0
+    report = instrumentation.report()
+    assert report["commits"] == len(commits)
+    assert len(report["slowest_commits"]) == min(len(commits), 10)
+
+
+def test_instrumentation_counts_squashed_commits():
+    instrumentation = ParserInstrumentation(slowest_commits=1)
+    commit = mock.Mock(hexsha="a" * 40)
+    parsed_commit = ParsedCommit(
+        bump=LevelBump.PATCH,
+        type="fix",
+        scope="",
+        descriptions=["a fix"],
+        breaking_descriptions=[],
+        commit=commit,
+    )
+
+    # Action
+    instrumentation.record_parse(
+        "a" * 40, 0.2, [parsed_commit, ParseError(commit, "error")]
+    )
+    instrumentation.record_parse("b" * 40, 0.1, ParseError(commit, "error"))
+
+    report = instrumentation.report()
+    assert report["commits"] == 2
+    assert report["parsed_commits"] == 1
+    assert report["parse_errors"] == 2
+    assert report["squashed_commits"] == 1
+    assert report["unsquashed_commits"] == 2
+    assert report["slowest_commits"] == [{"sha": "a" * 40, "time": 0.2, "results": 2}]
+
+
+def test_instrumentation_writes_report_on_exit(tmp_path: Path):
+    output = tmp_path.joinpath("stats", "parser_stats.json")
+
+    with ParserInstrumentation(output=output) as instrumentation:
+        instrumentation.record_parse("a" * 40, 0.5, [])
+
+    assert json.loads(output.read_text(encoding="utf-8")) == instrumentation.report()
+
+
+def test_instrumentation_writes_report_to_stderr(capsys: pytest.CaptureFixture[str]):
+    with ParserInstrumentation() as instrumentation:
+        instrumentation.record_parse("a" * 40, 0.5, [])
+
+    assert json.loads(capsys.readouterr().err) == instrumentation.report()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from git import GitCommandError
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.history.loader import iter_commit_records
+
+from tests.fixtures.repos import (
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits,
+    repo_w_no_tags_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_no_tags_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_iter_commit_records_match_gitpython_commits(repo_result: BuiltRepoResult):
+    repo = repo_result["repo"]
+    expected_commits = list(repo.iter_commits("HEAD", topo_order=True))
+
+    actual_commits = [record.to_commit() for record in iter_commit_records(repo)]
+
+    assert [c.hexsha for c in expected_commits] == [c.hexsha for c in actual_commits]
+    for expected, actual in zip(expected_commits, actual_commits):
+        assert expected.message == actual.message
+        assert expected.author == actual.author
+        assert expected.author.email == actual.author.email
+        assert expected.authored_date == actual.authored_date
+        assert expected.author_tz_offset == actual.author_tz_offset
+        assert expected.committer == actual.committer
+        assert expected.committer.email == actual.committer.email
+        assert expected.committed_date == actual.committed_date
+        assert expected.committer_tz_offset == actual.committer_tz_offset
+        assert expected.tree.hexsha == actual.tree.hexsha
+        assert [p.hexsha for p in expected.parents] == [
+            p.hexsha for p in actual.parents
+        ]
+
+
+def test_iter_commit_records_matches_gitpython(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    expected_commits = list(repo.iter_commits("HEAD", topo_order=True))
+
+    actual_records = list(iter_commit_records(repo))
+
+    assert [c.hexsha for c in expected_commits] == [r.hexsha for r in actual_records]
+    for expected, actual in zip(expected_commits, actual_records):
+        assert expected.message == actual.message
+        assert expected.author.email == actual.author_email
+        assert expected.committed_date == actual.committed_date
+        assert expected.tree.hexsha == actual.tree_sha
+        assert tuple(p.hexsha for p in expected.parents) == actual.parent_shas
+
+
+def test_iter_commit_records_of_revision_range(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    tag = sorted(repo.tags, key=lambda t: t.commit.committed_date)[0]
+
+    expected_shas = [
+        commit.hexsha
+        for commit in repo.iter_commits(f"{tag.name}..HEAD", topo_order=True)
+    ]
+
+    actual_shas = [
+        record.hexsha for record in iter_commit_records(repo, [f"{tag.name}..HEAD"])
+    ]
+
+    assert expected_shas == actual_shas
+
+
+def test_iter_commit_records_stops_early(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+
+    records = iter_commit_records(repo)
+    first_record = next(records)
+    records.close()
+
+    assert repo.head.commit.hexsha == first_record.hexsha
+
+
+def test_iter_commit_records_raises_on_invalid_revision(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+
+    with pytest.raises(GitCommandError):
+        list(iter_commit_records(repo, ["does-not-exist"]))
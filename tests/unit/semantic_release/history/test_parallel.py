@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+from unittest import mock
+
+import pytest
+from git import Commit
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.commit_parser.conventional import ConventionalCommitParser
+from semantic_release.commit_parser.conventional.options_monorepo import (
+    ConventionalCommitMonorepoParserOptions,
+)
+from semantic_release.commit_parser.conventional.parser_monorepo import (
+    ConventionalCommitMonorepoParser,
+)
+from semantic_release.history import CommitHistory, parallel
+from semantic_release.history.changed_files import ChangedFilesIndex
+from semantic_release.history.parallel import parse_in_parallel
+
+from tests.fixtures.repos import (
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits,
+    repo_w_no_tags_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from semantic_release.commit_parser.token import ParseResult
+
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+@pytest.fixture
+def parallel_for_any_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallel, "PARALLEL_PARSE_MIN_COMMITS", 1)
+    # Run (at least) 2 worker processes even on single CPU machines
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 2)
+
+
+def result_fields(results: list[ParseResult]) -> list[list[object]]:
+    return [
+        [
+            type(result).__name__,
+            result.commit.hexsha,
+            result.commit.message,
+            *(field for field in result if not isinstance(field, Commit)),
+        ]
+        for result in results
+    ]
+
+
+@pytest.mark.usefixtures(parallel_for_any_size.__name__)
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_no_tags_conventional_commits.__name__),
+        lazy_fixture(
+            repo_w_git_flow_w_alpha_prereleases_n_conventional_commits.__name__
+        ),
+    ],
+)
+def test_parallel_results_match_serial_results(
+    repo_result: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_result["repo"]
+    serial_history = CommitHistory(repo, default_conventional_parser)  # type: ignore[arg-type]
+    parallel_history = CommitHistory(repo, default_conventional_parser, parse_jobs=2)  # type: ignore[arg-type]
+
+    expected = [
+        result_fields(serial_history.parse(commit))
+        for commit in serial_history.topo_ordered_commits()
+    ]
+    commits = parallel_history.topo_ordered_commits()
+
+    parallel_results = parse_in_parallel(
+        repo=repo,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        commits=commits,
+        jobs=2,
+    )
+
+    assert len(commits) == len(parallel_results)
+    assert expected == [
+        result_fields(parallel_results[commit.hexsha]) for commit in commits
+    ]
+    assert expected == [
+        result_fields(results) for results in parallel_history.parse_all(commits)
+    ]
+
+
+@pytest.mark.usefixtures(parallel_for_any_size.__name__)
+def test_parallel_results_of_monorepo_parser_match_serial_results(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit_parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(path_filters=("*.md",))
+    )
+    serial_history = CommitHistory(repo, commit_parser)  # type: ignore[arg-type]
+    parallel_history = CommitHistory(repo, commit_parser, parse_jobs=2)  # type: ignore[arg-type]
+
+    expected = [
+        result_fields(results)
+        for results in serial_history.parse_all(serial_history.commits_since())
+    ]
+
+    assert expected == [
+        result_fields(results)
+        for results in parallel_history.parse_all(parallel_history.commits_since())
+    ]
+
+
+@pytest.mark.usefixtures(parallel_for_any_size.__name__)
+def test_parallel_parsing_sends_the_changed_files_of_the_parent_index(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commit_parser = ConventionalCommitMonorepoParser(
+        ConventionalCommitMonorepoParserOptions(path_filters=("*.md",))
+    )
+    commits = list(repo.iter_commits("HEAD"))
+    changed_files = ChangedFilesIndex(repo)
+    chunks: list[list[parallel.CommitPayload]] = []
+
+    class RecordingExecutor(ProcessPoolExecutor):
+        def map(self, fn, *iterables, **kwargs):  # type: ignore[no-untyped-def]
+            chunks.extend(iterables[0])
+            return super().map(fn, *iterables, **kwargs)
+
+    with mock.patch.object(parallel, "ProcessPoolExecutor", RecordingExecutor):
+        parallel_results = parse_in_parallel(
+            repo=repo,
+            commit_parser=commit_parser,  # type: ignore[arg-type]
+            commits=commits,
+            jobs=2,
+            changed_files=changed_files,
+        )
+
+    assert len(commits) == len(parallel_results)
+    # The changed files were indexed once, by the parent process
+    assert len(commits) == len(changed_files)
+    assert [(fields[0], files) for chunk in chunks for fields, files in chunk] == [
+        (commit.hexsha, changed_files.get_changed_files(commit)) for commit in commits
+    ]
+
+
+@pytest.mark.usefixtures(parallel_for_any_size.__name__)
+def test_parallel_parsing_is_skipped_for_unsupported_parsers(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    class NotCacheableParser(ConventionalCommitParser):
+        supports_result_cache = False
+
+    class UnpicklableParser(ConventionalCommitParser):
+        def __init__(self) -> None:
+            super().__init__()
+            self.callback = lambda: None
+
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commits = list(repo.iter_commits("HEAD"))
+
+    for commit_parser in (NotCacheableParser(), UnpicklableParser()):
+        parallel_results = parse_in_parallel(
+            repo=repo,
+            commit_parser=commit_parser,  # type: ignore[arg-type]
+            commits=commits,
+            jobs=2,
+        )
+        assert parallel_results == {}
+
+        # The commit history falls back to serial parsing
+        commit_history = CommitHistory(repo, commit_parser, parse_jobs=2)  # type: ignore[arg-type]
+        assert len(commits) == len(commit_history.parse_all(commits))
+
+
+def test_parallel_parsing_requires_enough_commits(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    commits = list(repo.iter_commits("HEAD"))
+    assert len(commits) < parallel.PARALLEL_PARSE_MIN_COMMITS
+
+    parallel_results = parse_in_parallel(
+        repo=repo,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        commits=commits,
+        jobs=2,
+    )
+    assert parallel_results == {}
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+import pytest
+from git import Commit, Repo
+
+from semantic_release.commit_parser.conventional import (
+    ConventionalCommitParser,
+    ConventionalCommitParserOptions,
+)
+from semantic_release.commit_parser.token import ParsedCommit, ParseError
+from semantic_release.history.parse_cache import ParseResultCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Protocol
+
+    from git import Actor
+
+    class MakeShaCommitFn(Protocol):
+        def __call__(self, message: str) -> Commit: ...
+
+
+@pytest.fixture
+def make_sha_commit(commit_author: Actor) -> MakeShaCommitFn:
+    def _make_sha_commit(message: str) -> Commit:
+        return Commit(
+            repo=Repo(),
+            binsha=hashlib.sha1(message.encode("utf-8")).digest(),  # noqa: S324
+            message=message,
+            author=commit_author,
+            authored_date=0,
+            committer=commit_author,
+            committed_date=0,
+            parents=[],
+        )
+
+    return _make_sha_commit
+
+
+def test_cache_round_trips_parse_results(
+    tmp_path: Path,
+    make_sha_commit: MakeShaCommitFn,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    commits = [
+        make_sha_commit("feat(parser): add a feature (#12)\n\nCloses: #10\n"),
+        make_sha_commit("fix!: a breaking fix\n\nBREAKING CHANGE: removed api\n"),
+        make_sha_commit("not a conventional commit message\n"),
+        make_sha_commit(
+            str.join(
+                "\n\n",
+                [
+                    "feat: squashed feature (#20)",
+                    "* fix: squashed fix",
+                    "* docs: squashed docs",
+                ],
+            )
+        ),
+    ]
+    expected_results = {
+        commit.hexsha: default_conventional_parser.parse(commit) for commit in commits
+    }
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        for commit in commits:
+            assert parse_cache.get(commit) is None
+            parse_cache.put(commit, expected_results[commit.hexsha])  # type: ignore[arg-type]
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        for commit in commits:
+            actual_results = parse_cache.get(commit)
+            expected = expected_results[commit.hexsha]
+            expected = expected if isinstance(expected, list) else [expected]
+
+            assert actual_results is not None
+            assert len(expected) == len(actual_results)
+            for expected_result, actual_result in zip(expected, actual_results):
+                assert type(expected_result) is type(actual_result)
+                assert expected_result.hexsha == actual_result.hexsha
+                assert expected_result.message == actual_result.message
+                # Compare all fields other than the commit object itself
+                assert [
+                    field for field in expected_result if not isinstance(field, Commit)
+                ] == [field for field in actual_result if not isinstance(field, Commit)]
+
+        assert len(commits) == parse_cache.hits
+
+    assert (tmp_path / ".gitignore").exists()
+
+
+def test_cache_is_invalidated_by_parser_options(
+    tmp_path: Path,
+    make_sha_commit: MakeShaCommitFn,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    commit = make_sha_commit("feat: add a feature\n")
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        parse_cache.put(commit, default_conventional_parser.parse(commit))  # type: ignore[arg-type]
+
+    other_parser = ConventionalCommitParser(
+        ConventionalCommitParserOptions(minor_tags=("feat", "perf"))
+    )
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=other_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        assert parse_cache.get(commit) is None
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        assert parse_cache.get(commit) is not None
+
+
+def test_cache_evicts_least_recently_used_entries(
+    tmp_path: Path,
+    make_sha_commit: MakeShaCommitFn,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    commits = [make_sha_commit(f"fix: bug fix number {i}\n") for i in range(5)]
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+        max_entries=3,
+    ) as parse_cache:
+        for commit in commits:
+            parse_cache.put(commit, default_conventional_parser.parse(commit))  # type: ignore[arg-type]
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        cached = [parse_cache.get(commit) is not None for commit in commits]
+
+    assert sum(cached) == 3
+
+
+def test_cache_ignores_custom_result_types(
+    tmp_path: Path,
+    make_sha_commit: MakeShaCommitFn,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    class CustomParseError(ParseError):
+        pass
+
+    commit = make_sha_commit("feat: add a feature\n")
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        parse_cache.put(commit, [CustomParseError(commit, "custom")])
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        assert parse_cache.get(commit) is None
+
+
+def test_cache_is_disabled_for_parsers_without_opt_in(
+    tmp_path: Path,
+    make_sha_commit: MakeShaCommitFn,
+):
+    class CustomParser(ConventionalCommitParser):
+        supports_result_cache = False
+
+    parser = CustomParser()
+    commit = make_sha_commit("feat: add a feature\n")
+
+    with ParseResultCache(
+        directory=tmp_path / "cache",
+        commit_parser=parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        parse_cache.put(commit, [parser.parse_commit(commit)])  # type: ignore[list-item]
+        assert parse_cache.get(commit) is None
+
+    assert not (tmp_path / "cache").exists()
+
+
+def test_cached_results_are_parsed_commits(
+    tmp_path: Path,
+    make_sha_commit: MakeShaCommitFn,
+    default_conventional_parser: ConventionalCommitParser,
+):
+    commit = make_sha_commit("feat: add a feature")
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        parse_cache.put(commit, default_conventional_parser.parse(commit))  # type: ignore[arg-type]
+
+    with ParseResultCache(
+        directory=tmp_path,
+        commit_parser=default_conventional_parser,  # type: ignore[arg-type]
+        repo_dir=tmp_path,
+    ) as parse_cache:
+        results = parse_cache.get(commit)
+
+    assert results is not None
+    assert isinstance(results[0], ParsedCommit)
+    # Results of the commit itself keep referencing the original commit object
+    assert results[0].commit is commit
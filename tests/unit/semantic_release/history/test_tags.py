@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+from unittest import mock
+
+from git import Git, TagObject
+
+from semantic_release.history.tags import TagIndex, tags_and_versions
+from semantic_release.version.translator import VersionTranslator
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+def test_tag_index_matches_gitpython(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    tag_index = TagIndex(repo)
+
+    assert [tag.name for tag in repo.tags] == [tag.name for tag in tag_index.tags]
+    assert len(repo.tags) == len(tag_index)
+
+    for tag in repo.tags:
+        tag_info = tag_index.get(tag.name)
+
+        assert tag_info is not None
+        assert tag.name in tag_index
+        assert tag.object.hexsha == tag_info.object_sha
+        assert tag.commit.hexsha == tag_info.commit_sha
+
+        if isinstance(tag.object, TagObject):
+            expected_tagger = tag.object.tagger
+            expected_tz = timezone(timedelta(seconds=-1 * tag.object.tagger_tz_offset))
+            expected_date = datetime.fromtimestamp(
+                tag.object.tagged_date, tz=expected_tz
+            )
+        else:
+            expected_tagger = tag.object.author
+            expected_tz = timezone(timedelta(seconds=-1 * tag.object.author_tz_offset))
+            expected_date = datetime.fromtimestamp(
+                tag.object.committed_date, tz=expected_tz
+            )
+
+        assert isinstance(tag.object, TagObject) == tag_info.annotated
+        assert tag_info.tagger is not None
+        assert expected_tagger == tag_info.tagger
+        assert expected_tagger.email == tag_info.tagger.email
+        assert expected_date == tag_info.tagged_date
+        assert expected_date.utcoffset() == tag_info.tagged_date.utcoffset()  # type: ignore[union-attr]
+
+
+def test_tag_index_versions_are_read_once(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    translator = VersionTranslator()
+    expected = [
+        (tag.name, version) for tag, version in tags_and_versions(repo.tags, translator)
+    ]
+    tag_index = TagIndex(repo)
+
+    with mock.patch.object(
+        Git, "_call_process", autospec=True, side_effect=Git._call_process
+    ) as mocked_git_call:
+        first_result = tag_index.versions(translator)
+        second_result = tag_index.versions(translator)
+
+    assert mocked_git_call.call_count == 1
+    assert expected == [(tag.name, version) for tag, version in first_result]
+    assert expected == [(tag.name, version) for tag, version in second_result]
+
+
+def test_tag_index_versions_are_not_shared_between_callers(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    translator = VersionTranslator()
+    tag_index = TagIndex(repo)
+
+    _, first_version = tag_index.versions(translator)[0]
+    first_version.build_metadata = "build.12345"
+
+    _, version = tag_index.versions(translator)[0]
+
+    assert version is not first_version
+    assert version.build_metadata == ""
+
+
+def test_tag_index_of_tags_without_commits(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    repo.git.tag("v9.0.0", repo.head.commit.tree.hexsha)
+    repo.git.tag("-a", "-m", "annotated", "v1.0.0", "HEAD")
+    repo.git.tag("-a", "-m", "nested", "v1.0.1", "v1.0.0")
+
+    tag_index = TagIndex(repo)
+
+    tree_tag = tag_index.get("v9.0.0")
+    assert tree_tag is not None
+    assert tree_tag.commit_sha is None
+    assert tree_tag.tagger is None
+
+    nested_tag = tag_index.get("v1.0.1")
+    assert nested_tag is not None
+    assert nested_tag.annotated
+    assert repo.head.commit.hexsha == nested_tag.commit_sha
+
+    assert tag_index.get("does-not-exist") is None
+
+
+def test_tag_index_versions_read_only_matching_tags(
+    repo_w_git_flow_w_alpha_prereleases_n_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_git_flow_w_alpha_prereleases_n_conventional_commits["repo"]
+    translator = VersionTranslator()
+    expected = [
+        (tag.name, version) for tag, version in tags_and_versions(repo.tags, translator)
+    ]
+    for other_tag in ("pkg-b-v1.0.0", "pkg-b-v2.0.0", "latest"):
+        repo.git.tag(other_tag)
+
+    tag_index = TagIndex(repo)
+
+    with mock.patch.object(
+        Git, "_call_process", autospec=True, side_effect=Git._call_process
+    ) as mocked_git_call:
+        result = tag_index.versions(translator)
+        for tag, _ in result:
+            assert tag_index.get(tag.name) is not None
+
+    assert mocked_git_call.call_count == 1
+    assert "refs/tags/v*" in mocked_git_call.call_args.args
+    assert expected == [(tag.name, version) for tag, version in result]
+
+    # Other tags are still found, by reading all the tags
+    assert "latest" in tag_index
+    assert tag_index.get("pkg-b-v1.0.0") is not None
+    assert len(repo.tags) == len(tag_index)
+    assert expected == [
+        (tag.name, version) for tag, version in tag_index.versions(translator)
+    ]
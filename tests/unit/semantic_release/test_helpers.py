@@ -1,8 +1,16 @@
+import os
+import stat
+from pathlib import Path
 from typing import Iterable
 
 import pytest
 
-from semantic_release.helpers import ParsedGitUrl, parse_git_url, sort_numerically
+from semantic_release.helpers import (
+    ParsedGitUrl,
+    parse_git_url,
+    sort_numerically,
+    write_text_atomically,
+)
 
 
 @pytest.mark.parametrize(
@@ -295,3 +303,16 @@ def test_sort_numerically(
         allow_hex=allow_hex,
     )
     assert sorted_list == actual_list
+
+
+@pytest.mark.skipif(os.name == "nt", reason="File modes are not supported on Windows")
+def test_write_text_atomically(tmp_path: Path):
+    file = tmp_path / "script.sh"
+    file.write_text("echo 1.0.0\n")
+    file.chmod(0o755)
+
+    write_text_atomically(file, "echo 1.2.3\n")
+
+    assert file.read_text() == "echo 1.2.3\n"
+    assert stat.S_IMODE(file.stat().st_mode) == 0o755
+    assert list(tmp_path.iterdir()) == [file]
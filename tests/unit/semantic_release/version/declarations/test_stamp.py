@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from pathlib import Path
+from textwrap import dedent
+from unittest import mock
+
+import pytest
+
+from semantic_release.errors import VersionStampError
+from semantic_release.version.declarations import stamp
+from semantic_release.version.declarations.pattern import PatternVersionDeclaration
+from semantic_release.version.declarations.stamp import stamp_version_in_files
+from semantic_release.version.declarations.toml import TomlVersionDeclaration
+from semantic_release.version.version import Version
+
+
+def test_stamp_version_in_files_writes_each_file_once(
+    default_tag_format_str: str,
+    change_to_ex_proj_dir: None,
+):
+    """
+    Given several version declarations of the same files,
+    When stamp_version_in_files() is called with a new version,
+    Then each file is read & written once, with all of its declarations applied
+    """
+    toml_file = Path("stamp_file.toml").resolve()
+    toml_file.write_text(
+        dedent(
+            """\
+            [project]
+            version = "0.1.0"
+
+            [tool.example]
+            version = "0.1.0"
+            release = "v0.1.0"
+            """
+        )
+    )
+    py_file = Path("stamp_file.py").resolve()
+    py_file.write_text('__version__ = "0.1.0"\n')
+    unchanged_file = Path("unchanged_file.py").resolve()
+    unchanged_file.write_text("no_version_here = True\n")
+
+    declarations = [
+        TomlVersionDeclaration.from_string_definition(f"{toml_file}:project.version"),
+        PatternVersionDeclaration.from_string_definition(
+            f"{py_file}:__version__", tag_format=default_tag_format_str
+        ),
+        TomlVersionDeclaration.from_string_definition(
+            f"{toml_file}:tool.example.version"
+        ),
+        PatternVersionDeclaration.from_string_definition(
+            f"{toml_file}:release:tf", tag_format=default_tag_format_str
+        ),
+        PatternVersionDeclaration.from_string_definition(
+            f"{unchanged_file}:__version__", tag_format=default_tag_format_str
+        ),
+    ]
+
+    with mock.patch.object(
+        stamp, "write_text_atomically", wraps=stamp.write_text_atomically
+    ) as mocked_write:
+        changed_paths = stamp_version_in_files(
+            declarations,
+            Version.parse("1.2.3", tag_format=default_tag_format_str),
+        )
+
+    written_paths = [call.args[0] for call in mocked_write.call_args_list]
+    assert changed_paths == [toml_file, py_file]
+    assert written_paths == [toml_file, py_file]
+    assert py_file.read_text() == '__version__ = "1.2.3"\n'
+    assert unchanged_file.read_text() == "no_version_here = True\n"
+    assert toml_file.read_text() == dedent(
+        """\
+        [project]
+        version = "1.2.3"
+
+        [tool.example]
+        version = "1.2.3"
+        release = "v1.2.3"
+        """
+    )
+
+
+def test_stamp_version_in_files_error_on_missing_file(default_tag_format_str: str):
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            "nonexistent_file:__version__", tag_format=default_tag_format_str
+        )
+    ]
+
+    with pytest.raises(FileNotFoundError):
+        stamp_version_in_files(declarations, Version.parse("1.2.3"))
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_stamp_version_in_files_in_parallel(
+    jobs: int,
+    default_tag_format_str: str,
+    change_to_ex_proj_dir: None,
+):
+    files = [Path(f"stamp_file_{index}.py").resolve() for index in range(20)]
+    for index, file in enumerate(files):
+        # Every third file is already up to date
+        file.write_text(f'__version__ = "{"1.2.3" if index % 3 == 0 else "0.1.0"}"\n')
+
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{file}:__version__", tag_format=default_tag_format_str
+        )
+        for file in files
+    ]
+
+    changed_paths = stamp_version_in_files(
+        declarations,
+        Version.parse("1.2.3", tag_format=default_tag_format_str),
+        jobs=jobs,
+    )
+
+    assert changed_paths == [file for index, file in enumerate(files) if index % 3 != 0]
+    assert all(file.read_text() == '__version__ = "1.2.3"\n' for file in files)
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_stamp_version_in_files_aggregates_errors(
+    jobs: int,
+    default_tag_format_str: str,
+    change_to_ex_proj_dir: None,
+):
+    stamp_file = Path("stamp_file.py").resolve()
+    stamp_file.write_text('__version__ = "0.1.0"\n')
+
+    declarations = [
+        PatternVersionDeclaration.from_string_definition(
+            f"{file}:__version__", tag_format=default_tag_format_str
+        )
+        for file in ["nonexistent_file_1", stamp_file, "nonexistent_file_2"]
+    ]
+
+    with pytest.raises(VersionStampError) as excinfo:
+        stamp_version_in_files(
+            declarations,
+            Version.parse("1.2.3", tag_format=default_tag_format_str),
+            jobs=jobs,
+        )
+
+    assert "nonexistent_file_1" in str(excinfo.value)
+    assert "nonexistent_file_2" in str(excinfo.value)
+    assert isinstance(excinfo.value.__cause__, FileNotFoundError)
+    assert stamp_file.read_text() == '__version__ = "1.2.3"\n'
@@ -4,8 +4,10 @@ from pathlib import Path
 from re import compile as regexp
 from textwrap import dedent
 from typing import TYPE_CHECKING
+from unittest import mock
 
 import pytest
+import tomlkit
 from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
 
 from semantic_release.version.declarations.enum import VersionStampType
@@ -189,6 +191,43 @@ def test_toml_declaration_no_file_change(
     assert file_modified is None
 
 
+@pytest.mark.parametrize("noop", [True, False])
+def test_toml_declaration_replaces_value_without_full_parse(
+    noop: bool,
+    change_to_ex_proj_dir: None,
+):
+    """
+    Given a file with the version as a string value,
+    When update_file_w_version() is called with a new version,
+    Then the value is replaced in place without parsing the whole file
+    """
+    test_file = Path("test_file.toml").resolve()
+    starting_contents = dedent(
+        """\
+        [project]
+        name = 'example'   # comments & spacing are kept
+        version = '0.1.0'  # the version
+        """
+    )
+    test_file.write_text(starting_contents)
+
+    version_replacer = TomlVersionDeclaration.from_string_definition(
+        f"{test_file}:project.version"
+    )
+
+    with mock.patch.object(tomlkit, "loads") as mocked_loads:
+        file_modified = version_replacer.update_file_w_version(
+            new_version=Version.parse("1.2.3"),
+            noop=noop,
+        )
+
+    assert test_file == file_modified
+    assert not mocked_loads.called
+    assert (
+        starting_contents if noop else starting_contents.replace("'0.1.0'", '"1.2.3"')
+    ) == test_file.read_text()
+
+
 def test_toml_declaration_error_on_missing_file():
     # Initialization should not fail or do anything intensive
     version_replacer = TomlVersionDeclaration.from_string_definition(
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from textwrap import dedent
+from typing import Any, Dict, cast
+
+import pytest
+import tomlkit
+from dotty_dict import Dotty
+
+from semantic_release.version.declarations.toml_scanner import find_toml_value_span
+
+PYPROJECT_TOML = dedent(
+    """\
+    # The project
+    [build-system]
+    requires = ["setuptools ~= 75.3.0", "wheel ~= 0.42"]
+
+    [project]
+    name = "example"
+    version = "0.1.0"  # the version
+    description = '''
+    [tool.example]
+    version = "0.0.0"
+    '''
+    authors = [
+      { name = "someone", email = "someone@example.com" },  # ] "
+    ]
+    optional-dependencies.test = ["pytest"]
+
+    [tool.example]
+    version = 'v0.1.0'
+    released = 1979-05-27T07:32:00Z
+    'quoted.key' = 1
+
+    [[tool.example.packages]]
+    version = "0.1.0"
+    """
+)
+
+
+@pytest.mark.parametrize(
+    "content, key",
+    [
+        (PYPROJECT_TOML, "project.version"),
+        (PYPROJECT_TOML, "project.name"),
+        (PYPROJECT_TOML, "tool.example.version"),
+        (PYPROJECT_TOML, "tool.example.released"),
+        (PYPROJECT_TOML.replace("\n", "\r\n"), "project.version"),
+        ('project.version = "0.1.0"\n', "project.version"),
+        ('version = """0.1.0"""\n', "version"),
+        ('version = 1\n[project]\nversion = "0.1.0"', "project.version"),
+        ('"version" = "0.1.0"\n', "version"),
+        ("[ project . 'x' ]  # table\n  version\t=\t'0.1.0'\n", "project.x.version"),
+    ],
+)
+def test_scanned_replacement_matches_tomlkit(content: str, key: str):
+    span = find_toml_value_span(content, key.split("."))
+
+    assert span is not None
+
+    start, end = span
+    toml_content = Dotty(tomlkit.loads(content))
+    toml_content[key] = "1.2.3"
+
+    assert tomlkit.dumps(cast(Dict[str, Any], toml_content)) == str.join(
+        "", [content[:start], tomlkit.item("1.2.3").as_string(), content[end:]]
+    )
+
+
+@pytest.mark.parametrize(
+    "content, key",
+    [
+        # Not found
+        (PYPROJECT_TOML, "project.missing"),
+        (PYPROJECT_TOML, "tool.example.packages.version"),
+        ("", "project.version"),
+        # Not a scalar value
+        (PYPROJECT_TOML, "project.authors"),
+        (PYPROJECT_TOML, "project.optional-dependencies.test"),
+        (PYPROJECT_TOML, "project"),
+        ('[tool]\npoetry = { version = "0.1.0" }\n', "tool.poetry.version"),
+        # Not followed by the scanner
+        ('"ver\\u0073ion" = "0.1.0"\n', "version"),
+        ("released = 1979-05-27 07:32:00Z\nversion = '0.1.0'\n", "version"),
+        # Invalid documents
+        ('version = "0.1.0"\nversion = "0.2.0"\n', "version"),
+        ('version = "0.1.0\n', "version"),
+        ('[project\nversion = "0.1.0"\n', "project.version"),
+    ],
+)
+def test_scan_without_value_span(content: str, key: str):
+    assert find_toml_value_span(content, key.split(".")) is None
@@ -1,108 +1,22 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
-from unittest import mock
 
 import pytest
-from git import Commit, Repo, TagReference
+from git import Repo
 
 from semantic_release.enums import LevelBump
 from semantic_release.version.algorithm import (
     _increment_version,
-    _traverse_graph_for_commits,
     tags_and_versions,
 )
 from semantic_release.version.translator import VersionTranslator
 from semantic_release.version.version import Version
 
-from tests.fixtures.repos import repo_w_initial_commit
-
 if TYPE_CHECKING:
     from typing import Sequence
 
 
-@pytest.mark.usefixtures(repo_w_initial_commit.__name__)
-def test_traverse_graph_for_commits():
-    # Setup fake git graph
-    """
-    * merge commit 6 (start) [3636363]
-    |\
-    | * commit 5 [3535353]
-    | * commit 4 [3434343]
-    |/
-    * commit 3 [3333333]
-    * commit 2 [3232323]
-    * commit 1 [3131313]
-    * v1.0.0 [3030303]
-    """
-    repo = Repo()
-    v1_commit = Commit(repo, binsha=b"0" * 20, parents=[])
-
-    class TagReferenceOverride(TagReference):
-        commit = v1_commit  # mocking the commit property
-
-    v1_tag = TagReferenceOverride(repo, "refs/tags/v1.0.0", check_path=False)
-
-    trunk = Commit(
-        repo,
-        binsha=b"3" * 20,
-        parents=[
-            Commit(
-                repo,
-                binsha=b"2" * 20,
-                parents=[
-                    Commit(repo, binsha=b"1" * 20, parents=[v1_commit]),
-                ],
-            ),
-        ],
-    )
-    start_commit = Commit(
-        repo,
-        binsha=b"6" * 20,
-        parents=[
-            trunk,
-            Commit(
-                repo,
-                binsha=b"5" * 20,
-                parents=[
-                    Commit(repo, binsha=b"4" * 20, parents=[trunk]),
-                ],
-            ),
-        ],
-    )
-
-    commit_1 = trunk.parents[0].parents[0]
-    commit_2 = trunk.parents[0]
-    commit_3 = trunk
-    commit_4 = start_commit.parents[1].parents[0]
-    commit_5 = start_commit.parents[1]
-    commit_6 = start_commit
-
-    expected_commit_order = [
-        commit_6.hexsha,
-        commit_5.hexsha,
-        commit_4.hexsha,
-        commit_3.hexsha,
-        commit_2.hexsha,
-        commit_1.hexsha,
-    ]
-
-    # Execute
-    with mock.patch.object(
-        repo, repo.iter_commits.__name__, return_value=iter([v1_commit])
-    ):
-        actual_commit_order = [
-            commit.hexsha
-            for commit in _traverse_graph_for_commits(
-                head_commit=start_commit,
-                latest_release_tag_str=v1_tag.name,
-            )
-        ]
-
-    # Verify
-    assert expected_commit_order == actual_commit_order
-
-
 @pytest.mark.parametrize(
     "tags, sorted_tags",
     [
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from pytest_lazy_fixtures.lazy_fixture import lf as lazy_fixture
+
+from semantic_release.changelog.release_history import ReleaseHistory
+from semantic_release.commit_parser.conventional.options_monorepo import (
+    ConventionalCommitMonorepoParserOptions,
+)
+from semantic_release.commit_parser.conventional.parser import (
+    ConventionalCommitParser,
+)
+from semantic_release.commit_parser.conventional.parser_monorepo import (
+    ConventionalCommitMonorepoParser,
+)
+from semantic_release.version import monorepo
+from semantic_release.version.algorithm import next_version
+from semantic_release.version.monorepo import PackageDefinition, plan_package_releases
+from semantic_release.version.translator import VersionTranslator
+
+from tests.fixtures.repos import (
+    repo_w_no_tags_conventional_commits,
+    repo_w_trunk_only_conventional_commits,
+)
+
+if TYPE_CHECKING:
+    from tests.fixtures.git_repo import BuiltRepoResult
+
+
+PACKAGES = (
+    PackageDefinition(name="all"),
+    PackageDefinition(
+        name="docs", path_filters=("docs/**",), tag_format="docs-{version}"
+    ),
+    PackageDefinition(
+        name="scoped",
+        path_filters=("nothing/**",),
+        scope_prefix="cli-",
+        tag_format="cli-v{version}",
+    ),
+)
+
+
+@pytest.mark.parametrize(
+    "repo_result",
+    [
+        lazy_fixture(repo_w_no_tags_conventional_commits.__name__),
+        lazy_fixture(repo_w_trunk_only_conventional_commits.__name__),
+    ],
+)
+def test_plan_package_releases_matches_separate_runs(
+    repo_result: BuiltRepoResult,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repo = repo_result["repo"]
+    monkeypatch.chdir(str(repo.working_dir))
+
+    # Action
+    planned_releases = plan_package_releases(repo, PACKAGES)
+
+    assert list(planned_releases) == [package.name for package in PACKAGES]
+    for package in PACKAGES:
+        commit_parser = ConventionalCommitMonorepoParser(
+            ConventionalCommitMonorepoParserOptions(
+                path_filters=package.path_filters,
+                scope_prefix=package.scope_prefix,
+            )
+        )
+        translator = VersionTranslator(tag_format=package.tag_format)
+        expected_version = next_version(
+            repo=repo,
+            translator=translator,
+            commit_parser=commit_parser,  # type: ignore[arg-type]
+            allow_zero_version=True,
+            major_on_zero=True,
+            prerelease=False,
+        )
+        expected_history = ReleaseHistory.from_git_history(
+            repo=repo,
+            translator=translator,
+            commit_parser=commit_parser,  # type: ignore[arg-type]
+            exclude_commit_patterns=(),
+        )
+
+        planned_release = planned_releases[package.name]
+        assert planned_release.next_version == expected_version
+        assert planned_release.release_history is not None
+        assert planned_release.release_history.released == expected_history.released
+        assert planned_release.release_history.unreleased == expected_history.unreleased
+
+
+def test_plan_package_releases_parses_each_message_once(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+    monkeypatch.chdir(str(repo.working_dir))
+
+    parsed_messages = []
+    create_parsed_message_result = ConventionalCommitParser.create_parsed_message_result
+
+    def counting_create_parsed_message_result(parser, match, text):
+        parsed_messages.append((match.string, text))
+        return create_parsed_message_result(parser, match, text)
+
+    monkeypatch.setattr(
+        ConventionalCommitParser,
+        "create_parsed_message_result",
+        counting_create_parsed_message_result,
+    )
+
+    # Action
+    planned_releases = plan_package_releases(
+        repo, [PackageDefinition(name="a"), PackageDefinition(name="b")]
+    )
+
+    assert parsed_messages
+    assert len(set(parsed_messages)) == len(parsed_messages)
+    assert planned_releases["a"].next_version == planned_releases["b"].next_version
+
+
+def test_plan_package_releases_routes_commits_in_chunks(
+    repo_w_trunk_only_conventional_commits: BuiltRepoResult,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    repo = repo_w_trunk_only_conventional_commits["repo"]
+    monkeypatch.chdir(str(repo.working_dir))
+    expected_releases = plan_package_releases(repo, PACKAGES)
+
+    monkeypatch.setattr(monorepo, "_ROUTING_CHUNK_SIZE", 1)
+
+    # Action
+    planned_releases = plan_package_releases(repo, PACKAGES)
+
+    for package in PACKAGES:
+        planned_release = planned_releases[package.name]
+        expected_release = expected_releases[package.name]
+        assert planned_release.next_version == expected_release.next_version
+        assert planned_release.release_history is not None
+        assert expected_release.release_history is not None
+        assert (
+            planned_release.release_history.released
+            == expected_release.release_history.released
+        )
+
+    # Nothing of the routed commits is held by the shared message parser
+    shared_parser = planned_releases["all"].commit_parser._base_parser
+    assert not shared_parser._squashed_messages
+    assert not shared_parser._message_results
+
+
+def test_plan_package_releases_rejects_duplicate_package_names(
+    repo_w_no_tags_conventional_commits: BuiltRepoResult,
+):
+    repo = repo_w_no_tags_conventional_commits["repo"]
+
+    with pytest.raises(ValueError, match="Duplicate package names"):
+        plan_package_releases(
+            repo, [PackageDefinition(name="a"), PackageDefinition(name="a")]
+        )
+
+
+def test_package_definition_defaults():
+    package = PackageDefinition(name="pkg")
+
+    assert package.path_filters == (".",)
+    assert package.scope_prefix == ""
+    assert package.tag_format == "v{version}"
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import pytest
 
 from semantic_release.const import SEMVER_REGEX
@@ -92,3 +94,30 @@ def test_translator_converts_versions_with_default_formatting_rules(
     assert expected_tag == actual_tag
     assert expected_version_obj == (translator.from_tag(expected_tag) or "")
     assert version_string == str(translator.from_tag(actual_tag) or "")
+
+
+@pytest.mark.parametrize(
+    "tag_format, expected_glob",
+    [
+        ("v{version}", "refs/tags/v*"),
+        ("pkg-a-v{version}", "refs/tags/pkg-a-v*"),
+        ("pkg/a/v{version}", "refs/tags/pkg/a/v*"),
+        ("my.pkg-v{version}", "refs/tags/my*"),
+        ("my pkg-v{version}", "refs/tags/my*"),
+        ("pkgs?-v{version}", "refs/tags/pkg*"),
+        ("v{version}-pkg-a", "refs/tags/v*"),
+        ("{version}", None),
+        ("{version}-pkg-a", None),
+        ("(pkg-a|pkg-b)-v{version}", None),
+        ("pkg-a-v{version}|pkg-b", None),
+        ("v{version}/x", None),
+        ("my.pkg/v{version}", None),
+    ],
+)
+def test_translator_tag_ref_glob(tag_format: str, expected_glob: str | None):
+    translator = VersionTranslator(tag_format=tag_format)
+    assert expected_glob == translator.tag_ref_glob
+
+    if expected_glob is not None:
+        tag = translator.str_to_tag(A_FULL_VERSION_STRING)
+        assert f"refs/tags/{tag}".startswith(expected_glob[:-1])
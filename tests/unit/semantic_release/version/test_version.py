@@ -1,5 +1,6 @@
 import operator
 import random
+import re
 
 import pytest
 
@@ -329,3 +330,91 @@ def test_prerelease_always_less_than_full(major, minor, patch, prerelease_revisi
     full = Version(major, minor, patch)
     pre = Version(major, minor, patch, prerelease_revision=prerelease_revision)
     assert pre < full
+
+
+def test_version_sort_key_sorts_by_precedence():
+    ordered_versions = [
+        "0.0.1",
+        "0.1.0",
+        "1.0.0-alpha.1",
+        "1.0.0-alpha.2",
+        "1.0.0-alpha.beta.1",
+        "1.0.0-beta.1",
+        "1.0.0-rc.1",
+        "1.0.0-rc.10",
+        "1.0.0",
+        "1.0.1",
+        "1.10.0",
+        "10.0.0",
+    ]
+    versions = [Version.parse(v) for v in ordered_versions]
+
+    assert [
+        str(v) for v in sorted(random.sample(versions, len(versions)))
+    ] == ordered_versions
+    assert [
+        str(v)
+        for v in sorted(
+            random.sample(versions, len(versions)), key=lambda v: v.sort_key
+        )
+    ] == ordered_versions
+
+
+def test_version_parse_returns_new_instances():
+    first = Version.parse("1.2.3-rc.1+build.1")
+    first.build_metadata = "build.2"
+    first.tag_format = "pkg-v{version}"
+
+    second = Version.parse("1.2.3-rc.1+build.1")
+
+    assert first is not second
+    assert second.build_metadata == "build.1"
+    assert second.as_tag() == "v1.2.3-rc.1+build.1"
+    assert (
+        Version.parse("1.2.3-rc.1+build.1", tag_format="pkg-v{version}").as_tag()
+        == "pkg-v1.2.3-rc.1+build.1"
+    )
+
+
+def test_version_precedence_follows_changed_components():
+    version = Version.parse("1.2.3-rc.1")
+    assert version < Version.parse("1.2.3")
+
+    version.prerelease_revision = None
+    assert version == Version.parse("1.2.3")
+
+    version.major = 2
+    assert version > Version.parse("1.2.3")
+    assert version.sort_key == Version.parse("2.2.3").sort_key
+
+
+@pytest.mark.parametrize(
+    "left, right",
+    [
+        (Version(1, 2, 3), Version(1, 2, 3, prerelease_token="alpha")),
+        (Version(1, 2, 3, prerelease_revision=1), Version(1, 2, 3)),
+        (Version.parse("1.2.3-rc.1"), Version.parse("1.2.3-rc.1+build.1")),
+    ],
+)
+def test_version_equality_agrees_with_ordering(left: Version, right: Version):
+    assert (left <= right and left >= right) == (left == right)
+    assert (right <= left and right >= left) == (left == right)
+    assert (left < right or left > right) == (left != right)
+
+
+def test_version_parse_uses_the_version_regex_of_the_class():
+    class StrictVersion(Version):
+        __slots__ = ()
+        _VERSION_REGEX = re.compile(
+            r"(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)"
+            r"(?:-(?P<prerelease>rc\.\d+))?(?:\+(?P<buildmetadata>never))?"
+        )
+
+    # Memoized by the default regex first, then rejected by the subclass regex
+    assert Version.parse("1.2.3-alpha.1") == Version(
+        1, 2, 3, prerelease_token="alpha", prerelease_revision=1
+    )
+    with pytest.raises(InvalidVersion):
+        StrictVersion.parse("1.2.3-alpha.1")
+
+    assert StrictVersion.parse("1.2.3-rc.1") == Version.parse("1.2.3-rc.1")